@@ -1,6 +1,55 @@
+import argparse
+
 from game import Game
+from game.utils.replay import Replay
 
 
 if __name__ == "__main__":
-    game = Game()
-    game.start_cinematic()
+    parser = argparse.ArgumentParser(description="Run, Chicken, Run!")
+    parser.add_argument(
+        "--replay",
+        metavar="FICHIER",
+        help="rejoue une partie enregistrée (voir RECORD_REPLAYS)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="rejoue sans affichage, aussi vite que possible",
+    )
+    parser.add_argument(
+        "--seek",
+        type=float,
+        default=0,
+        metavar="SECONDES",
+        help="avance le replay sans affichage jusqu'à ce moment",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1,
+        metavar="FACTEUR",
+        help="vitesse de lecture du replay (2 : deux fois plus vite)",
+    )
+    args = parser.parse_args()
+
+    if args.replay is None:
+        game = Game(cache_path="cache")
+        game.run()
+    else:
+        game = Game(headless=args.fast, cache_path="cache")
+        game.game_clock.scale = args.speed
+        try:
+            desync = game.play_replay(
+                Replay.load(args.replay),
+                realtime=not args.fast,
+                seek=int(args.seek * game.settings.TICK_RATE),
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        finally:
+            game.stats.close()
+            game.assets.shutdown()
+        if desync is None:
+            print(f"Replay terminé ({game.tick} pas de simulation)")
+        else:
+            print(f"Replay désynchronisé au pas {desync}")
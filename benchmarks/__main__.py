@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import argparse
+import tempfile
+
+# Pilotes SDL factices avant tout import du jeu
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from .suite import compare, run_suite  # noqa: E402
+
+
+BASELINE_PATH = "benchmarks/baseline.json"
+RESULTS_PATH = "benchmarks/results.json"
+
+
+def main() -> int:
+    """
+    Exécute les mesures et les compare à la référence
+
+    :return: Le code de sortie (1 si un cas a ralenti au-delà du seuil)
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Mesure les performances des chemins critiques du jeu.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=RESULTS_PATH,
+        help=f"fichier JSON des résultats (défaut : {RESULTS_PATH})",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        default=BASELINE_PATH,
+        help=f"fichier JSON de référence (défaut : {BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="ralentissement toléré avant échec (défaut : 0.2, soit 20 %%)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="nombre de répétitions de chaque cas (défaut : 5)",
+    )
+    parser.add_argument(
+        "-k",
+        "--only",
+        help="ne mesure que les cas dont le nom contient ce texte",
+    )
+    parser.add_argument(
+        "-p",
+        "--replay",
+        action="append",
+        default=[],
+        metavar="FICHIER",
+        help="ajoute un cas qui rejoue cette partie enregistrée",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="enregistre les résultats comme nouvelle référence",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = run_suite(
+            os.path.join(directory, "stats.json"),
+            args.repeat,
+            args.only,
+            replays=args.replay,
+        )
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nRésultats enregistrés dans {args.output}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Pas de référence ({args.baseline}) : utilisez --save")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    print(f"\nComparaison avec {args.baseline} (seuil {args.threshold:.0%})")
+    regressions = 0
+    for comparison in compare(results, baseline, args.threshold):
+        regressions += comparison.regressed
+        print(
+            f"{comparison.name:<32}{comparison.baseline:10.3f} ms"
+            f"{comparison.current:10.3f} ms  x{comparison.ratio:.2f}"
+            + ("  RÉGRESSION" if comparison.regressed else "")
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+import os
+import sys
+import random
+import platform
+import statistics
+import pygame
+import numpy as np
+
+from game import Game
+from game.enemies.enemy_spawner import EnemySpawner
+from game.enemies.knight import Knight
+from game.enemies.pirate import Pirate
+from game.enemies.swarm import EnemySwarm
+from game.enums.direction import Direction
+from game.utils.functions import (
+    generate_fractal_noise_2d,
+    generate_perlin_noise_2d,
+)
+from game.utils.replay import Replay
+from game.utils.rng import RandomStreams
+from datetime import datetime
+from time import perf_counter_ns
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+
+# Graine commune à tous les cas : deux exécutions mesurent le même travail
+SEED = 2025
+ENEMY_COUNTS = (10, 100, 1_000, 10_000)
+PERLIN_SHAPES = ((36, 40), (128, 128), (512, 512), (1024, 1024))
+
+
+class Case(NamedTuple):
+    """
+    Cas de mesure
+
+    `prepare` est appelé une fois (hors mesure) et renvoie la fonction
+    à chronométrer, appelée `number` fois par répétition.
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], object]]
+    number: int = 1
+
+
+class Comparison(NamedTuple):
+    """
+    Comparaison d'un cas avec la référence
+    """
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+
+
+class BenchmarkSuite:
+    """
+    Suite de mesures des chemins critiques du jeu
+
+    Le jeu tourne sans fenêtre ni son (pilotes SDL factices) : les mesures
+    ne dépendent ni de l'écran ni de la carte son, seulement du code.
+    """
+
+    def __init__(self, stats_path: str, replays: Sequence[str] = ()) -> None:
+        """
+        Constructeur de la classe
+
+        :param stats_path: Le fichier de statistiques de la partie mesurée
+                           (temporaire, pour ne pas toucher au vrai)
+        :type stats_path: str
+        :param replays: Des parties enregistrées, rejouées sans affichage
+        :type replays: Sequence[str]
+        """
+        self.replays = list(replays)
+        self.game = Game(headless=True, stats_path=stats_path, cache_path=None)
+        # Partie commencée comme depuis le menu (minuteurs de l'item, ...)
+        self.game.start_round()
+
+    def close(self) -> None:
+        """
+        Ferme la partie mesurée
+        """
+        self.game.stats.close()
+        self.game.assets.shutdown()
+        pygame.quit()
+
+    def cases(self) -> Iterator[Case]:
+        """
+        Renvoie les cas de mesure, du plus élémentaire au plus complet
+
+        :return: Les cas de mesure
+        :rtype: Iterator[Case]
+        """
+        for shape in PERLIN_SHAPES:
+            yield Case(
+                f"perlin.{shape[0]}x{shape[1]}",
+                lambda shape=shape: self._perlin(shape),
+                number=max(1, 100_000 // (shape[0] * shape[1])),
+            )
+
+        yield Case(
+            "fractal.2048x2048.4oct",
+            lambda: lambda: generate_fractal_noise_2d(
+                (2048, 2048), (8, 8), octaves=4
+            ),
+        )
+
+        yield Case("map.generate", lambda: self.game.map.generate, 20)
+        yield Case("map.draw", self._map_draw, 5)
+
+        for engine in ("sprites", "swarm"):
+            for count in ENEMY_COUNTS:
+                yield Case(
+                    f"spawner.update.{engine}.{count}",
+                    lambda e=engine, c=count: self._spawner_update(e, c),
+                    number=max(1, 10_000 // count),
+                )
+            yield Case(
+                f"collide.{engine}.1000",
+                lambda e=engine: self._collide(e, 1_000),
+                number=100,
+            )
+
+        yield Case("frame.update", self._frame_update, 30)
+        yield Case("frame.draw", self._frame_draw, 30)
+        yield Case("frame.draw.full", self._frame_draw_full, 10)
+
+        for path in self.replays:
+            name = os.path.splitext(os.path.basename(path))[0]
+            yield Case(f"replay.{name}", lambda path=path: self._replay(path))
+
+    # =====================================================================
+    # Préparation des cas
+    # =====================================================================
+    def _perlin(self, shape: tuple) -> Callable[[], object]:
+        return lambda: generate_perlin_noise_2d(shape, (4, 4))
+
+    def _map_draw(self) -> Callable[[], object]:
+        return lambda: self.game.map.draw(self.game.background_layer)
+
+    def _populate(self, engine: str, count: int) -> None:
+        """
+        Remplace les ennemis en jeu par `count` ennemis immobiles placés
+        au hasard : leur nombre ne change pas pendant la mesure
+
+        :param engine: Le moteur d'ennemis ("sprites" ou "swarm")
+        :type engine: str
+        :param count: Le nombre d'ennemis
+        :type count: int
+        """
+        self.game.rng.reseed(dict.fromkeys(RandomStreams.NAMES, SEED))
+
+        settings = self.game.settings
+        previous_engine = settings.ENEMY_ENGINE
+        settings.ENEMY_ENGINE = engine
+        try:
+            spawner = EnemySpawner(self.game)
+        finally:
+            settings.ENEMY_ENGINE = previous_engine
+        # L'ancien générateur rend ses ennemis, dont les minuteurs sont
+        # annulés : les cas suivants ne mesurent pas ses restes
+        previous = self.game.enemy_spawner
+        previous.reset()
+        previous.wave_timer.cancel()
+        # Aucune nouvelle vague pendant la mesure
+        spawner.wave_timer.cancel()
+        self.game.enemy_spawner = spawner
+
+        margin = settings.TILE_SIZE * 2
+        directions = list(Direction)
+        for _ in range(count):
+            x = random.randint(margin, settings.WINDOW_WIDTH - margin)
+            y = random.randint(margin, settings.WINDOW_HEIGHT - margin)
+            direction = random.choice(directions)
+            archetype = random.choice((EnemySwarm.KNIGHT, EnemySwarm.PIRATE))
+
+            if spawner.swarm is not None:
+                spawner.swarm.spawn(x, y, 0, direction, archetype)
+                continue
+
+            enemy = spawner.pool.acquire(
+                Knight if archetype == EnemySwarm.KNIGHT else Pirate,
+                x,
+                y,
+                0,
+                direction,
+            )
+            spawner.enemies.add(enemy)
+            spawner.grid.insert(enemy, enemy.rect)
+
+    def _replay(self, path: str) -> Callable[[], object]:
+        replay = Replay.load(path)
+        return lambda: self.game.play_replay(replay, realtime=False)
+
+    def _spawner_update(self, engine: str, count: int) -> Callable[[], object]:
+        self._populate(engine, count)
+        return self.game.enemy_spawner.update
+
+    def _collide(self, engine: str, count: int) -> Callable[[], object]:
+        self._populate(engine, count)
+        rect = self.game.player.rect.copy()
+        rect.center = (
+            self.game.settings.WINDOW_WIDTH // 2,
+            self.game.settings.WINDOW_HEIGHT // 2,
+        )
+        return lambda: self.game.enemy_spawner.collide(rect)
+
+    def _frame_update(self) -> Callable[[], object]:
+        self._populate("sprites", 100)
+        player = self.game.player
+        player.position.update(
+            self.game.settings.WINDOW_WIDTH // 2,
+            self.game.settings.WINDOW_HEIGHT // 2,
+        )
+
+        def run() -> None:
+            # La partie ne doit pas se terminer pendant la mesure
+            player.health = player.MAX_HEALTH
+            self.game.update()
+
+        return run
+
+    def _frame_draw(self) -> Callable[[], object]:
+        self._populate("sprites", 100)
+        self.game.player.isInvincible = False
+        self.game.renderer.invalidate()
+        self.game.optimized_draw()
+        return self.game.optimized_draw
+
+    def _frame_draw_full(self) -> Callable[[], object]:
+        draw = self._frame_draw()
+
+        def run() -> None:
+            self.game.renderer.invalidate()
+            draw()
+
+        return run
+
+
+def measure(case: Case, repeat: int) -> Dict[str, float]:
+    """
+    Chronomètre un cas de mesure
+
+    :param case: Le cas à mesurer
+    :type case: Case
+    :param repeat: Le nombre de répétitions
+    :type repeat: int
+    :return: Les durées d'un appel (en millisecondes)
+    :rtype: Dict[str, float]
+    """
+    random.seed(SEED)
+    np.random.seed(SEED)
+    run = case.prepare()
+    run()  # Échauffement (caches, allocations)
+
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(case.number):
+            run()
+        timings.append((perf_counter_ns() - start) / case.number / 1e6)
+
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "mean_ms": statistics.fmean(timings),
+        "repeat": repeat,
+        "number": case.number,
+    }
+
+
+def run_suite(
+    stats_path: str,
+    repeat: int = 5,
+    only: Optional[str] = None,
+    log: Callable[[str], object] = print,
+    replays: Sequence[str] = (),
+) -> dict:
+    """
+    Exécute la suite de mesures
+
+    :param stats_path: Le fichier de statistiques de la partie mesurée
+    :type stats_path: str
+    :param repeat: Le nombre de répétitions de chaque cas
+    :type repeat: int
+    :param only: Ne mesure que les cas dont le nom contient ce texte
+    :type only: Optional[str]
+    :param log: La fonction d'affichage de la progression
+    :type log: Callable[[str], object]
+    :param replays: Des parties enregistrées, rejouées sans affichage
+    :type replays: Sequence[str]
+    :return: Les résultats, prêts à être enregistrés en JSON
+    :rtype: dict
+    """
+    suite = BenchmarkSuite(stats_path, replays)
+    results = {}
+    try:
+        for case in suite.cases():
+            if only is not None and only not in case.name:
+                continue
+            results[case.name] = measure(case, repeat)
+            log(f"{case.name:<32}{results[case.name]['median_ms']:10.3f} ms")
+    finally:
+        suite.close()
+
+    return {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "argv": sys.argv[1:],
+        },
+        "results": results,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float
+) -> List[Comparison]:
+    """
+    Compare des résultats à une référence
+
+    :param results: Les résultats de `run_suite`
+    :type results: dict
+    :param baseline: Les résultats de référence
+    :type baseline: dict
+    :param threshold: Le ralentissement toléré (0.1 pour 10 %)
+    :type threshold: float
+    :return: Les comparaisons des cas présents des deux côtés
+    :rtype: List[Comparison]
+    """
+    comparisons = []
+    for name, current in results["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        ratio = current["median_ms"] / reference["median_ms"]
+        comparisons.append(
+            Comparison(
+                name,
+                reference["median_ms"],
+                current["median_ms"],
+                ratio,
+                ratio > 1 + threshold,
+            )
+        )
+    return comparisons
@@ -82,13 +82,20 @@ class Controller:
                 if event.key == pygame.K_SPACE:
                     self.game.movement.dash()
 
+                # Traite la touche F3 (affichage du profileur)
+                if event.key == pygame.K_F3:
+                    self.game.profiler.toggle()
+                    self.game.renderer.invalidate()
+
+                # Traite la touche F4 (export des mesures du profileur)
+                if event.key == pygame.K_F4 and self.game.profiler.count:
+                    self.game.profiler.dump()
+
             # Traite la touche P
             if event.key == pygame.K_p:
-                if self.game.paused:
-                    self.game.footsteps.play(-1)
-                    self.game.paused = False
+                if self.game.state == GameState.PAUSED:
                     self.game.state = GameState.PLAYING
-                else:
+                elif self.game.state == GameState.PLAYING:
                     self.game.state = GameState.PAUSED
 
             # Traite la touche ECHAP
@@ -1,6 +1,5 @@
 import pygame
 
-from ..enums.game import GameState
 from typing import TYPE_CHECKING
 
 
@@ -18,6 +17,9 @@ class Interface:
     HEALTH_LOW_COLOR = (254, 0, 2)
     STAMINA_COLOR = (109, 117, 238)
     STAMINA_LOW_COLOR = (63, 72, 204)
+    TEXT_COLOR = (255, 255, 255)
+    LOADING_BAR_SIZE = (300, 6)
+    FONT_SIZE = 50
 
     def __init__(self, game: "Game") -> None:
         """
@@ -31,17 +33,31 @@ class Interface:
         self.player_health = None
         self.player_stamina = None
 
+        # Images décodées en arrière-plan (voir `Game.PRELOAD`)
         self.heart_image = pygame.transform.scale(
-            pygame.image.load("assets/heart.png").convert_alpha(), (20, 20)
+            self.game.assets.image("assets/heart.png").convert_alpha(),
+            (20, 20),
         )
         self.potion_image = pygame.transform.scale(
-            pygame.image.load("assets/potion.png").convert_alpha(), (20, 20)
+            self.game.assets.image("assets/potion.png").convert_alpha(),
+            (20, 20),
         )
-        self.font = pygame.font.Font(None, 50)
+        self.game.assets.release("assets/heart.png")
+        self.game.assets.release("assets/potion.png")
 
-    def draw(self) -> None:
+    def reset(self) -> None:
+        """
+        Oublie les valeurs affichées (l'interface sera redessinée)
+        """
+        self.player_health = None
+        self.player_stamina = None
+
+    def draw(self) -> pygame.Rect:
         """
         Affichage de l'interface de santé et d'endurance
+
+        :return: La zone de l'écran occupée par l'interface
+        :rtype: pygame.Rect
         """
         # Barre de santé
         health_percentage = self.game.player.health / 100
@@ -53,7 +69,7 @@ class Interface:
         )
 
         # Affichage de la barre de santé
-        pygame.draw.rect(
+        health_rect = pygame.draw.rect(
             self.game.screen,
             self.HEALTH_LOW_COLOR,
             (*health_bar_pos, *self.HEALTH_BAR_SIZE),
@@ -84,7 +100,7 @@ class Interface:
             - (self.heart_image.get_height() // 2)
             + (self.HEALTH_BAR_SIZE[1] // 2),
         )
-        self.game.screen.blit(self.heart_image, heart_icon_pos)
+        heart_rect = self.game.screen.blit(self.heart_image, heart_icon_pos)
 
         # Barre d'endurance
         stamina_percentage = self.game.player.stamina / 100
@@ -96,7 +112,7 @@ class Interface:
         )
 
         # Affichage de la barre d'endurance
-        pygame.draw.rect(
+        stamina_rect = pygame.draw.rect(
             self.game.screen,
             self.STAMINA_LOW_COLOR,
             (*stamina_bar_pos, *self.HEALTH_BAR_SIZE),
@@ -127,7 +143,9 @@ class Interface:
             - (self.potion_image.get_height() // 2)
             + (self.HEALTH_BAR_SIZE[1] // 2),
         )
-        self.game.screen.blit(self.potion_image, potion_icon_pos)
+        potion_rect = self.game.screen.blit(self.potion_image, potion_icon_pos)
+
+        return health_rect.unionall([heart_rect, stamina_rect, potion_rect])
 
     def update(self) -> None:
         """
@@ -146,7 +164,9 @@ class Interface:
         """
         Affichage de l'écran de pause
         """
-        text = self.font.render("Paused", True, (255, 255, 255))
+        text = self.game.text_cache.render(
+            "Paused", self.FONT_SIZE, self.TEXT_COLOR
+        )
         text_x = self.game.settings.WINDOW_WIDTH // 2 - text.get_width() // 2
         text_y = self.game.settings.WINDOW_HEIGHT // 2 - text.get_height() // 2
 
@@ -157,12 +177,14 @@ class Interface:
         """
         Affichage de l'écran de fin de partie
         """
-        text = self.font.render("Game Over", True, (255, 255, 255))
+        text = self.game.text_cache.render(
+            "Game Over", self.FONT_SIZE, self.TEXT_COLOR
+        )
         text_x = self.game.settings.WINDOW_WIDTH // 2 - text.get_width() // 2
         text_y = self.game.settings.WINDOW_HEIGHT // 2 - text.get_height() // 2
 
-        elapsed_time_text = self.font.render(
-            f"Time: {seconds} seconds", True, (255, 255, 255)
+        elapsed_time_text = self.game.text_cache.render(
+            f"Time: {seconds} seconds", self.FONT_SIZE, self.TEXT_COLOR
         )
         elapsed_time_x = (
             self.game.settings.WINDOW_WIDTH // 2
@@ -176,41 +198,38 @@ class Interface:
         )
         pygame.display.flip()
 
-        pygame.time.wait(5000)
-        self.game.state = GameState.MENU
-        self.game.reset()
-        self.game.main_menu()
-
-    def cinematic(self):
+    def loading(self, progress: float) -> pygame.Rect:
         """
-        Affichage de la cinématique de début de partie
+        Affichage de la barre de chargement des assets
+
+        :param progress: L'avancement du chargement, entre 0 et 1
+        :type progress: float
+        :return: La zone de l'écran occupée par la barre
+        :rtype: pygame.Rect
         """
-        img = pygame.image.load("assets/images/cinematic.png").convert_alpha()
-        scale = self.game.settings.WINDOW_HEIGHT / img.get_height()
-        new_size = (
-            int(img.get_width() * scale),
-            int(img.get_height() * scale),
+        bar_pos = (
+            self.game.settings.WINDOW_WIDTH // 2
+            - self.LOADING_BAR_SIZE[0] // 2,
+            self.game.settings.WINDOW_HEIGHT - 30,
         )
-        img = pygame.transform.scale(img, new_size)
 
-        self.game.screen.blit(
-            img,
-            (self.game.settings.WINDOW_WIDTH // 2 - img.get_width() // 2, 0),
+        bar_rect = pygame.draw.rect(
+            self.game.screen,
+            self.STAMINA_LOW_COLOR,
+            (*bar_pos, *self.LOADING_BAR_SIZE),
+            0,
+            4,
+        )
+        pygame.draw.rect(
+            self.game.screen,
+            self.HEALTH_COLOR,
+            (
+                *bar_pos,
+                int(self.LOADING_BAR_SIZE[0] * progress),
+                self.LOADING_BAR_SIZE[1],
+            ),
+            0,
+            4,
         )
 
-        pygame.display.flip()
-
-        # Allow quitting the window with event
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                    pygame.quit()
-                    exit()
-                if event.type == pygame.KEYDOWN:
-                    running = False
-
-        self.game.state = GameState.MENU
-        self.game.reset()
-        self.game.main_menu()
+        return bar_rect
@@ -1,8 +1,8 @@
+import math
 import pygame
-import random
 
-from time import time
-from typing import TYPE_CHECKING
+from ..dataclasses.events import ItemPicked
+from typing import Optional, Tuple, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -14,6 +14,11 @@ class Item:
     gère les Items qui apparaissent aléatoirement
     """
 
+    # Probabilité d'apparition de l'item à chaque pas de simulation
+    SPAWN_CHANCE = 0.002
+    # Durée de l'effet de l'item (en secondes)
+    EFFECT_DURATION = 5
+
     def __init__(self, game: "Game"):
         """
         Constructeur de la classe
@@ -24,49 +29,96 @@ class Item:
         self.game = game
 
         self.item_image = pygame.transform.scale(
-            pygame.image.load("assets/chalencon.png"),
+            self.game.assets.image("assets/chalencon.png"),
             (self.game.settings.ITEM_SIZE, self.game.settings.ITEM_SIZE),
         )
+        self.game.assets.release("assets/chalencon.png")
+        self.rect = self.item_image.get_rect()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Retire l'item et son effet (l'image chargée est conservée)
+        """
         self.item_spawn = False
         self.item_effect = False
-        self.rect = self.item_image.get_rect()
+        self.rect.topleft = (0, 0)
 
-        self.timestamp = time()
+        self.effect_timer = None
+        self.spawn_timer = None
+
+    def schedule_spawn(self) -> None:
+        """
+        Programme la prochaine apparition de l'item
+        (au début de la partie, une fois les générateurs initialisés)
+
+        Le délai suit une loi géométrique de paramètre `SPAWN_CHANCE` :
+        l'item apparaît en moyenne aussi souvent qu'avec un tirage à
+        chaque pas de simulation, mais un seul nombre est tiré.
+        """
+        chance = self.game.rng.item.random()
+        delay = math.log(1.0 - chance) / math.log(1.0 - self.SPAWN_CHANCE)
+        if self.spawn_timer is not None:
+            self.spawn_timer.cancel()
+        self.spawn_timer = self.game.timers.schedule(
+            int(delay) + 1, self.spawn_item
+        )
 
     def spawn_item(self):
         """
         Fait apparaître l'item sur la carte
         """
-        # Position aléatoire sur la carte
-        self.rect.x = random.randint(
+        # Position aléatoire dans la partie visible de la carte
+        camera = self.game.camera
+        self.rect.x = camera.x + self.game.rng.item.randint(
             0, self.game.settings.WINDOW_WIDTH - self.rect.width
         )
-        self.rect.y = random.randint(
+        self.rect.y = camera.y + self.game.rng.item.randint(
             0, self.game.settings.WINDOW_HEIGHT - self.rect.height
         )
         self.item_spawn = True
 
-    def draw(self):
+    def update(self) -> None:
         """
-        Dessine l'item sur l'écran si il est apparu
+        Vérifie si le joueur ramasse l'item
+        (appelé à chaque pas de simulation)
         """
-        if not self.item_spawn:
-            # Effectue un test aléatoire avec une faible probabilité
-            if random.random() < 0.002:  # 1% de chance que l'item apparaisse
-                self.spawn_item()
-
         self.check_item()
+
+    def draw(self, offset: Tuple[int, int] = (0, 0)) -> Optional[pygame.Rect]:
+        """
+        Dessine l'item sur l'écran si il est apparu
+
+        :param offset: La position de la caméra dans le monde
+        :type offset: Tuple[int, int]
+        :return: La zone de l'écran modifiée, ou None
+        :rtype: Optional[pygame.Rect]
+        """
         if self.item_spawn:
-            self.game.screen.blit(self.item_image, self.rect)
+            return self.game.screen.blit(
+                self.item_image, self.rect.move(-offset[0], -offset[1])
+            )
+        return None
 
     def check_item(self):
-        if self.rect.colliderect(self.game.player.rect) and self.item_spawn:
-            self.timestamp = time() + 5
+        if self.item_spawn and self.rect.colliderect(self.game.player.rect):
             self.item_spawn = False
             self.item_effect = True
-            self.game.player.take_song.set_volume(0.3)
-            self.game.player.take_song.play()
+            self.game.event_bus.emit(ItemPicked())
             self.game.player.onFire = True
-        elif self.timestamp < time():
-            self.item_effect = False
-            self.game.player.onFire = False
+
+            # Un nouvel item ramassé prolonge l'effet
+            if self.effect_timer is not None:
+                self.effect_timer.cancel()
+            self.effect_timer = self.game.timers.after(
+                self.EFFECT_DURATION, self.end_effect
+            )
+            self.schedule_spawn()
+
+    def end_effect(self) -> None:
+        """
+        Termine l'effet de l'item
+        """
+        self.item_effect = False
+        self.game.player.onFire = False
+        self.effect_timer = None
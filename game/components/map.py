@@ -1,10 +1,12 @@
+import zlib
 import random
 import pygame
 import numpy as np
 
 from ..enums.tiles import Tiles
 from ..utils.functions import generate_perlin_noise_2d
-from typing import TYPE_CHECKING
+from ..utils.sprites import sprite_cache
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -14,8 +16,28 @@ if TYPE_CHECKING:
 class Map:
     """
     Classe pour gérer la carte du jeu
+
+    La carte est stockée sous la forme d'une grille `uint8` d'identifiants
+    de tuiles, qui indexent la palette `PALETTE`. Chaque carte est tirée
+    d'une graine parmi `SEEDS` : les grilles et les fonds dessinés sont
+    gardés dans le cache sur disque du jeu, une graine déjà vue ne
+    demande ni bruit ni blits.
     """
 
+    # Nombre de cartes différentes
+    SEEDS = 1001
+    # À incrémenter quand les textures des tuiles changent (invalide le
+    # cache des cartes)
+    TILESET_VERSION = 1
+
+    # Types de tuiles, dans l'ordre des identifiants de la grille
+    PALETTE = (Tiles.GRASS, Tiles.GRASS_MEDIUM, Tiles.GRASS_LARGE)
+    # Seuils du bruit séparant les types de tuiles de la palette
+    THRESHOLDS = (-0.15, 0)
+
+    # Propriétés des tuiles, indexées par identifiant
+    WALKABLE = np.array([tile.value["walkable"] for tile in PALETTE])
+
     def __init__(self, game: "Game") -> None:
         """
         Constructeur de la classe
@@ -25,73 +47,242 @@ class Map:
         """
         self.game = game
 
+        # Textures unies des tuiles sans image, par (tuile, taille)
+        self._colors: Dict[Tuple[Tiles, Tuple[int, int]], pygame.Surface] = {}
+        # Carte de la prochaine partie, générée à l'avance
+        self.next_seed = 0
+        self.next_tiles: Optional[np.ndarray] = None
+
         self.generate()
 
-    def generate(self) -> None:
+    def generate(self, seed: Optional[int] = None) -> None:
         """
         Fonction pour générer une carte aléatoire
+        (ou utiliser celle préparée par `prepare_next`)
+
+        :param seed: La graine de la carte (pour rejouer une partie)
+        :type seed: Optional[int]
         """
-        np.random.seed(random.randint(0, 1000))
-        noise = generate_perlin_noise_2d(
-            (
-                self.game.settings.WINDOW_HEIGHT
-                // self.game.settings.TILE_SIZE,
-                self.game.settings.WINDOW_WIDTH
-                // self.game.settings.TILE_SIZE,
-            ),
-            (2, 2),
+        if seed is not None:
+            self.seed = seed
+            self.tiles = self._load_tiles(seed)
+        elif self.next_tiles is not None:
+            self.seed, self.tiles = self.next_seed, self.next_tiles
+            self.next_tiles = None
+        else:
+            self.seed = random.randrange(self.SEEDS)
+            self.tiles = self._load_tiles(self.seed)
+
+    def prepare_next(self) -> np.ndarray:
+        """
+        Génère à l'avance la carte du prochain appel à `generate`
+
+        :return: La grille d'identifiants de la prochaine carte
+        :rtype: numpy.ndarray
+        """
+        if self.next_tiles is None:
+            self.next_seed = random.randrange(self.SEEDS)
+            self.next_tiles = self._load_tiles(self.next_seed)
+        return self.next_tiles
+
+    def _shape(self) -> Tuple[int, int]:
+        """
+        Renvoie la taille de la grille
+
+        :return: Le nombre de lignes et de colonnes de tuiles
+        :rtype: Tuple[int, int]
+        """
+        return (
+            self.game.settings.WINDOW_HEIGHT // self.game.settings.TILE_SIZE,
+            self.game.settings.WINDOW_WIDTH // self.game.settings.TILE_SIZE,
         )
 
-        self.map = []
-        for y in range(noise.shape[0]):
-            row = []
-            for x in range(noise.shape[1]):
-                value = noise[y, x]
-                if value < -0.15:
-                    row.append(Tiles.GRASS)
-                elif value < 0:
-                    row.append(Tiles.GRASS_MEDIUM)
-                else:
-                    row.append(Tiles.GRASS_LARGE)
-            self.map.append(row)
+    def _cache_key(self, seed: int) -> str:
+        """
+        Renvoie le nom d'une carte dans le cache : la graine, la taille de
+        la grille, celle des tuiles et la version du jeu de tuiles
+
+        :param seed: La graine de la carte
+        :type seed: int
+        :return: Le nom de la carte
+        :rtype: str
+        """
+        rows, columns = self._shape()
+        tileset = zlib.crc32(
+            repr(
+                (
+                    self.TILESET_VERSION,
+                    [tile.value for tile in self.PALETTE],
+                    self.THRESHOLDS,
+                )
+            ).encode()
+        )
+        return (
+            f"{seed}-{rows}x{columns}-{self.game.settings.TILE_SIZE}"
+            f"-{tileset:08x}"
+        )
+
+    def _load_tiles(self, seed: int) -> np.ndarray:
+        """
+        Renvoie la grille d'une graine, relue du cache si possible
+
+        :param seed: La graine de la carte
+        :type seed: int
+        :return: La grille d'identifiants (en lecture seule si elle vient
+                 du cache)
+        :rtype: numpy.ndarray
+        """
+        cache = self.game.map_cache
+        if cache is None:
+            return self._random_tiles(seed)
+
+        name = "tiles-" + self._cache_key(seed)
+        tiles = cache.load(name, self._shape(), np.uint8)
+        if tiles is None:
+            tiles = self._random_tiles(seed)
+            cache.store(name, tiles)
+        return tiles
+
+    def _random_tiles(self, seed: int) -> np.ndarray:
+        """
+        Génère la grille d'identifiants de tuiles d'une graine
+
+        :param seed: La graine de la carte
+        :type seed: int
+        :return: La grille d'identifiants (indices de `PALETTE`)
+        :rtype: numpy.ndarray
+        """
+        np.random.seed(seed)
+        noise = generate_perlin_noise_2d(self._shape(), (2, 2))
+
+        return self.classify(noise)
+
+    @classmethod
+    def classify(cls, noise: np.ndarray) -> np.ndarray:
+        """
+        Convertit un bruit en grille d'identifiants de tuiles
+
+        :param noise: Le bruit à classer
+        :type noise: numpy.ndarray
+        :return: La grille d'identifiants (indices de `PALETTE`)
+        :rtype: numpy.ndarray
+        """
+        return np.digitize(noise, cls.THRESHOLDS).astype(np.uint8)
+
+    def tile_at(self, x: int, y: int) -> Tiles:
+        """
+        Renvoie le type de la tuile à une position de la grille
+
+        :param x: La colonne de la tuile
+        :type x: int
+        :param y: La ligne de la tuile
+        :type y: int
+        :return: Le type de la tuile
+        :rtype: Tiles
+        """
+        return self.PALETTE[self.tiles[y, x]]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """
+        Vérifie si la tuile à une position de la grille est praticable
+
+        :param x: La colonne de la tuile
+        :type x: int
+        :param y: La ligne de la tuile
+        :type y: int
+        :return: True si la tuile est praticable, False sinon
+        :rtype: bool
+        """
+        return bool(self.WALKABLE[self.tiles[y, x]])
+
+    def _textures(self) -> List[pygame.Surface]:
+        """
+        Renvoie la texture de chaque type de tuile, décodée et redimensionnée
+        une seule fois grâce au cache de sprites
 
-    def draw(self, surface: pygame.Surface) -> None:
+        :return: La liste des textures, indexée par identifiant
+        :rtype: List[pygame.Surface]
         """
-        Fonction pour dessiner la carte du jeu
+        size = (self.game.settings.TILE_SIZE, self.game.settings.TILE_SIZE)
+
+        textures = []
+        for tile in self.PALETTE:
+            if "image" in tile.value:
+                texture = sprite_cache.image(
+                    tile.value["image"], size, alpha=False
+                )
+            else:
+                texture = self._colors.get((tile, size))
+                if texture is None:
+                    texture = pygame.Surface(size).convert()
+                    texture.fill(tile.value["color"])
+                    self._colors[(tile, size)] = texture
+            textures.append(texture)
+        return textures
+
+    def draw(
+        self, surface: pygame.Surface, tiles: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Fonction pour dessiner la carte du jeu en une seule passe de blits
 
         :param screen: L'écran du jeu
         :type screen: pygame.Surface
+        :param tiles: La grille à dessiner (la carte courante si None)
+        :type tiles: Optional[numpy.ndarray]
+        """
+        if tiles is None:
+            tiles = self.tiles
+        textures = self._textures()
+        tile_size = self.game.settings.TILE_SIZE
+
+        rows, columns = np.indices(tiles.shape)
+        surface.blits(
+            zip(
+                map(textures.__getitem__, tiles.ravel().tolist()),
+                zip(
+                    (columns.ravel() * tile_size).tolist(),
+                    (rows.ravel() * tile_size).tolist(),
+                ),
+            ),
+            doreturn=False,
+        )
+
+    def bake(self, surface: pygame.Surface, upcoming: bool = False) -> None:
+        """
+        Dessine le fond d'une carte, ou le recopie depuis le cache si
+        cette carte a déjà été dessinée
+
+        :param surface: La surface du fond (au format de l'écran)
+        :type surface: pygame.Surface
+        :param upcoming: Si c'est la carte préparée par `prepare_next`
+                         qui est dessinée, et non la carte courante
+        :type upcoming: bool
         """
-        for y, row in enumerate(self.map):
-            for x, tile in enumerate(row):
-                if "image" in tile.value.keys():
-                    image = pygame.image.load(
-                        tile.value["image"]
-                    ).convert_alpha()
-                    image = pygame.transform.scale(
-                        image,
-                        (
-                            self.game.settings.TILE_SIZE,
-                            self.game.settings.TILE_SIZE,
-                        ),
-                    )
-                    surface.blit(
-                        image,
-                        (
-                            x * self.game.settings.TILE_SIZE,
-                            y * self.game.settings.TILE_SIZE,
-                        ),
-                    )
-                else:
-                    color = tile.value["color"]
-
-                    pygame.draw.rect(
-                        surface,
-                        color,
-                        (
-                            x * self.game.settings.TILE_SIZE,
-                            y * self.game.settings.TILE_SIZE,
-                            self.game.settings.TILE_SIZE,
-                            self.game.settings.TILE_SIZE,
-                        ),
-                    )
+        seed, tiles = (
+            (self.next_seed, self.next_tiles)
+            if upcoming
+            else (self.seed, self.tiles)
+        )
+        cache = self.game.map_cache
+        if cache is None or surface.get_bytesize() != 4:
+            surface.fill((0, 0, 0))
+            self.draw(surface, tiles)
+            return
+
+        # Les pixels dépendent du format de la surface
+        layout = zlib.crc32(repr(surface.get_masks()).encode())
+        name = f"background-{self._cache_key(seed)}-{layout:08x}"
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        cached = cache.load(name, pixels.shape, pixels.dtype)
+        if cached is not None:
+            pixels[...] = cached
+            del cached, pixels
+            return
+
+        # La surface est verrouillée tant que ses pixels sont référencés
+        del pixels
+        surface.fill((0, 0, 0))
+        self.draw(surface, tiles)
+        cache.store(name, pygame.surfarray.pixels2d(surface))
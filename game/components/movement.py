@@ -1,5 +1,6 @@
 import pygame
 
+from ..enums.action import Action
 from ..enums.keyboard import KeyboardType
 from ..enums.direction import Direction
 from typing import TYPE_CHECKING, Literal
@@ -47,6 +48,12 @@ class Movement:
             pygame.K_s: Direction.DOWN,
         }
 
+    def reset(self) -> None:
+        """
+        Remet la direction de début de partie
+        """
+        self.direction = Direction.DOWN
+
     def handle(
         self,
         key: Literal[
@@ -72,21 +79,41 @@ class Movement:
                                  "pygame.K_w"
                               ]
         """
+        if self.game.replay is not None:
+            # Pendant un replay, les actions viennent de l'enregistrement
+            return
+
         # Vérifie les touches fléchées
         if key in self.key_mappings:
-            self.move(self.key_mappings[key])
+            self.perform(Action(self.key_mappings[key].value))
 
         # Vérifie les touches ZQSD ou WASD
         if (
             self.game.settings.KEYBOARD_TYPE == KeyboardType.ZQSD
             and key in self.zqsd_mappings
         ):
-            self.move(self.zqsd_mappings[key])
+            self.perform(Action(self.zqsd_mappings[key].value))
         elif (
             self.game.settings.KEYBOARD_TYPE == KeyboardType.WASD
             and key in self.wasd_mappings
         ):
-            self.move(self.wasd_mappings[key])
+            self.perform(Action(self.wasd_mappings[key].value))
+
+    def perform(self, action: Action) -> None:
+        """
+        Applique une action du joueur (et l'enregistre si la partie est
+        enregistrée)
+
+        :param action: L'action
+        :type action: Action
+        """
+        if self.game.recorder is not None:
+            self.game.recorder.record(action)
+
+        if action == Action.DASH:
+            self.player.dash(self.direction)
+        else:
+            self.move(Direction(action.value))
 
     def move(self, direction: Direction) -> None:
         """
@@ -99,4 +126,5 @@ class Movement:
         """
         Fonction pour faire un dash
         """
-        self.player.dash(self.direction)
+        if self.game.replay is None:
+            self.perform(Action.DASH)
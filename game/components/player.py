@@ -1,11 +1,11 @@
-import random
 import pygame
 
+from ..dataclasses.events import EnemyKilled, PlayerDamaged
 from ..dataclasses.player import PlayerData
 from ..enums.direction import Direction
 from ..enums.game import GameState
-from time import time
-from typing import Dict, List, TYPE_CHECKING
+from ..utils.sprites import sprite_cache
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -39,31 +39,41 @@ class Player(PlayerData, pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
 
         self.game = game
+
+        # Charge et cache toutes les animations de sprites
+        self.sprites = self._load_all_sprites()
+        self.effect_sprites = self._load_effect_sprites()
+
+        self.damage_image = pygame.transform.scale(
+            self.game.assets.image("assets/images/damaged.png"),
+            (
+                self.game.settings.WINDOW_WIDTH,
+                self.game.settings.WINDOW_HEIGHT,
+            ),
+        ).convert_alpha()
+        self.game.assets.release("assets/images/damaged.png")
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Remet le joueur dans son état de début de partie
+        (les sprites et les sons chargés sont conservés)
+        """
+        PlayerData.__init__(self, self.name)
+
         self.position = pygame.math.Vector2(0, 0)  # Using Vector2 for position
+        # Position au pas de simulation précédent (pour l'interpolation)
+        self.previous_position = pygame.math.Vector2(self.position)
         self.direction = Direction.DOWN
-        self.damage_timestamp = int(time())
+        self.damage_timestamp = int(self.game.now())
         self.time_to_heal = 0
         self.onFire = False
         self.beginInvincible = 0
         self.isInvincible = False
 
-        self.swords = [
-            self.game.mixer.Sound("assets/songs/sfx/sword1.wav"),
-            self.game.mixer.Sound("assets/songs/sfx/sword2.wav"),
-        ]
-        self.screams = [
-            self.game.mixer.Sound("assets/songs/sfx/chicken_scream.wav"),
-            self.game.mixer.Sound("assets/songs/sfx/chicken_scream2.wav"),
-        ]
-        self.take_song = self.game.mixer.Sound(
-            "assets/songs/sfx/item_take.wav"
-        )
-
-        # Charge et cache toutes les animations de sprites
-        self.sprites = self._load_all_sprites()
         self.current_sprite_index = 0.0
         self.image = self.sprites[self.direction][0]
-        self.effect_sprites = self._load_effect_sprites()
         self.current_effect_index = 0.0
         self.rect = self.image.get_rect(topleft=self.position)
         self.collide_rect = pygame.Rect(
@@ -73,14 +83,6 @@ class Player(PlayerData, pygame.sprite.Sprite):
             self.image.get_height() - 10,
         )
 
-        self.damage_image = pygame.transform.scale(
-            pygame.image.load("assets/images/damaged.png"),
-            (
-                self.game.settings.WINDOW_WIDTH,
-                self.game.settings.WINDOW_HEIGHT,
-            ),
-        ).convert_alpha()
-
     def _load_effect_sprites(self) -> Dict[str, List[pygame.Surface]]:
         """
         Charge toutes les animations d'effets spéciaux
@@ -89,16 +91,14 @@ class Player(PlayerData, pygame.sprite.Sprite):
         :rtype: Dict[str, List[pygame.Surface]]
         """
         return {
-            "electric": [
-                pygame.transform.scale(
-                    pygame.image.load(f"assets/sprites/electric/{i}.png"),
-                    (
-                        self.game.settings.TILE_SIZE * 3,
-                        self.game.settings.TILE_SIZE * 3,
-                    ),
-                ).convert_alpha()
-                for i in range(1, 9)
-            ]
+            "electric": sprite_cache.numbered(
+                "electric",
+                (
+                    self.game.settings.TILE_SIZE * 3,
+                    self.game.settings.TILE_SIZE * 3,
+                ),
+                frames=8,
+            )
         }
 
     def _load_all_sprites(self) -> Dict[Direction, List[pygame.Surface]]:
@@ -108,21 +108,14 @@ class Player(PlayerData, pygame.sprite.Sprite):
         :return: Un dictionnaire de listes de surfaces pygame
         :rtype: Dict[Direction, List[pygame.Surface]]
         """
-        return {
-            direction: [
-                pygame.transform.scale(
-                    pygame.image.load(
-                        f"assets/sprites/hen/{direction.name.lower()}_{i}.png"
-                    ),
-                    (
-                        self.game.settings.TILE_SIZE * 1.5,
-                        self.game.settings.TILE_SIZE * 1.5,
-                    ),
-                ).convert_alpha()
-                for i in range(1, self.SPRITE_FRAMES + 1)
-            ]
-            for direction in Direction
-        }
+        return sprite_cache.directional(
+            "hen",
+            (
+                self.game.settings.TILE_SIZE * 1.5,
+                self.game.settings.TILE_SIZE * 1.5,
+            ),
+            frames=self.SPRITE_FRAMES,
+        )
 
     def _update_animation(self, speed: float = 0.1) -> None:
         """
@@ -147,6 +140,9 @@ class Player(PlayerData, pygame.sprite.Sprite):
         :return: True si la position est valide, False sinon
         :rtype: bool
         """
+        if self.game.world is not None:
+            # Le monde défilant n'a pas de bords
+            return True
         return (
             0
             <= new_pos.x
@@ -163,10 +159,13 @@ class Player(PlayerData, pygame.sprite.Sprite):
         :param damage_amount: Le montant de dégâts à infliger
         :type damage_amount: int
         """
-        if not self.isInvincible or time() - self.beginInvincible >= 1:
+        if (
+            not self.isInvincible
+            or self.game.now() - self.beginInvincible >= 1
+        ):
             self.isInvincible = True
-            self.beginInvincible = time()
-            self.damage(damage_amount)
+            self.beginInvincible = self.game.now()
+            self.damage(damage_amount, wall=True)
         self.position.x = max(
             0,
             min(
@@ -198,6 +197,8 @@ class Player(PlayerData, pygame.sprite.Sprite):
         Déplace le joueur dans la direction actuelle
         et gère les collisions avec les bords de l'écran
         """
+        self.previous_position = pygame.math.Vector2(self.position)
+
         movement = pygame.math.Vector2()
         if self.direction == Direction.UP:
             movement.y = -self.speed
@@ -222,15 +223,18 @@ class Player(PlayerData, pygame.sprite.Sprite):
             self.position.y + 5,
         )
 
-    def damage(self, amount: int) -> None:
+    def damage(self, amount: int, wall: bool = False) -> None:
         """
         Applique des dégâts au joueur et met à jour le timestamp des dégâts
 
         :param amount: Le montant de dégâts à infliger
         :type amount: int
+        :param wall: Si les dégâts sont dus à un bord de l'écran
+        :type wall: bool
         """
+        self.game.event_bus.emit(PlayerDamaged(amount, wall))
         self.health -= amount
-        self.damage_timestamp = int(time())
+        self.damage_timestamp = int(self.game.now())
         self.time_to_heal += int(2 + (1 * self.health_regen))
         if self.health <= 0:
             self.health = 0
@@ -243,7 +247,7 @@ class Player(PlayerData, pygame.sprite.Sprite):
         if self.health == self.MAX_HEALTH:
             return
 
-        if int(time()) - self.damage_timestamp >= self.time_to_heal:
+        if int(self.game.now()) - self.damage_timestamp >= self.time_to_heal:
             self.time_to_heal = 5
             self.damage_timestamp += 1
 
@@ -289,44 +293,71 @@ class Player(PlayerData, pygame.sprite.Sprite):
         """
         self.stamina = min(self.MAX_STAMINA, self.stamina + 1)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def render_position(self, alpha: float = 1.0) -> pygame.math.Vector2:
+        """
+        Renvoie la position d'affichage du joueur, interpolée entre
+        les deux derniers pas de simulation
+
+        :param alpha: L'avancement entre le pas précédent (0) et le pas
+                      courant (1)
+        :type alpha: float
+        :return: La position d'affichage
+        :rtype: pygame.math.Vector2
+        """
+        return self.previous_position.lerp(
+            self.position, max(0.0, min(alpha, 1.0))
+        )
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        alpha: float = 1.0,
+        offset: Tuple[int, int] = (0, 0),
+    ) -> List[pygame.Rect]:
         """
         Dessine le joueur sur l'écran
 
         :param screen: La surface de l'écran
         :type screen: pygame.Surface
+        :param alpha: L'avancement entre les deux derniers pas de simulation
+        :type alpha: float
+        :param offset: La position de la caméra dans le monde
+        :type offset: Tuple[int, int]
+        :return: Les zones de l'écran modifiées
+        :rtype: List[pygame.Rect]
         """
+        position = self.render_position(alpha) - offset
+
+        rects = []
         if self.onFire:
             # Affichage un effet d'incendie sur le joueur
-            screen.blit(
+            effect_rect = screen.blit(
                 self.effect_sprites["electric"][
                     int(self.current_effect_index)
                 ],
                 (
-                    self.position.x - self.game.settings.TILE_SIZE * 1.5 // 2,
-                    self.position.y - self.game.settings.TILE_SIZE * 1.5,
+                    position.x - self.game.settings.TILE_SIZE * 1.5 // 2,
+                    position.y - self.game.settings.TILE_SIZE * 1.5,
                 ),
             )
             self.current_effect_index = (
                 self.current_effect_index + 0.2
             ) % len(self.effect_sprites["electric"])
+            rects.append(effect_rect)
 
-        screen.blit(self.image, self.position)
+        rects.append(screen.blit(self.image, position))
+        return rects
 
     def isAttacked(self) -> None:
         """
         Vérifie si le joueur est attaqué par un ennemi
         """
-        if not self.onFire and time() - self.beginInvincible >= 1:
+        if not self.onFire and self.game.now() - self.beginInvincible >= 1:
             self.isInvincible = False
-            for enemy in self.game.enemy_spawner.enemies_list:
-                if self.collide_rect.colliderect(enemy):
-                    self.damage(enemy.damage)
-                    sword = random.choice(self.swords)
-                    sword.set_volume(0.5)
-                    sword.play()
-                    self.beginInvincible = time()
-                    self.isInvincible = True
+            for enemy in self.game.enemy_spawner.collide(self.collide_rect):
+                self.damage(enemy.damage)
+                self.beginInvincible = self.game.now()
+                self.isInvincible = True
 
     def draw_damage(self, screen: pygame.Surface) -> None:
         """
@@ -342,12 +373,14 @@ class Player(PlayerData, pygame.sprite.Sprite):
             screen.blit(self.damage_image, (0, 0))
 
     def on_fire(self):
+        """
+        Élimine les ennemis touchés pendant l'effet électrique
+        """
         if self.onFire:
-            for enemy in self.game.enemy_spawner.enemies_list:
-                if self.collide_rect.colliderect(enemy):
-                    scream = random.choice(self.screams)
-                    scream.set_volume(0.5)
-                    scream.play()
-                    enemy.kill()
-                    self.game.enemy_spawner.enemies_list.remove(enemy)
-                    self.game.stats.update("kills", 1)
+            spawner = self.game.enemy_spawner
+            killed = spawner.collide(self.collide_rect)
+            if len(killed):
+                self.game.event_bus.emit(EnemyKilled(len(killed)))
+
+            # Les ennemis sont retirés après le parcours des collisions
+            spawner.remove_many(killed)
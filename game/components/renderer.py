@@ -0,0 +1,104 @@
+import pygame
+
+from typing import List, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+class Renderer:
+    """
+    Classe pour gérer l'affichage de la partie par rectangles modifiés
+
+    À chaque image, seules les zones occupées par les sprites, l'item et
+    l'interface (à l'image précédente et à l'image courante) sont
+    restaurées depuis le fond pré-calculé puis envoyées à l'écran.
+    """
+
+    def __init__(self, game: "Game") -> None:
+        """
+        Constructeur de la classe
+
+        :param game: Le jeu
+        :type game: Game
+        """
+        self.game = game
+
+        self._prev_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    def invalidate(self) -> None:
+        """
+        Force le rafraîchissement complet de la prochaine image
+        (changement de fond, retour de pause, ...)
+        """
+        self._full_redraw = True
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Dessine une image de la partie
+
+        :param alpha: L'avancement entre les deux derniers pas de simulation,
+                      utilisé pour interpoler la position des sprites
+        :type alpha: float
+        """
+        screen = self.game.screen
+        background = self.game.background_layer
+        profiler = self.game.profiler
+
+        world = self.game.world
+
+        # L'effet de dégâts recouvre tout l'écran
+        overlay = self.game.player.isInvincible
+        full = (
+            self._full_redraw
+            or overlay
+            or world is not None
+            or not self.game.settings.DIRTY_RECTS
+        )
+
+        if world is not None:
+            # La caméra bouge à chaque image : tout l'écran est redessiné
+            offset = world.offset(alpha)
+            world.draw(screen, offset)
+        elif full:
+            offset = (0, 0)
+            screen.blit(background, (0, 0))
+        else:
+            offset = (0, 0)
+            # Efface les sprites de l'image précédente
+            screen.blits(
+                ((background, rect, rect) for rect in self._prev_rects),
+                doreturn=False,
+            )
+        profiler.lap("draw.background")
+
+        rects = self.game.enemy_spawner.draw(screen, alpha, offset)
+        profiler.lap("draw.enemies")
+        rects.extend(self.game.player.draw(screen, alpha, offset))
+        self.game.player.draw_damage(screen)
+        profiler.lap("draw.player")
+        rects.append(self.game.interface.draw())
+        profiler.lap("draw.interface")
+
+        item_rect = self.game.item.draw(offset)
+        if item_rect is not None:
+            rects.append(item_rect)
+        profiler.lap("draw.item")
+
+        # Mesures du profileur (F3), par-dessus tout le reste
+        overlay_rect = profiler.draw(screen, self.game.text_cache)
+        if overlay_rect is not None:
+            rects.append(overlay_rect)
+        profiler.lap("draw.overlay")
+
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_rects + rects)
+        profiler.lap("draw.present")
+
+        self._prev_rects = rects
+        # Après l'effet de dégâts, l'image suivante doit l'effacer
+        self._full_redraw = overlay
@@ -0,0 +1,200 @@
+import random
+import pygame
+import numpy as np
+
+from collections import OrderedDict
+from ..enums.direction import Direction
+from ..utils.functions import NoiseField
+from typing import Iterator, Optional, Tuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+ChunkKey = Tuple[int, int]
+
+
+class World:
+    """
+    Classe pour gérer le monde défilant
+
+    Le monde est découpé en morceaux carrés de `CHUNK_TILES` tuiles. Chaque
+    morceau est généré à la demande dans un champ de bruit tuilable (le
+    monde se répète tous les `WORLD_CHUNKS` morceaux), dessiné une fois
+    dans sa propre surface puis conservé dans un cache LRU de taille
+    limitée. La caméra suit le joueur et seuls les morceaux visibles sont
+    dessinés : le coût d'une image ne dépend pas de la taille du monde.
+    """
+
+    # Taille moyenne (en tuiles) des motifs du terrain, comme sur la carte
+    # d'un seul écran
+    FEATURE_TILES = 18
+    # Décalage de la zone préchargée dans la direction du joueur
+    PREFETCH = {
+        Direction.UP: (0, -1),
+        Direction.DOWN: (0, 1),
+        Direction.LEFT: (-1, 0),
+        Direction.RIGHT: (1, 0),
+    }
+
+    def __init__(self, game: "Game") -> None:
+        """
+        Constructeur de la classe
+
+        :param game: Le jeu
+        :type game: Game
+        """
+        self.game = game
+
+        settings = self.game.settings
+        self.chunk_tiles = settings.CHUNK_TILES
+        self.chunk_size = self.chunk_tiles * settings.TILE_SIZE
+        self.period = settings.WORLD_CHUNKS * self.chunk_tiles
+
+        # Nombre de morceaux gardés en mémoire (surfaces 32 bits)
+        chunk_bytes = self.chunk_size * self.chunk_size * 4
+        visible = (settings.WINDOW_WIDTH // self.chunk_size + 2) * (
+            settings.WINDOW_HEIGHT // self.chunk_size + 2
+        )
+        self.max_chunks = max(
+            2 * visible, settings.CHUNK_CACHE_MB * 2**20 // chunk_bytes
+        )
+        self.chunks: "OrderedDict[ChunkKey, pygame.Surface]" = OrderedDict()
+        self.generated = 0
+
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Tire un nouveau monde (les morceaux du précédent sont oubliés)
+
+        :param seed: La graine du monde (tirée au hasard si None)
+        :type seed: Optional[int]
+        """
+        self.seed = random.getrandbits(32) if seed is None else seed
+        res = max(1, self.period // self.FEATURE_TILES)
+        self.field = NoiseField(
+            (self.period, self.period),
+            (res, res),
+            tileable=(True, True),
+            rng=np.random.default_rng(self.seed),
+        )
+        self.chunks.clear()
+
+    def _keys(self, rect: pygame.Rect) -> Iterator[ChunkKey]:
+        """
+        Renvoie les morceaux couverts par une zone du monde
+
+        :param rect: La zone, en coordonnées du monde
+        :type rect: pygame.Rect
+        :return: Les coordonnées des morceaux
+        :rtype: Iterator[ChunkKey]
+        """
+        size = self.chunk_size
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield cx, cy
+
+    def _bake(self, key: ChunkKey) -> pygame.Surface:
+        """
+        Génère et dessine un morceau du monde
+
+        :param key: Les coordonnées du morceau
+        :type key: ChunkKey
+        :return: La surface du morceau
+        :rtype: pygame.Surface
+        """
+        # Le monde se répète : un morceau ne chevauche jamais le raccord
+        top = key[1] * self.chunk_tiles % self.period
+        left = key[0] * self.chunk_tiles % self.period
+        noise = self.field.sample(
+            top, top + self.chunk_tiles, left, left + self.chunk_tiles
+        )
+
+        surface = pygame.Surface((self.chunk_size, self.chunk_size)).convert()
+        self.game.map.draw(surface, self.game.map.classify(noise))
+        self.generated += 1
+        return surface
+
+    def chunk(self, key: ChunkKey) -> pygame.Surface:
+        """
+        Renvoie un morceau du monde, généré si besoin
+
+        :param key: Les coordonnées du morceau
+        :type key: ChunkKey
+        :return: La surface du morceau
+        :rtype: pygame.Surface
+        """
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self._bake(key)
+            self.chunks[key] = surface
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+
+    def update(self) -> None:
+        """
+        Centre la caméra sur le joueur et prépare les morceaux visibles,
+        ainsi qu'un morceau à venir dans la direction du joueur
+        """
+        camera = self.game.camera
+        camera.center = self.game.player.rect.center
+
+        for key in self._keys(camera):
+            self.chunk(key)
+
+        dx, dy = self.PREFETCH[self.game.player.direction]
+        ahead = camera.move(dx * self.chunk_size, dy * self.chunk_size)
+        for key in self._keys(ahead):
+            if key not in self.chunks:
+                self.chunk(key)
+                break
+
+    def offset(self, alpha: float = 1.0) -> Tuple[int, int]:
+        """
+        Renvoie la position de la caméra à l'affichage, interpolée avec
+        celle du joueur
+
+        :param alpha: L'avancement entre les deux derniers pas de simulation
+        :type alpha: float
+        :return: Le coin haut gauche de la caméra dans le monde
+        :rtype: Tuple[int, int]
+        """
+        player = self.game.player
+        position = player.render_position(alpha)
+        return (
+            int(
+                position.x + player.rect.width / 2 - self.game.camera.width / 2
+            ),
+            int(
+                position.y
+                + player.rect.height / 2
+                - self.game.camera.height / 2
+            ),
+        )
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
+        """
+        Dessine les morceaux visibles du monde
+
+        :param surface: La surface sur laquelle dessiner
+        :type surface: pygame.Surface
+        :param offset: Le coin haut gauche de la caméra dans le monde
+        :type offset: Tuple[int, int]
+        """
+        view = surface.get_rect(topleft=offset)
+        size = self.chunk_size
+        surface.blits(
+            (
+                (
+                    self.chunk(key),
+                    (key[0] * size - offset[0], key[1] * size - offset[1]),
+                )
+                for key in self._keys(view)
+            ),
+            doreturn=False,
+        )
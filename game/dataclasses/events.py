@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EnemyKilled:
+    # Nombre d'ennemis éliminés pendant le pas de simulation
+    count: int
+
+
+@dataclass(frozen=True)
+class PlayerDamaged:
+    amount: int
+    # Dégâts dus à un bord de l'écran (sinon à un ennemi)
+    wall: bool = False
+
+
+@dataclass(frozen=True)
+class ItemPicked:
+    pass
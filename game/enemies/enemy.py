@@ -1,7 +1,7 @@
 import pygame
-import os
 
 from ..enums.direction import Direction
+from ..utils.sprites import sprite_cache
 from typing import TYPE_CHECKING
 
 
@@ -38,40 +38,56 @@ class Enemy(pygame.sprite.Sprite):
         super().__init__()
         self.game = game
         self.sprites = self._load_all_sprites(sprite_url)
+        self.rect = self.sprites[direction][0].get_rect()
+        self.damage = 10
+        self.respawn(x, y, speed, direction)
+
+    def respawn(
+        self, x: int, y: int, speed: float, direction: Direction
+    ) -> None:
+        """
+        Replace l'ennemi en jeu (à sa création ou à son recyclage).
+
+        :param x: Position x de départ.
+        :type x: int
+        :param y: Position y de départ.
+        :type y: int
+        :param speed: Vitesse de déplacement.
+        :type speed: float
+        :param direction: Direction initiale.
+        :type direction: Direction
+        """
         self.direction = direction
         self.image = self.sprites[self.direction][0]
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.rect.topleft = (x, y)
+        # Position au pas de simulation précédent (pour l'interpolation)
+        self.previous_position = self.rect.topleft
         self.speed = speed
         self.current_sprite_index = 0.0
-        self.damage = 10
+
+    def retire(self) -> None:
+        """
+        Appelé quand l'ennemi est retiré du jeu, avant son recyclage
+        (ne fait rien par défaut : à redéfinir par les ennemis qui ont des
+        minuteurs, pour les annuler)
+        """
 
     def _load_all_sprites(
         self, sprite_url: str
     ) -> dict[Direction, list[pygame.Surface]]:
         """
         Charge toutes les animations de sprites pour chaque direction
+        (partagées avec les autres ennemis via le cache de sprites)
         :return: Un dictionnaire de listes de surfaces pygame
         :rtype: dict[Direction, list[pygame.Surface]]
         """
-        # get the max number of frames
-        j = 1
-        while os.path.exists(f"assets/sprites/{sprite_url}/right_{j}.png"):
-            j += 1
-        return {
-            direction: [
-                pygame.transform.scale(
-                    pygame.image.load(
-                        f"assets/sprites/{sprite_url}/{direction.name.lower()}_{i}.png"
-                    ),
-                    (
-                        self.game.settings.TILE_SIZE * 2,
-                        self.game.settings.TILE_SIZE * 2,
-                    ),
-                ).convert_alpha()
-                for i in range(1, j)
-            ]
-            for direction in Direction
-        }
+        return sprite_cache.directional(
+            sprite_url,
+            (
+                self.game.settings.TILE_SIZE * 2,
+                self.game.settings.TILE_SIZE * 2,
+            ),
+        )
 
     def _update_animation(self, speed: float = 0.1) -> None:
         """
@@ -86,10 +102,27 @@ class Enemy(pygame.sprite.Sprite):
             int(self.current_sprite_index)
         ]
 
+    def render_position(self, alpha: float = 1.0) -> tuple[float, float]:
+        """
+        Renvoie la position d'affichage de l'ennemi, interpolée entre
+        les deux derniers pas de simulation
+        :param alpha: L'avancement entre le pas précédent et le pas courant
+        :type alpha: float
+        :return: La position d'affichage
+        :rtype: tuple[float, float]
+        """
+        alpha = max(0.0, min(alpha, 1.0))
+        x, y = self.previous_position
+        return (
+            x + (self.rect.x - x) * alpha,
+            y + (self.rect.y - y) * alpha,
+        )
+
     def update(self):
         """
         Met à jour la position de l'ennemi.
         """
+        self.previous_position = self.rect.topleft
 
         if self.direction == Direction.UP:
             self.rect.y -= self.speed
@@ -102,11 +135,8 @@ class Enemy(pygame.sprite.Sprite):
 
         self._update_animation()
 
-        # si la méthode "variant" est définie, on l'appelle
-        if hasattr(self, "variant"):
-            self.variant()
-
-        # Vérifie si l'ennemi est hors de l'écran
-        if not self.game.screen.get_rect().colliderect(self.rect):
-            self.game.enemy_spawner.enemies_list.remove(self)
-            self.kill()
+        # Vérifie si l'ennemi est sorti de la partie visible du monde
+        if not self.game.camera.colliderect(self.rect):
+            self.game.enemy_spawner.remove(self)
+        else:
+            self.game.enemy_spawner.grid.move(self, self.rect)
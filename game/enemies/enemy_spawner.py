@@ -1,9 +1,9 @@
-import pygame
-import random
-
 from .knight import Knight
 from .pirate import Pirate
+from .pool import EnemyList, EnemyPool
+from .swarm import EnemySwarm
 from ..enums.direction import Direction
+from ..utils.spatial_hash import SpatialHash
 
 
 class EnemySpawner:
@@ -11,8 +11,6 @@ class EnemySpawner:
     Classe pour gérer la génération d'ennemis en vagues.
     """
 
-    enemies_list = []
-
     def __init__(self, game, wave_interval=3000, max_enemies_per_wave=9):
         """
         Initialise le générateur d'ennemis.
@@ -20,60 +18,166 @@ class EnemySpawner:
         :param wave_interval: Temps entre les vagues (en ms).
         :param max_enemies_per_wave: Nombre maximum d'ennemis par vague.
         """
-        EnemySpawner.enemies_list = []
         self.game = game
         self.wave_interval = wave_interval
         self.max_enemies_per_wave = max_enemies_per_wave
-        self.last_wave_time = pygame.time.get_ticks()
-        self.enemies = pygame.sprite.Group()
+        self.wave_timer = self.game.timers.every(
+            self.wave_interval / 1000, self.spawn_wave
+        )
+        # Ennemis en jeu et ennemis recyclables
+        self.enemies = EnemyList()
+        self.pool = EnemyPool(game)
+        # Grille des ennemis pour les tests de collision
+        self.grid = SpatialHash(self.game.settings.TILE_SIZE)
+        # Moteur en tableaux NumPy, si activé dans les paramètres
+        self.swarm = (
+            EnemySwarm(game)
+            if self.game.settings.ENEMY_ENGINE == "swarm"
+            else None
+        )
+
+    def __len__(self):
+        """
+        Nombre d'ennemis en jeu.
+        """
+        if self.swarm is not None:
+            return len(self.swarm)
+        return len(self.enemies)
+
+    def reset(self):
+        """
+        Retire tous les ennemis pour une nouvelle partie.
+        Les ennemis retirés restent disponibles dans la réserve.
+        """
+        if self.swarm is not None:
+            self.swarm.clear()
+        for enemy in self.enemies:
+            self.pool.release(enemy)
+        self.enemies.clear()
+        self.grid.clear()
+        self.wave_timer.cancel()
+        self.wave_timer = self.game.timers.every(
+            self.wave_interval / 1000, self.spawn_wave
+        )
 
     def spawn_wave(self):
         """
         Génère une vague d'ennemis.
         """
-        for _ in range(random.randint(1, self.max_enemies_per_wave)):
+        rng = self.game.rng.spawner
+        for _ in range(rng.randint(1, self.max_enemies_per_wave)):
             # Détermine un bord aléatoire pour faire apparaître l'ennemi
-            side = random.choice(["top", "bottom", "left", "right"])
+            # (toujours sur au moins une ligne de pixels de l'écran, pour
+            # qu'il ne soit pas supprimé dès sa première mise à jour)
+            side = rng.choice(["top", "bottom", "left", "right"])
             if side == "top":
-                x = random.randint(1, self.game.settings.WINDOW_WIDTH - 1)
+                x = rng.randint(1, self.game.settings.WINDOW_WIDTH - 1)
                 y = 0
                 direction = Direction.DOWN
             elif side == "bottom":
-                x = random.randint(1, self.game.settings.WINDOW_WIDTH - 1)
-                y = self.game.settings.WINDOW_HEIGHT
+                x = rng.randint(1, self.game.settings.WINDOW_WIDTH - 1)
+                y = self.game.settings.WINDOW_HEIGHT - 1
                 direction = Direction.UP
             elif side == "left":
                 x = 0
-                y = random.randint(1, self.game.settings.WINDOW_HEIGHT - 1)
+                y = rng.randint(1, self.game.settings.WINDOW_HEIGHT - 1)
                 direction = Direction.RIGHT
             elif side == "right":
-                x = self.game.settings.WINDOW_WIDTH
-                y = random.randint(1, self.game.settings.WINDOW_HEIGHT - 1)
+                x = self.game.settings.WINDOW_WIDTH - 1
+                y = rng.randint(1, self.game.settings.WINDOW_HEIGHT - 1)
                 direction = Direction.LEFT
 
-            if random.random() < 0.5:
-                speed = random.uniform(1, 3)
-                enemy = Knight(self.game, x, y, speed, direction)
+            # Coordonnées dans le monde (décalées de la caméra)
+            x += self.game.camera.x
+            y += self.game.camera.y
+
+            if rng.random() < 0.5:
+                speed = rng.uniform(1, 3)
+                archetype = EnemySwarm.KNIGHT
             else:
-                speed = random.uniform(2, 4)
-                enemy = Pirate(self.game, x, y, speed, direction)
-            self.enemies_list.append(enemy)
+                speed = rng.uniform(2, 4)
+                archetype = EnemySwarm.PIRATE
+
+            if self.swarm is not None:
+                self.swarm.spawn(x, y, speed, direction, archetype)
+                continue
+
+            enemy = self.pool.acquire(
+                Knight if archetype == EnemySwarm.KNIGHT else Pirate,
+                x,
+                y,
+                speed,
+                direction,
+            )
             self.enemies.add(enemy)
+            self.grid.insert(enemy, enemy.rect)
 
-    def update(self):
+    def collide(self, rect):
+        """
+        Renvoie les ennemis en collision avec une zone.
+        Seuls les ennemis des cellules voisines de la zone sont testés.
+        :param rect: Zone à tester.
+        :return: Liste des ennemis touchés.
+        """
+        if self.swarm is not None:
+            return self.swarm.collide(rect)
+        return [
+            enemy
+            for enemy in self.grid.query(rect)
+            if rect.colliderect(enemy.rect)
+        ]
+
+    def remove(self, enemy):
         """
-        Met à jour les ennemis et gère les vagues.
+        Retire un ennemi du jeu.
+        :param enemy: Ennemi à retirer.
         """
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_wave_time >= self.wave_interval:
-            self.spawn_wave()
-            self.last_wave_time = current_time
+        self.remove_many([enemy])
 
-        self.enemies.update()
+    def remove_many(self, enemies):
+        """
+        Retire plusieurs ennemis du jeu.
+        :param enemies: Ennemis à retirer (renvoyés par `collide`).
+        """
+        if self.swarm is not None:
+            self.swarm.remove(enemies)
+            return
+
+        for enemy in enemies:
+            self.grid.remove(enemy)
+            self.enemies.remove(enemy)
+            self.pool.release(enemy)
+
+    def update(self):
+        """
+        Met à jour les ennemis (les vagues sont lancées par un minuteur).
+        """
+        if self.swarm is not None:
+            self.swarm.update()
+        else:
+            # Parcours à rebours : un ennemi qui se retire est remplacé
+            # par le dernier de la liste, qui a déjà été mis à jour
+            for i in range(len(self.enemies) - 1, -1, -1):
+                self.enemies[i].update()
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0, offset=(0, 0)):
         """
         Dessine tous les ennemis.
         :param surface: Surface sur laquelle dessiner.
+        :param alpha: Avancement entre les deux derniers pas de simulation.
+        :param offset: Position de la caméra dans le monde.
+        :return: Les zones de la surface modifiées.
         """
-        self.enemies.draw(surface)
+        if self.swarm is not None:
+            return self.swarm.draw(surface, alpha, offset)
+        if offset == (0, 0):
+            return surface.blits(
+                (enemy.image, enemy.render_position(alpha))
+                for enemy in self.enemies
+            )
+        ox, oy = offset
+        return surface.blits(
+            (enemy.image, (x - ox, y - oy))
+            for enemy in self.enemies
+            for x, y in (enemy.render_position(alpha),)
+        )
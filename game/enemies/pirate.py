@@ -1,9 +1,5 @@
-import random
-
 from ..enums.direction import Direction
 from .enemy import Enemy
-from time import time
-from random import randint
 
 
 class Pirate(Enemy):
@@ -21,17 +17,39 @@ class Pirate(Enemy):
         :param speed: Vitesse de déplacement.
         :param direction: Direction initiale (vecteur [dx, dy]).
         """
+        self.direction_timer = None
         super().__init__(game, x, y, speed, direction, "pirate")
-
-        self.wait_time = randint(1, 5)
-        self.last_direction_change = time()
         self.damage = 10
 
+    def respawn(self, x, y, speed, direction):
+        """
+        Replace le pirate en jeu et tire un nouveau délai de changement
+        de direction.
+
+        :param x: Position x de départ.
+        :param y: Position y de départ.
+        :param speed: Vitesse de déplacement.
+        :param direction: Direction initiale.
+        """
+        super().respawn(x, y, speed, direction)
+        self.wait_time = self.game.rng.pirate.randint(1, 5)
+        self.retire()
+        self.direction_timer = self.game.timers.every(
+            self.wait_time, self.variant
+        )
+
+    def retire(self):
+        """
+        Annule les changements de direction du pirate.
+        """
+        if self.direction_timer is not None:
+            self.direction_timer.cancel()
+            self.direction_timer = None
+
     def variant(self):
         """
         Changer la direction aléatoirement
+        (appelé toutes les `wait_time` secondes)
         """
-        if time() - self.last_direction_change >= self.wait_time:
-            self.direction = random.choice(list(Direction))
-            self.last_direction_change = time()
-            self.current_sprite_index = 0
+        self.direction = self.game.rng.pirate.choice(list(Direction))
+        self.current_sprite_index = 0
@@ -0,0 +1,128 @@
+from .enemy import Enemy
+from ..enums.direction import Direction
+from typing import Dict, Iterator, List, Type, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+class EnemyList:
+    """
+    Conteneur indexé des ennemis en jeu.
+
+    Chaque ennemi connaît sa place dans la liste : le retrait échange
+    l'ennemi avec le dernier de la liste, en O(1). L'ordre des ennemis
+    n'est donc pas conservé.
+    """
+
+    def __init__(self) -> None:
+        self._items: List[Enemy] = []
+        self._index: Dict[Enemy, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, enemy: Enemy) -> bool:
+        return enemy in self._index
+
+    def __getitem__(self, index: int) -> Enemy:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[Enemy]:
+        return iter(self._items)
+
+    def add(self, enemy: Enemy) -> None:
+        """
+        Ajoute un ennemi.
+
+        :param enemy: Ennemi à ajouter.
+        :type enemy: Enemy
+        """
+        if enemy not in self._index:
+            self._index[enemy] = len(self._items)
+            self._items.append(enemy)
+
+    def remove(self, enemy: Enemy) -> None:
+        """
+        Retire un ennemi en l'échangeant avec le dernier de la liste.
+
+        :param enemy: Ennemi à retirer.
+        :type enemy: Enemy
+        """
+        index = self._index.pop(enemy)
+        last = self._items.pop()
+        if index < len(self._items):
+            self._items[index] = last
+            self._index[last] = index
+
+    def clear(self) -> None:
+        """
+        Retire tous les ennemis.
+        """
+        self._items.clear()
+        self._index.clear()
+
+
+class EnemyPool:
+    """
+    Réserve d'ennemis recyclés.
+
+    Les ennemis retirés du jeu sont conservés et réutilisés par les
+    vagues suivantes, avec leurs sprites et leur rectangle, au lieu
+    d'être recréés.
+    """
+
+    def __init__(self, game: "Game") -> None:
+        """
+        Initialise la réserve.
+
+        :param game: Instance du jeu.
+        :type game: Game
+        """
+        self.game = game
+        self._free: Dict[Type[Enemy], List[Enemy]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+
+    def acquire(
+        self,
+        enemy_class: Type[Enemy],
+        x: int,
+        y: int,
+        speed: float,
+        direction: Direction,
+    ) -> Enemy:
+        """
+        Renvoie un ennemi recyclé, ou en crée un si la réserve est vide.
+
+        :param enemy_class: Type d'ennemi (`Knight`, `Pirate`, ...).
+        :type enemy_class: Type[Enemy]
+        :param x: Position x de départ.
+        :type x: int
+        :param y: Position y de départ.
+        :type y: int
+        :param speed: Vitesse de déplacement.
+        :type speed: float
+        :param direction: Direction initiale.
+        :type direction: Direction
+        :return: L'ennemi, prêt à jouer.
+        :rtype: Enemy
+        """
+        free = self._free.get(enemy_class)
+        if free:
+            enemy = free.pop()
+            enemy.respawn(x, y, speed, direction)
+            return enemy
+        return enemy_class(self.game, x, y, speed, direction)
+
+    def release(self, enemy: Enemy) -> None:
+        """
+        Rend un ennemi retiré du jeu à la réserve.
+
+        :param enemy: Ennemi à recycler.
+        :type enemy: Enemy
+        """
+        enemy.retire()
+        self._free.setdefault(type(enemy), []).append(enemy)
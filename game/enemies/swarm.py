@@ -0,0 +1,281 @@
+import pygame
+import numpy as np
+
+from ..enums.direction import Direction
+from ..utils.sprites import sprite_cache
+from typing import List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+class SwarmEnemy(NamedTuple):
+    """
+    Référence vers un ennemi de l'essaim, renvoyée par les collisions.
+    """
+
+    index: int
+    damage: int
+
+
+class EnemySwarm:
+    """
+    Moteur d'ennemis en structure de tableaux.
+
+    Chaque propriété des ennemis (position, direction, vitesse, dégâts,
+    animation, type) est stockée dans un tableau NumPy : le déplacement,
+    les changements de direction des pirates, l'animation et la sortie de
+    l'écran sont calculés en une opération pour tous les ennemis.
+    """
+
+    # Types d'ennemis (indices des tableaux de propriétés ci-dessous)
+    KNIGHT = 0
+    PIRATE = 1
+    ARCHETYPES = ("knight", "pirate")
+    DAMAGE = np.array([20, 10], dtype=np.int16)
+
+    # Vecteurs de déplacement, indexés par `Direction.value`
+    VECTORS = np.zeros((len(Direction), 2), dtype=np.float32)
+    VECTORS[Direction.UP.value] = (0, -1)
+    VECTORS[Direction.DOWN.value] = (0, 1)
+    VECTORS[Direction.LEFT.value] = (-1, 0)
+    VECTORS[Direction.RIGHT.value] = (1, 0)
+
+    ANIMATION_SPEED = 0.1
+    CAPACITY = 256
+
+    def __init__(self, game: "Game", capacity: int = CAPACITY) -> None:
+        """
+        Initialise l'essaim.
+
+        :param game: Instance du jeu.
+        :type game: Game
+        :param capacity: Nombre d'ennemis prévus (les tableaux s'agrandissent
+                         si nécessaire).
+        :type capacity: int
+        """
+        self.game = game
+        self.count = 0
+
+        size = self.game.settings.TILE_SIZE * 2
+        self.size = size
+
+        # Images par [type][direction][image], partagées via le cache
+        self.frames = []
+        for archetype in self.ARCHETYPES:
+            sprites = sprite_cache.directional(archetype, (size, size))
+            self.frames.append([sprites[direction] for direction in Direction])
+        self.frame_counts = np.array(
+            [len(frames[0]) for frames in self.frames], dtype=np.float32
+        )
+
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Crée (ou agrandit) les tableaux de propriétés.
+
+        :param capacity: Nouvelle capacité.
+        :type capacity: int
+        """
+        arrays = {
+            "position": np.zeros((capacity, 2), dtype=np.float32),
+            "previous": np.zeros((capacity, 2), dtype=np.float32),
+            "speed": np.zeros(capacity, dtype=np.float32),
+            "direction": np.zeros(capacity, dtype=np.int8),
+            "archetype": np.zeros(capacity, dtype=np.int8),
+            "damage": np.zeros(capacity, dtype=np.int16),
+            "frame": np.zeros(capacity, dtype=np.float32),
+            "wait_time": np.zeros(capacity, dtype=np.float32),
+            "last_change": np.zeros(capacity, dtype=np.float64),
+        }
+        for name, array in arrays.items():
+            if hasattr(self, name):
+                array[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        speed: float,
+        direction: Direction,
+        archetype: int,
+    ) -> None:
+        """
+        Ajoute un ennemi à l'essaim.
+
+        :param x: Position x de départ.
+        :param y: Position y de départ.
+        :param speed: Vitesse de déplacement.
+        :param direction: Direction initiale.
+        :param archetype: Type d'ennemi (`KNIGHT` ou `PIRATE`).
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        i = self.count
+        self.position[i] = (x, y)
+        self.previous[i] = (x, y)
+        self.speed[i] = speed
+        self.direction[i] = direction.value
+        self.archetype[i] = archetype
+        self.damage[i] = self.DAMAGE[archetype]
+        self.frame[i] = 0
+        self.wait_time[i] = self.game.rng.pirate.randint(1, 5)
+        self.last_change[i] = self.game.now()
+        self.count += 1
+
+    def update(self) -> None:
+        """
+        Met à jour tous les ennemis.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        position = self.position[:n]
+        direction = self.direction[:n]
+        archetype = self.archetype[:n]
+
+        # Déplacement
+        self.previous[:n] = position
+        position += self.VECTORS[direction] * self.speed[:n, None]
+
+        # Animation
+        frame = self.frame[:n]
+        frame += self.ANIMATION_SPEED
+        np.fmod(frame, self.frame_counts[archetype], out=frame)
+
+        # Changement de direction aléatoire des pirates
+        now = self.game.now()
+        due = np.flatnonzero(
+            (archetype == self.PIRATE)
+            & (now - self.last_change[:n] >= self.wait_time[:n])
+        )
+        if due.size:
+            direction[due] = self.game.rng.swarm.integers(
+                0, len(Direction), due.size
+            )
+            self.last_change[due] = now
+            frame[due] = 0
+
+        # Suppression des ennemis sortis de la partie visible du monde
+        camera = self.game.camera
+        x, y = position[:, 0], position[:, 1]
+        visible = (
+            (x + self.size > camera.left)
+            & (x < camera.right)
+            & (y + self.size > camera.top)
+            & (y < camera.bottom)
+        )
+        if not visible.all():
+            self._keep(np.flatnonzero(visible))
+
+    def _keep(self, indices: np.ndarray) -> None:
+        """
+        Ne conserve que les ennemis donnés, en préservant leur ordre.
+
+        :param indices: Indices des ennemis à conserver.
+        :type indices: numpy.ndarray
+        """
+        kept = indices.size
+        for name in (
+            "position",
+            "previous",
+            "speed",
+            "direction",
+            "archetype",
+            "damage",
+            "frame",
+            "wait_time",
+            "last_change",
+        ):
+            array = getattr(self, name)
+            array[:kept] = array[indices]
+        self.count = kept
+
+    def clear(self) -> None:
+        """
+        Retire tous les ennemis (les tableaux sont conservés).
+        """
+        self.count = 0
+
+    def collide(self, rect: pygame.Rect) -> List[SwarmEnemy]:
+        """
+        Renvoie les ennemis en collision avec une zone.
+
+        :param rect: Zone à tester.
+        :type rect: pygame.Rect
+        :return: Liste des ennemis touchés.
+        :rtype: List[SwarmEnemy]
+        """
+        n = self.count
+        x, y = self.position[:n, 0], self.position[:n, 1]
+        # Les positions sont tronquées comme celles d'un pygame.Rect
+        x, y = x.astype(np.int32), y.astype(np.int32)
+        hits = np.flatnonzero(
+            (x < rect.right)
+            & (x + self.size > rect.left)
+            & (y < rect.bottom)
+            & (y + self.size > rect.top)
+        )
+        return [
+            SwarmEnemy(index, damage)
+            for index, damage in zip(hits.tolist(), self.damage[hits].tolist())
+        ]
+
+    def remove(self, enemies: Sequence[SwarmEnemy]) -> None:
+        """
+        Retire des ennemis de l'essaim.
+
+        :param enemies: Ennemis à retirer (renvoyés par `collide`).
+        :type enemies: Sequence[SwarmEnemy]
+        """
+        if not enemies:
+            return
+
+        keep = np.ones(self.count, dtype=bool)
+        keep[[enemy.index for enemy in enemies]] = False
+        self._keep(np.flatnonzero(keep))
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        alpha: float = 1.0,
+        offset: Tuple[int, int] = (0, 0),
+    ) -> List[pygame.Rect]:
+        """
+        Dessine tous les ennemis.
+
+        :param surface: Surface sur laquelle dessiner.
+        :type surface: pygame.Surface
+        :param alpha: Avancement entre les deux derniers pas de simulation.
+        :type alpha: float
+        :param offset: Position de la caméra dans le monde.
+        :type offset: Tuple[int, int]
+        :return: Les zones de la surface modifiées.
+        :rtype: List[pygame.Rect]
+        """
+        n = self.count
+        alpha = max(0.0, min(alpha, 1.0))
+        position = self.previous[:n] + (
+            self.position[:n] - self.previous[:n]
+        ) * np.float32(alpha)
+        position -= np.asarray(offset, dtype=np.float32)
+
+        frames = self.frames
+        return surface.blits(
+            (frames[a][d][f], (x, y))
+            for a, d, f, (x, y) in zip(
+                self.archetype[:n].tolist(),
+                self.direction[:n].tolist(),
+                self.frame[:n].astype(np.int32).tolist(),
+                position.astype(np.int32).tolist(),
+            )
+        )
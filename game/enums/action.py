@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class Action(Enum):
+    """
+    Énumération pour les actions du joueur enregistrées dans les replays
+    (les déplacements ont les mêmes valeurs que `Direction`)
+    """
+
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+    DASH = 4
@@ -1,3 +1,4 @@
+import os
 import pygame
 
 from settings import Settings
@@ -7,11 +8,26 @@ from .components.map import Map
 from .components.interface import Interface
 from .components.player import Player
 from .components.item import Item
+from .components.renderer import Renderer
+from .components.world import World
 from .enums.game import GameState
 from .enemies.enemy_spawner import EnemySpawner
+from .scenes.manager import SceneManager
 from .utils.stats import Stats
-from typing import Optional
+from .utils.sprites import sprite_cache
+from .utils.text import TextCache
+from .utils.assets import AssetLoader
+from .utils.audio import SilentMixer, SoundEffects
+from .utils.profiler import FrameProfiler
+from .utils.map_cache import MapCache
+from .utils.replay import Recorder, Replay, ReplayPlayer
+from .utils.rng import RandomStreams
+from .utils.clock import GameClock
+from .utils.timers import TimerWheel
+from .utils.events import EventBus
+from .dataclasses.events import EnemyKilled, ItemPicked, PlayerDamaged
 from datetime import datetime
+from typing import Optional
 
 
 class Game:
@@ -19,32 +35,139 @@ class Game:
     Classe pour gérer le jeu
     """
 
-    def __init__(self) -> None:
-        pygame.init()
+    # Assets utilisés par le jeu, décodés en arrière-plan dès le lancement
+    # dans cet ordre (la musique est lue en flux par le mixer, elle n'est
+    # pas préchargée ; les textures des tuiles viennent de `Map.PALETTE`)
+    PRELOAD = (
+        "assets/images/cinematic.png",
+        "assets/chicken.png",
+        "assets/heart.png",
+        "assets/potion.png",
+        "assets/chalencon.png",
+        "assets/images/damaged.png",
+        "assets/images/menu.jpg",
+        "assets/images/menu_text.png",
+    )
+    # Dossiers dont tous les fichiers sont utilisés
+    PRELOAD_FOLDERS = (
+        "assets/songs/sfx",
+        "assets/sprites",
+    )
+
+    def __init__(
+        self,
+        headless: bool = False,
+        stats_path: str = "stats.json",
+        cache_path: Optional[str] = None,
+    ) -> None:
+        """
+        Constructeur de la classe
+
+        :param headless: Si le jeu tourne sans fenêtre ni son
+                         (voir `simulate`)
+        :type headless: bool
+        :param stats_path: Le chemin du fichier de statistiques
+        :type stats_path: str
+        :param cache_path: Le dossier du cache des cartes (None pour
+                           toujours les générer)
+        :type cache_path: Optional[str]
+        """
+        self.headless = headless
+
+        if self.headless:
+            # Pilotes SDL factices : ni fenêtre, ni périphérique audio
+            # (seulement le temps de l'initialisation, l'environnement du
+            # processus est ensuite rétabli)
+            drivers = ("SDL_VIDEODRIVER", "SDL_AUDIODRIVER")
+            previous = {name: os.environ.get(name) for name in drivers}
+            os.environ.update(dict.fromkeys(drivers, "dummy"))
+            try:
+                pygame.display.init()
+            finally:
+                for name, value in previous.items():
+                    if value is None:
+                        os.environ.pop(name, None)
+                    else:
+                        os.environ[name] = value
+            pygame.font.init()
+        else:
+            pygame.init()
 
         self.settings = Settings
         self.settings.ITEM_SIZE = self.settings.TILE_SIZE * 1.8
 
-        self.mixer = pygame.mixer
-        self.footsteps = self.mixer.Sound("assets/songs/sfx/chicken_run.mp3")
+        self.mixer = SilentMixer() if self.headless else pygame.mixer
+
+        # Décodage des images et des sons pendant l'initialisation
+        # et la cinématique
+        self.assets = AssetLoader(self.mixer)
+        self.assets.preload(self.PRELOAD)
+        for folder in self.PRELOAD_FOLDERS:
+            self.assets.preload_folder(folder)
+        self.assets.preload(
+            tile.value["image"]
+            for tile in Map.PALETTE
+            if "image" in tile.value
+        )
+        sprite_cache.loader = self.assets
+
         self.current_song = 0
         self.playlist = [
             "assets/songs/music/1.mp3",
             "assets/songs/music/2.mp3",
         ]
         self._initialize_display()
+        self.footsteps = self.assets.sound("assets/songs/sfx/chicken_run.mp3")
+        self._init_sound_effects()
 
         self._create_layers()
 
+        # Zone du monde visible à l'écran (fixe sans monde défilant)
+        self.camera = pygame.Rect(
+            0, 0, self.settings.WINDOW_WIDTH, self.settings.WINDOW_HEIGHT
+        )
+
+        # Préparations faites une à une par `preload_step`
+        enemy_size = (self.settings.TILE_SIZE * 2, self.settings.TILE_SIZE * 2)
+        self._preload_steps = [
+            self._init_menu_background,
+            lambda: sprite_cache.directional("knight", enemy_size),
+            lambda: sprite_cache.directional("pirate", enemy_size),
+            self.prepare_next_round,
+        ]
+
+        # Horloge des images, et horloge de la simulation lue par tous les
+        # minuteurs du jeu (voir `now`)
         self.clock = pygame.time.Clock()
+        self.game_clock = GameClock(self.settings.TICK_RATE)
+        # Minuteurs de la partie, avancés avec l'horloge de la simulation
+        self.timers = TimerWheel(self.settings.TICK_RATE)
+        # Événements de la simulation, distribués une fois par image
+        self.event_bus = EventBus()
+        self._init_event_handlers()
+        self.rng = RandomStreams()
+        self.recorder = (
+            Recorder(self) if self.settings.RECORD_REPLAYS else None
+        )
+        self.replay: Optional[ReplayPlayer] = None
+        self.text_cache = TextCache()
+        self.profiler = FrameProfiler()
+        self.map_cache = (
+            MapCache(
+                os.path.join(cache_path, "maps"),
+                self.settings.MAP_CACHE_MB * 2**20,
+            )
+            if cache_path is not None and self.settings.MAP_CACHE_MB > 0
+            else None
+        )
+        self.renderer = Renderer(self)
         self._init_game_components()
 
-        self._prev_player_rect: Optional[pygame.Rect] = None
         self.running = True
-        self.paused = False
         self.state = GameState.CINEMATIC
+        self.scenes = SceneManager(self)
 
-        self.stats = Stats()
+        self.stats = Stats(stats_path)
 
     def _initialize_display(self) -> None:
         """
@@ -52,21 +175,96 @@ class Game:
         """
         info = pygame.display.Info()
 
-        if self.settings.IS_FULLSCREEN:
+        if self.settings.IS_FULLSCREEN and not self.headless:
             self.settings.WINDOW_WIDTH = info.current_w
             self.settings.WINDOW_HEIGHT = info.current_h
             self.settings.TILE_SIZE = self.settings.WINDOW_WIDTH // 40
 
+        # Les sprites en cache dépendent de la taille des tuiles
+        sprite_cache.set_tile_size(self.settings.TILE_SIZE)
+
+        if self.headless:
+            flags = 0
+        elif self.settings.IS_FULLSCREEN:
+            flags = pygame.FULLSCREEN
+        else:
+            flags = pygame.SCALED
+
         self.screen = pygame.display.set_mode(
-            (self.settings.WINDOW_WIDTH, self.settings.WINDOW_HEIGHT),
-            pygame.FULLSCREEN
-            if self.settings.IS_FULLSCREEN
-            else pygame.SCALED,
+            (self.settings.WINDOW_WIDTH, self.settings.WINDOW_HEIGHT), flags
         )
 
         pygame.display.set_caption("Run, Chicken, Run!")
-        icon = pygame.image.load("assets/chicken.png").convert_alpha()
+        icon = self.assets.image("assets/chicken.png").convert_alpha()
         pygame.display.set_icon(icon)
+        self.assets.release("assets/chicken.png")
+
+    def _init_sound_effects(self) -> None:
+        """
+        Initialise la banque des effets sonores
+        """
+        self.sfx = SoundEffects(
+            self.mixer, self.assets, self.settings.SFX_CHANNELS
+        )
+        # Joueur touché
+        self.sfx.register(
+            "sword",
+            [
+                "assets/songs/sfx/sword1.wav",
+                "assets/songs/sfx/sword2.wav",
+            ],
+            volume=0.5,
+            priority=2,
+        )
+        # Ennemi éliminé (souvent plusieurs à la fois)
+        self.sfx.register(
+            "scream",
+            [
+                "assets/songs/sfx/chicken_scream.wav",
+                "assets/songs/sfx/chicken_scream2.wav",
+            ],
+            volume=0.5,
+            priority=1,
+            cooldown=2,
+        )
+        # Item ramassé
+        self.sfx.register(
+            "item",
+            ["assets/songs/sfx/item_take.wav"],
+            volume=0.3,
+            priority=3,
+        )
+
+    def _init_event_handlers(self) -> None:
+        """
+        Abonne les sons et les statistiques aux événements de la partie
+        """
+        self.event_bus.subscribe(EnemyKilled, self._on_enemy_killed)
+        self.event_bus.subscribe(PlayerDamaged, self._on_player_damaged)
+        self.event_bus.subscribe(
+            ItemPicked, lambda event: self.sfx.play("item")
+        )
+
+    def _on_enemy_killed(self, event: EnemyKilled) -> None:
+        """
+        Ennemis éliminés : cri et statistiques (sauf pendant un replay)
+
+        :param event: L'événement
+        :type event: EnemyKilled
+        """
+        self.sfx.play("scream")
+        if self.replay is None:
+            self.stats.update("kills", event.count)
+
+    def _on_player_damaged(self, event: PlayerDamaged) -> None:
+        """
+        Joueur touché par un ennemi : bruit d'épée
+
+        :param event: L'événement
+        :type event: PlayerDamaged
+        """
+        if not event.wall:
+            self.sfx.play("sword")
 
     def _create_layers(self) -> None:
         """
@@ -75,10 +273,9 @@ class Game:
         size = (self.settings.WINDOW_WIDTH, self.settings.WINDOW_HEIGHT)
 
         self.background_layer = pygame.Surface(size).convert()
-
-        self.sprite_layer = pygame.Surface(
-            size, pygame.SRCALPHA
-        ).convert_alpha()
+        # Fond de la prochaine partie, dessiné à l'avance
+        self._next_background = pygame.Surface(size).convert()
+        self._next_round_ready = False
 
         self.menu_background = None
 
@@ -93,6 +290,7 @@ class Game:
         self.interface = Interface(self)
         self.item = Item(self)
         self.enemy_spawner = EnemySpawner(self)
+        self.world = World(self) if self.settings.SCROLLING_WORLD else None
 
         # Dessine la carte pour la première fois
         self._init_background()
@@ -102,8 +300,20 @@ class Game:
         Initialise le fond du jeu
         (appelé une fois lors de l'entrée dans le menu)
         """
-        self.background_layer.fill((0, 0, 0))  # Efface le fond
-        self.map.draw(self.background_layer)  # Dessine la carte
+        self.map.bake(self.background_layer)  # Dessine la carte
+        self.renderer.invalidate()
+
+    def prepare_next_round(self) -> None:
+        """
+        Génère la carte et dessine le fond de la prochaine partie
+        (appelé pendant l'écran de fin, pour que `reset` soit immédiat)
+        """
+        if self._next_round_ready:
+            return
+
+        self.map.prepare_next()
+        self.map.bake(self._next_background, upcoming=True)
+        self._next_round_ready = True
 
     def _init_menu_background(self) -> None:
         """
@@ -112,7 +322,7 @@ class Game:
         """
         if self.menu_background is None:
             # Charge et redimensionne l'image de fond du menu
-            background = pygame.image.load("assets/images/menu.jpg").convert()
+            background = self.assets.image("assets/images/menu.jpg").convert()
 
             # Redimensionne l'image pour qu'elle remplisse l'écran
             scale = max(
@@ -128,7 +338,7 @@ class Game:
             self.menu_background = pygame.transform.scale(background, new_size)
 
             # Charge et redimensionne le texte du menu
-            self.menu_text = pygame.image.load(
+            self.menu_text = self.assets.image(
                 "assets/images/menu_text.png"
             ).convert_alpha()
             max_width = self.settings.WINDOW_WIDTH // 3 * 2
@@ -141,53 +351,22 @@ class Game:
 
             self.menu_text = pygame.transform.scale(self.menu_text, text_size)
 
-    def start_cinematic(self) -> None:
-        """
-        Lance la cinématique de début du jeu
-        """
-        self.interface.cinematic()
+            # Les images décodées ne servent plus
+            self.assets.release("assets/images/menu.jpg")
+            self.assets.release("assets/images/menu_text.png")
 
-    def main_menu(self) -> None:
+    def preload_step(self) -> bool:
         """
-        Affiche le menu principal du jeu
-        """
-        self._init_menu_background()
-        pygame.display.set_caption("Menu - Run, Chicken, Run!")
-        self.mixer.music.load("assets/songs/music/menu.mp3")
-        self.mixer.music.play(-1)
-        self.mixer.music.set_volume(0.3)
+        Prépare sur le thread principal (qui possède l'affichage) une partie
+        des assets utilisés plus tard : images du menu et sprites des
+        ennemis, convertis au format de l'écran
 
-        # Calule la position du texte du menu
-        text_x = (
-            self.settings.WINDOW_WIDTH // 2 - self.menu_text.get_width() // 2
-        )
-        text_y = self.settings.WINDOW_HEIGHT - self.menu_text.get_height() - 50
-
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        self.main()
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-
-            if self.running:
-                self.screen.blit(self.menu_background, (0, 0))
-                self.screen.blit(self.menu_text, (text_x, text_y))
-
-                # Display stats
-                stats_text = self.stats.get_formatted_stats()
-                font = pygame.font.SysFont(None, 36)
-                y_offset = 50
-                for line in stats_text.splitlines():
-                    stats_surface = font.render(line, True, (255, 255, 255))
-                    self.screen.blit(stats_surface, (20, y_offset))
-                    y_offset += 40
-
-                pygame.display.flip()
-                self.clock.tick(self.settings.FPS)
+        :return: Si des assets restent à préparer
+        :rtype: bool
+        """
+        if self._preload_steps:
+            self._preload_steps.pop(0)()
+        return bool(self._preload_steps)
 
     def play_in_game_music(self) -> None:
         """
@@ -198,33 +377,151 @@ class Game:
         self.mixer.music.set_volume(0.3)
         self.mixer.music.set_endevent(pygame.USEREVENT + 1)
 
-    def main(self) -> None:
+    def run(self) -> None:
         """
-        Fonction principale du jeu
+        Boucle principale du jeu (voir `SceneManager`), puis arrêt des
+        threads de décodage des assets
         """
-        pygame.display.set_caption("Run, Chicken, Run!")
-        # Jouer 3 musique à la suite (en boucle)
+        try:
+            self.scenes.run()
+        finally:
+            self.assets.shutdown()
 
-        self.play_in_game_music()
+    def now(self) -> float:
+        """
+        Renvoie le temps de simulation de la partie en cours
+        (il n'avance pas pendant les pauses)
 
-        self.footsteps.set_volume(0.1)
-        self.footsteps.play(-1)
+        :return: Le temps écoulé depuis le début de la partie (en secondes)
+        :rtype: float
+        """
+        return self.game_clock.now()
 
-        self.stats.update("gamesPlayed", 1)
+    @property
+    def tick(self) -> int:
+        """
+        Nombre de pas de simulation de la partie en cours
+        """
+        return self.game_clock.ticks
+
+    def start_round(self) -> None:
+        """
+        Commence une partie : les générateurs aléatoires reçoivent de
+        nouvelles graines, enregistrées avec les actions du joueur si
+        les replays sont activés (ou celles du replay joué)
+        """
+        if self.replay is not None:
+            seeds = self.replay.replay.seeds
+            self.load_map(seeds["map"])
+            self.rng.reseed(seeds)
+        else:
+            self.rng.reseed()
+            self.stats.update("gamesPlayed", 1)
+            if self.recorder is not None:
+                map_seed = (
+                    self.world.seed
+                    if self.world is not None
+                    else self.map.seed
+                )
+                self.recorder.start({"map": map_seed, **self.rng.seeds})
+        self.item.schedule_spawn()
 
         self.state = GameState.PLAYING
         self.start_time = datetime.now()
 
-        while self.running:
+    def end_round(self, died: bool) -> int:
+        """
+        Termine la partie en cours : enregistre le replay et les statistiques
+
+        :param died: Si le joueur est mort (sinon la partie est abandonnée)
+        :type died: bool
+        :return: La durée de la partie (en secondes)
+        :rtype: int
+        """
+        if self.recorder is not None:
+            self.recorder.stop()
+
+        self.end_time = datetime.now()
+        seconds = (self.end_time - self.start_time).seconds
+        if died:
+            self.stats.update("deaths", 1)
+        self.stats.update("secondsPlayed", seconds)
+        self.stats.request_flush()
+        return seconds
+
+    def load_map(self, seed: int) -> None:
+        """
+        Remplace la carte (ou le monde) par celle d'une graine
+
+        :param seed: La graine de la carte
+        :type seed: int
+        """
+        if self.world is not None:
+            self.world.reset(seed)
+        else:
+            self.map.generate(seed)
+            self._init_background()
+
+    def play_replay(
+        self, replay: Replay, realtime: bool = True, seek: int = 0
+    ) -> Optional[int]:
+        """
+        Rejoue une partie enregistrée, à vitesse normale avec affichage ou
+        aussi vite que possible sans affichage
+
+        :param replay: Le replay
+        :type replay: Replay
+        :param realtime: Si la partie est affichée à vitesse normale
+        :type realtime: bool
+        :param seek: Le nombre de pas de simulation joués sans affichage
+                     avant la lecture à vitesse normale
+        :type seek: int
+        :return: Le premier pas où la partie diffère de l'enregistrement,
+                 ou None si elle est identique
+        :rtype: Optional[int]
+        """
+        replay.check(self)
+        self.reset()
+        self.replay = ReplayPlayer(replay)
+        self.start_round()
+        try:
+            if realtime:
+                if seek:
+                    self.simulate(seek)
+                self.run()
+            else:
+                self.simulate()
+            return self.replay.desync
+        finally:
+            self.replay = None
+
+    def simulate(self, ticks: Optional[int] = None) -> int:
+        """
+        Fait avancer la partie aussi vite que possible, sans affichage
+        ni limitation de vitesse, jusqu'à la fin de la partie ou pendant
+        un nombre de pas de simulation donné
+
+        :param ticks: Le nombre de pas de simulation (None pour jouer
+                      jusqu'à la fin de la partie)
+        :type ticks: Optional[int]
+        :return: Le nombre de pas de simulation effectués
+        :rtype: int
+        """
+        if self.state != GameState.PLAYING:
+            self.start_round()
+
+        done = 0
+        while (
+            self.running
+            and self.state == GameState.PLAYING
+            and (ticks is None or done < ticks)
+        ):
             self.events()
             self.update()
-            self.optimized_draw()
+            self.dispatch()
+            done += 1
 
-        if self.state == GameState.END:
-            print("end")
-            pygame.quit()
-        elif self.state == GameState.GAME_OVER:
-            pass
+        return done
 
     def events(self) -> None:
         """
@@ -233,77 +530,89 @@ class Game:
         for event in pygame.event.get():
             self.controller.event(event)
 
+    def dispatch(self) -> None:
+        """
+        Distribue les événements de l'image (sons, statistiques), puis
+        passe les effets sonores à l'image suivante
+        """
+        self.event_bus.dispatch()
+        self.sfx.update()
+
     def update(self) -> None:
         """
         Met à jour les composants du jeu
         """
         if self.state == GameState.PLAYING:
+            if self.replay is not None and not self.replay.apply(self):
+                # Fin de l'enregistrement
+                self.running = False
+                return
+            if self.recorder is not None:
+                self.recorder.update()
+
+            profiler = self.profiler
             self.player.move()
+            profiler.lap("player.move")
+            if self.world is not None:
+                self.world.update()
+                profiler.lap("world")
             self.player.on_fire()
+            profiler.lap("player.on_fire")
             self.player.isAttacked()
+            profiler.lap("player.isAttacked")
             self.player.heal()
             self.player.stamina_regen()
+            profiler.lap("player.heal")
             self.interface.update()
+            profiler.lap("interface")
             self.enemy_spawner.update()
-        elif self.state == GameState.GAME_OVER:
-            self.stats.update("deaths", 1)
-
-            self.end_time = datetime.now()
-            self.stats.update(
-                "secondsPlayed", (self.end_time - self.start_time).seconds
-            )
-
-            self.footsteps.stop()
-            self.interface.end((self.end_time - self.start_time).seconds)
-            self.running = False
-        elif self.state == GameState.PAUSED:
-            if not self.paused:
-                self.paused = True
-                self.footsteps.stop()
-                self.interface.paused()
-        elif self.state == GameState.END:
-            self.end_time = datetime.now()
-            self.footsteps.stop()
-            self.stats.update(
-                "secondsPlayed", (self.end_time - self.start_time).seconds
-            )
-
-            self.running = False
-            self.state = GameState.MENU
-            self.reset()
-            self.main_menu()
-
-    def optimized_draw(self) -> None:
+            profiler.lap("spawner")
+            self.item.update()
+            profiler.lap("item")
+            self.game_clock.step()
+            self.timers.update()
+            profiler.lap("timers")
+
+    def optimized_draw(self, alpha: float = 1.0) -> None:
         """
         Affichage optimisé du jeu
+        (seules les zones modifiées sont rafraîchies, voir `Renderer`)
+
+        :param alpha: L'avancement entre les deux derniers pas de simulation
+        :type alpha: float
         """
         if self.state == GameState.PLAYING:
-            # Efface l'ancienne position du joueur
-            self.sprite_layer.fill((0, 0, 0, 0))
-
-            self.screen.blit(self.background_layer, (0, 0))
-            self.enemy_spawner.draw(self.sprite_layer)  # Draw enemies
-            self.screen.blit(self.sprite_layer, (0, 0))  # Draw sprites
-
-            # Affiche le joueur à sa nouvelle position
-            self.player.draw(self.sprite_layer)
-            self.player.draw_damage(self.sprite_layer)
-
-            self.screen.blit(self.background_layer, (0, 0))
-            self.screen.blit(self.sprite_layer, (0, 0))  # Draw sprites
-
-            # Affiche l'interface
-            self.interface.draw()
-            self.item.draw()
-
-            pygame.display.flip()
-            self.clock.tick(self.settings.FPS)
+            self.renderer.draw(alpha)
 
     def reset(self) -> None:
         """
         Réinitialise le jeu
+        (l'état des composants est remis à zéro, les assets chargés
+        sont conservés)
         """
-        self._init_game_components()
+        self.game_clock.reset()
+        # Les composants réenregistrent leurs minuteurs
+        self.timers.clear()
+        self.event_bus.clear()
+        self.player.reset()
+        self.movement.reset()
+        self.interface.reset()
+        self.item.reset()
+        self.enemy_spawner.reset()
+        self.map.generate()
+        self.camera.topleft = (0, 0)
+        if self.world is not None:
+            self.world.reset()
+
+        if self._next_round_ready:
+            # Le fond a été dessiné à l'avance avec la nouvelle carte
+            self.background_layer, self._next_background = (
+                self._next_background,
+                self.background_layer,
+            )
+            self._next_round_ready = False
+            self.renderer.invalidate()
+        else:
+            self._init_background()
+
         self.running = True
-        self.paused = False
-        self._prev_player_rect = None
@@ -0,0 +1,75 @@
+import pygame
+
+from .scene import Scene
+from ..enums.game import GameState
+from typing import Optional
+
+
+class CinematicScene(Scene):
+    """
+    Cinématique de début du jeu
+    (les assets du jeu sont préparés en attendant le joueur)
+    """
+
+    state = GameState.CINEMATIC
+    IMAGE = "assets/images/cinematic.png"
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Affiche l'image de la cinématique
+        """
+        game = self.game
+        image = game.assets.image(self.IMAGE).convert_alpha()
+        scale = game.settings.WINDOW_HEIGHT / image.get_height()
+        new_size = (
+            int(image.get_width() * scale),
+            int(image.get_height() * scale),
+        )
+        self.image = pygame.transform.scale(image, new_size)
+        self.image_x = game.settings.WINDOW_WIDTH // 2 - new_size[0] // 2
+        self.loading = True
+
+        game.screen.blit(self.image, (self.image_x, 0))
+        pygame.display.flip()
+
+    def frame(self) -> None:
+        """
+        Attend une touche en préparant les assets
+        (à la vitesse du jeu pendant le chargement, sans consommer de
+        processeur ensuite)
+        """
+        game = self.game
+        if self.loading:
+            events = pygame.event.get()
+        else:
+            events = self.wait_events(game.settings.IDLE_TIMEOUT)
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                game.running = False
+            elif event.type == pygame.KEYDOWN:
+                game.state = GameState.MENU
+
+        if self.loading:
+            assets = game.assets
+            # Les images décodées sont converties une à une, sur ce
+            # thread, une fois tout le décodage terminé
+            if assets.done == assets.total:
+                self.loading = game.preload_step()
+
+            bar_rect = game.interface.loading(assets.progress())
+            if not self.loading:
+                # Chargement terminé : la barre est effacée
+                game.screen.fill((0, 0, 0), bar_rect)
+                game.screen.blit(
+                    self.image, bar_rect, bar_rect.move(-self.image_x, 0)
+                )
+            pygame.display.update(bar_rect)
+            game.clock.tick(game.settings.FPS)
+
+    def exit(self, following: Optional[GameState]) -> None:
+        """
+        Libère l'image de la cinématique, qui n'est plus affichée
+        """
+        self.image = None
+        self.game.assets.release(self.IMAGE)
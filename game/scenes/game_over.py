@@ -0,0 +1,72 @@
+import pygame
+
+from .scene import Scene
+from ..enums.game import GameState
+from typing import Optional
+
+
+class GameOverScene(Scene):
+    """
+    Écran de fin de partie (le joueur est mort)
+    """
+
+    state = GameState.GAME_OVER
+    # Durée de l'écran de fin avant le retour au menu (en ms)
+    DELAY = 5000
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Enregistre la partie et affiche l'écran de fin
+        """
+        game = self.game
+        if game.replay is not None:
+            # Fin du replay : ni statistiques ni écran de fin
+            game.running = False
+            return
+
+        game.interface.end(game.end_round(died=True))
+        self.shown = pygame.time.get_ticks()
+
+    def frame(self) -> None:
+        """
+        Prépare la prochaine partie, puis attend la fin du délai sans
+        consommer de processeur (la fenêtre peut être fermée entre-temps)
+        """
+        game = self.game
+        game.prepare_next_round()
+
+        remaining = self.DELAY - (pygame.time.get_ticks() - self.shown)
+        if remaining <= 0:
+            game.state = GameState.MENU
+            return
+
+        for event in self.wait_events(
+            min(remaining, game.settings.IDLE_TIMEOUT)
+        ):
+            if event.type == pygame.QUIT:
+                game.running = False
+
+
+class EndScene(Scene):
+    """
+    Partie abandonnée (touche Echap) : retour direct au menu
+    """
+
+    state = GameState.END
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Enregistre la partie et retourne au menu
+        """
+        game = self.game
+        if game.replay is not None:
+            game.running = False
+            return
+
+        game.end_round(died=False)
+        game.state = GameState.MENU
+
+    def frame(self) -> None:
+        """
+        Rien à faire : la scène rend la main au menu dès son entrée
+        """
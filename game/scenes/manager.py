@@ -0,0 +1,72 @@
+from .scene import Scene
+from .cinematic import CinematicScene
+from .menu import MenuScene
+from .playing import PlayingScene
+from .paused import PausedScene
+from .game_over import EndScene, GameOverScene
+from ..enums.game import GameState
+from typing import Dict, Optional, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+class SceneManager:
+    """
+    Boucle principale du jeu : une seule boucle appelle la scène de l'état
+    courant, et les changements d'état passent par les méthodes `exit` et
+    `enter` des scènes (la pile d'appels ne grandit pas d'une partie à
+    l'autre)
+    """
+
+    def __init__(self, game: "Game") -> None:
+        """
+        Constructeur de la classe
+
+        :param game: Le jeu
+        :type game: Game
+        """
+        self.game = game
+        self.scenes: Dict[GameState, Scene] = {
+            scene.state: scene
+            for scene in (
+                CinematicScene(game),
+                MenuScene(game),
+                PlayingScene(game),
+                PausedScene(game),
+                GameOverScene(game),
+                EndScene(game),
+            )
+        }
+        self.current: Optional[Scene] = None
+
+    def switch(self, state: GameState) -> None:
+        """
+        Quitte la scène courante et entre dans celle d'un état
+
+        :param state: Le nouvel état
+        :type state: GameState
+        """
+        previous = None
+        if self.current is not None:
+            previous = self.current.state
+            self.current.exit(state)
+        self.current = self.scenes[state]
+        self.current.enter(previous)
+
+    def run(self) -> None:
+        """
+        Fait tourner le jeu jusqu'à ce que `game.running` passe à False
+        """
+        game = self.game
+        while game.running:
+            if self.current is None or game.state != self.current.state:
+                # `enter` peut lui-même changer d'état : on revérifie
+                self.switch(game.state)
+                continue
+            self.current.frame()
+
+        if self.current is not None:
+            self.current.exit(None)
+            self.current = None
@@ -0,0 +1,68 @@
+import pygame
+
+from .scene import Scene
+from ..enums.game import GameState
+from typing import Optional
+
+
+class MenuScene(Scene):
+    """
+    Menu principal du jeu
+    """
+
+    state = GameState.MENU
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Prépare une nouvelle partie et lance la musique du menu
+        (le fond du menu est conservé d'une visite à l'autre)
+        """
+        game = self.game
+        game.reset()
+        game._init_menu_background()
+        pygame.display.set_caption("Menu - Run, Chicken, Run!")
+        game.mixer.music.load("assets/songs/music/menu.mp3")
+        game.mixer.music.play(-1)
+        game.mixer.music.set_volume(0.3)
+
+        # Calule la position du texte du menu
+        self.text_pos = (
+            game.settings.WINDOW_WIDTH // 2 - game.menu_text.get_width() // 2,
+            game.settings.WINDOW_HEIGHT - game.menu_text.get_height() - 50,
+        )
+        self.draw()
+
+    def frame(self) -> None:
+        """
+        Attend une touche (le menu ne change pas tant qu'il est affiché)
+        """
+        game = self.game
+        for event in self.wait_events(game.settings.IDLE_TIMEOUT):
+            if event.type == pygame.QUIT:
+                game.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    game.state = GameState.PLAYING
+                elif event.key == pygame.K_ESCAPE:
+                    game.running = False
+
+    def draw(self) -> None:
+        """
+        Affiche le menu et les statistiques
+        """
+        game = self.game
+        game.screen.blit(game.menu_background, (0, 0))
+        game.screen.blit(game.menu_text, self.text_pos)
+
+        # Display stats
+        # (seules les lignes modifiées sont rendues à nouveau)
+        stats_text = game.stats.get_formatted_stats()
+        y_offset = 50
+        for line in stats_text.splitlines():
+            stats_surface = game.text_cache.render(
+                line, 36, (255, 255, 255), system=True
+            )
+            game.screen.blit(stats_surface, (20, y_offset))
+            y_offset += 40
+
+        pygame.display.flip()
@@ -0,0 +1,25 @@
+from .scene import Scene
+from ..enums.game import GameState
+from typing import Optional
+
+
+class PausedScene(Scene):
+    """
+    Partie en pause (les composants de la partie sont conservés)
+    """
+
+    state = GameState.PAUSED
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Affiche l'écran de pause
+        """
+        self.game.stats.request_flush()
+        self.game.interface.paused()
+
+    def frame(self) -> None:
+        """
+        Attend la reprise de la partie (sans consommer de processeur)
+        """
+        for event in self.wait_events(self.game.settings.IDLE_TIMEOUT):
+            self.game.controller.event(event)
@@ -0,0 +1,77 @@
+import pygame
+
+from .scene import Scene
+from ..enums.game import GameState
+from typing import Optional
+
+
+class PlayingScene(Scene):
+    """
+    Partie en cours
+    """
+
+    state = GameState.PLAYING
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Commence la partie depuis le menu, ou la reprend après une pause
+        (un replay a déjà commencé sa partie, voir `Game.play_replay`)
+        """
+        game = self.game
+        if previous != GameState.PAUSED:
+            pygame.display.set_caption("Run, Chicken, Run!")
+            game.play_in_game_music()
+            game.footsteps.set_volume(0.1)
+            if previous == GameState.MENU:
+                game.start_round()
+                game.stats.request_flush()
+        game.footsteps.play(-1)
+        game.renderer.invalidate()
+
+        # Boucle à pas fixe : la simulation avance toujours d'un pas de
+        # l'horloge du jeu, quel que soit le nombre d'images par seconde
+        game.game_clock.resume()
+        game.clock.tick()
+
+    def frame(self) -> None:
+        """
+        Une image de la partie : les pas de simulation en retard, puis
+        l'affichage
+        """
+        game = self.game
+        profiler = game.profiler
+        profiler.begin_frame()
+        game.events()
+        profiler.lap("events")
+        if game.state != self.state:
+            # Pause, fin de partie, ... : pas de rattrapage
+            return
+        steps = game.game_clock.advance(
+            game.clock.tick(game.settings.FPS) / 1000,
+            game.settings.MAX_FRAME_STEPS,
+        )
+        profiler.lap("wait")
+
+        for _ in range(steps):
+            if game.state != self.state:
+                break
+            game.update()
+
+        # Sons et statistiques des pas de simulation de l'image
+        game.dispatch()
+        profiler.lap("dispatch")
+
+        if game.running:
+            game.optimized_draw(game.game_clock.alpha)
+            profiler.end_frame(len(game.enemy_spawner))
+
+    def exit(self, following: Optional[GameState]) -> None:
+        """
+        Arrête l'horloge du jeu et les bruits de pas (la musique continue
+        pendant une pause)
+        """
+        self.game.game_clock.pause()
+        self.game.footsteps.stop()
+        if following is None and self.game.recorder is not None:
+            # Fenêtre fermée en cours de partie
+            self.game.recorder.stop()
@@ -0,0 +1,77 @@
+import pygame
+
+from abc import ABC, abstractmethod
+from pygame.event import Event
+from ..enums.game import GameState
+from typing import List, Optional, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+
+class Scene(ABC):
+    """
+    Écran du jeu associé à un état (cinématique, menu, partie, ...)
+
+    Le gestionnaire de scènes appelle `enter` quand le jeu passe dans
+    l'état de la scène, `frame` à chaque image tant qu'il y reste, puis
+    `exit` quand il en sort. Une scène ne lance jamais la suivante : elle
+    change `game.state` et rend la main au gestionnaire.
+    """
+
+    state: GameState
+
+    def __init__(self, game: "Game") -> None:
+        """
+        Constructeur de la classe
+
+        :param game: Le jeu
+        :type game: Game
+        """
+        self.game = game
+
+    def enter(self, previous: Optional[GameState]) -> None:
+        """
+        Entrée dans la scène
+
+        :param previous: L'état précédent (None au lancement de la boucle)
+        :type previous: Optional[GameState]
+        """
+
+    @abstractmethod
+    def frame(self) -> None:
+        """
+        Une image de la scène (à définir par chaque scène)
+        """
+
+    def wait_events(self, timeout: int) -> List[Event]:
+        """
+        Attend un événement sans consommer de processeur, puis renvoie
+        tous les événements en attente (l'écran est réaffiché s'il a été
+        masqué)
+
+        :param timeout: L'attente maximale (en ms, au moins 1)
+        :type timeout: int
+        :return: Les événements, vide si aucun n'est arrivé à temps
+        :rtype: List[Event]
+        """
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+
+        events = [event, *pygame.event.get()]
+        if any(
+            event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+            for event in events
+        ):
+            pygame.display.flip()
+        return events
+
+    def exit(self, following: Optional[GameState]) -> None:
+        """
+        Sortie de la scène
+
+        :param following: L'état suivant (None à la fin de la boucle)
+        :type following: Optional[GameState]
+        """
@@ -0,0 +1,161 @@
+import os
+import pygame
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable
+
+
+class AssetLoader:
+    """
+    Chargement des assets en arrière-plan
+
+    Les images et les sons sont décodés par un groupe de threads dès le
+    lancement du jeu. Les composants récupèrent ensuite le résultat et ne
+    sont bloqués que si le décodage de l'asset demandé n'est pas terminé.
+
+    Les images renvoyées ne sont pas converties au format de l'écran :
+    la conversion (`convert`, `convert_alpha`) reste à faire par le thread
+    principal, qui possède l'affichage.
+    """
+
+    IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+    SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+    WORKERS = 4
+
+    def __init__(self, mixer: Any, workers: int = WORKERS) -> None:
+        """
+        Constructeur de la classe
+
+        :param mixer: Le module de son du jeu (`pygame.mixer` ou muet)
+        :type mixer: Any
+        :param workers: Le nombre de threads de décodage
+        :type workers: int
+        """
+        self.mixer = mixer
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="assets"
+        )
+        self._futures: Dict[str, Future] = {}
+
+    def _decode(self, path: str) -> Any:
+        """
+        Décode un asset (exécuté par un thread du groupe)
+
+        :param path: Le chemin de l'asset
+        :type path: str
+        :return: La surface ou le son décodé
+        :rtype: Any
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension in self.IMAGE_EXTENSIONS:
+            return pygame.image.load(path)
+        if extension in self.SOUND_EXTENSIONS:
+            return self.mixer.Sound(path)
+        raise ValueError(f"Type d'asset inconnu : {path}")
+
+    def _submit(self, path: str) -> Future:
+        """
+        Lance le décodage d'un asset s'il n'est pas déjà lancé
+
+        :param path: Le chemin de l'asset
+        :type path: str
+        :return: Le décodage en cours (ou terminé)
+        :rtype: Future
+        """
+        future = self._futures.get(path)
+        if future is None:
+            future = self._executor.submit(self._decode, path)
+            self._futures[path] = future
+        return future
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """
+        Lance le décodage d'assets, dans l'ordre donné
+
+        :param paths: Les chemins des assets
+        :type paths: Iterable[str]
+        """
+        for path in paths:
+            self._submit(path)
+
+    def preload_folder(self, folder: str) -> None:
+        """
+        Lance le décodage de toutes les images et de tous les sons
+        d'un dossier et de ses sous-dossiers
+
+        :param folder: Le dossier des assets
+        :type folder: str
+        """
+        extensions = self.IMAGE_EXTENSIONS + self.SOUND_EXTENSIONS
+        for root, folders, files in os.walk(folder):
+            folders.sort()
+            self.preload(
+                os.path.join(root, name).replace(os.sep, "/")
+                for name in sorted(files)
+                if os.path.splitext(name)[1].lower() in extensions
+            )
+
+    def image(self, path: str) -> pygame.Surface:
+        """
+        Renvoie une image décodée (non convertie, à ne pas modifier)
+
+        :param path: Le chemin de l'image
+        :type path: str
+        :return: L'image, au format du fichier
+        :rtype: pygame.Surface
+        """
+        return self._submit(path).result()
+
+    def sound(self, path: str) -> Any:
+        """
+        Renvoie un son décodé (partagé par tous les composants)
+
+        :param path: Le chemin du son
+        :type path: str
+        :return: Le son
+        :rtype: pygame.mixer.Sound
+        """
+        return self._submit(path).result()
+
+    def release(self, path: str) -> None:
+        """
+        Oublie un asset qui ne sera plus utilisé
+        (il sera décodé à nouveau s'il est redemandé)
+
+        :param path: Le chemin de l'asset
+        :type path: str
+        """
+        future = self._futures.pop(path, None)
+        if future is not None:
+            future.cancel()
+
+    @property
+    def total(self) -> int:
+        """
+        Nombre d'assets demandés
+        """
+        return len(self._futures)
+
+    @property
+    def done(self) -> int:
+        """
+        Nombre d'assets décodés
+        """
+        return sum(future.done() for future in self._futures.values())
+
+    def progress(self) -> float:
+        """
+        Renvoie l'avancement du décodage
+
+        :return: La part des assets décodés, entre 0 et 1
+        :rtype: float
+        """
+        if not self._futures:
+            return 1.0
+        return self.done / self.total
+
+    def shutdown(self) -> None:
+        """
+        Arrête les threads de décodage (les assets décodés sont conservés)
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
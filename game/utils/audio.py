@@ -0,0 +1,308 @@
+import random
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+
+if TYPE_CHECKING:
+    from .assets import AssetLoader
+
+
+class SilentSound:
+    """
+    Son muet, utilisé à la place de `pygame.mixer.Sound`
+    lorsque le jeu tourne sans périphérique audio
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.volume = 1.0
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def stop(self) -> None:
+        pass
+
+    def fadeout(self, time: int) -> None:
+        pass
+
+    def set_volume(self, value: float) -> None:
+        self.volume = value
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def get_num_channels(self) -> int:
+        return 0
+
+    def get_length(self) -> float:
+        return 0.0
+
+
+class SilentChannel:
+    """
+    Canal muet, utilisé à la place de `pygame.mixer.Channel`
+    """
+
+    def __init__(self, id: int = 0) -> None:
+        self.id = id
+        self.volume = 1.0
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def fadeout(self, time: int) -> None:
+        pass
+
+    def get_busy(self) -> bool:
+        return False
+
+    def set_volume(self, value: float, *args: Any) -> None:
+        self.volume = value
+
+    def get_volume(self) -> float:
+        return self.volume
+
+
+class SilentMusic:
+    """
+    Lecteur de musique muet, utilisé à la place de `pygame.mixer.music`
+    """
+
+    def __init__(self) -> None:
+        self.volume = 1.0
+        self.endevent = 0
+
+    def load(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def unload(self) -> None:
+        pass
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def pause(self) -> None:
+        pass
+
+    def unpause(self) -> None:
+        pass
+
+    def fadeout(self, time: int) -> None:
+        pass
+
+    def set_volume(self, value: float) -> None:
+        self.volume = value
+
+    def get_volume(self) -> float:
+        return self.volume
+
+    def get_busy(self) -> bool:
+        return False
+
+    def set_endevent(self, event_type: int = 0) -> None:
+        self.endevent = event_type
+
+    def get_endevent(self) -> int:
+        return self.endevent
+
+
+class SilentMixer:
+    """
+    Mixeur muet, utilisé à la place de `pygame.mixer` en mode sans affichage
+
+    Tous les appels sont sans effet : aucun fichier audio n'est décodé et
+    aucun périphérique audio n'est nécessaire.
+    """
+
+    Sound = SilentSound
+    Channel = SilentChannel
+
+    def __init__(self) -> None:
+        self.music = SilentMusic()
+
+    def init(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+    def get_init(self) -> Optional[tuple]:
+        return None
+
+    def set_num_channels(self, count: int) -> None:
+        pass
+
+    def get_num_channels(self) -> int:
+        return 0
+
+    def set_reserved(self, count: int) -> int:
+        return count
+
+    def stop(self) -> None:
+        pass
+
+    def pause(self) -> None:
+        pass
+
+    def unpause(self) -> None:
+        pass
+
+
+class SoundEffect(NamedTuple):
+    """
+    Effet sonore de la banque de sons
+    """
+
+    sounds: List[Any]
+    priority: int
+    cooldown: int
+
+
+class SoundEffects:
+    """
+    Gestionnaire des effets sonores
+
+    Les sons sont décodés une seule fois dans une banque partagée et joués
+    sur un nombre fixe de canaux réservés. Quand tous les canaux sont
+    occupés, le son le moins prioritaire (puis le plus ancien) est coupé
+    au profit d'un son de priorité égale ou supérieure. Un même effet
+    demandé plusieurs fois pendant son délai (en images affichées) n'est
+    joué qu'une fois : les sons d'une même image sont fusionnés, quel que
+    soit le nombre de pas de simulation de l'image.
+    """
+
+    CHANNELS = 6
+
+    def __init__(
+        self, mixer: Any, assets: "AssetLoader", channels: int = CHANNELS
+    ) -> None:
+        """
+        Constructeur de la classe
+
+        :param mixer: Le module de son du jeu (`pygame.mixer` ou muet)
+        :type mixer: Any
+        :param assets: Le chargeur d'assets du jeu
+        :type assets: AssetLoader
+        :param channels: Le nombre de canaux réservés aux effets
+        :type channels: int
+        """
+        self.assets = assets
+        self.bank: Dict[str, SoundEffect] = {}
+
+        # Les canaux réservés ne sont jamais choisis par `Sound.play`
+        # (bruits de pas, ...) : ils sont gérés uniquement ici
+        mixer.set_num_channels(max(mixer.get_num_channels(), channels + 2))
+        mixer.set_reserved(channels)
+        self.channels = [mixer.Channel(i) for i in range(channels)]
+        # Priorité et image de départ du son joué sur chaque canal
+        self._voices = [(0, 0)] * channels
+
+        self.frame = 0
+        self._next_play: Dict[str, int] = {}
+        self.played = 0
+        self.merged = 0
+        self.dropped = 0
+
+    def register(
+        self,
+        name: str,
+        paths: Sequence[str],
+        volume: float = 1.0,
+        priority: int = 0,
+        cooldown: int = 1,
+    ) -> None:
+        """
+        Ajoute un effet à la banque de sons
+
+        :param name: Le nom de l'effet
+        :type name: str
+        :param paths: Les fichiers de l'effet (un au hasard à chaque fois)
+        :type paths: Sequence[str]
+        :param volume: Le volume de l'effet
+        :type volume: float
+        :param priority: La priorité de l'effet (la plus haute l'emporte)
+        :type priority: int
+        :param cooldown: Le nombre d'images avant de pouvoir rejouer
+                         l'effet (1 : une fois par image)
+        :type cooldown: int
+        """
+        sounds = [self.assets.sound(path) for path in paths]
+        for sound in sounds:
+            sound.set_volume(volume)
+        self.bank[name] = SoundEffect(sounds, priority, cooldown)
+
+    def update(self) -> None:
+        """
+        Passe à l'image suivante (appelé une fois par image, après la
+        distribution des événements, voir `Game.dispatch`)
+        """
+        self.frame += 1
+
+    def _channel(self, priority: int) -> Optional[int]:
+        """
+        Choisit le canal d'un nouveau son
+
+        :param priority: La priorité du nouveau son
+        :type priority: int
+        :return: L'indice d'un canal libre ou d'une voix à voler,
+                 ou None si toutes les voix sont plus prioritaires
+        :rtype: Optional[int]
+        """
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+
+        victim = min(range(len(self.channels)), key=self._voices.__getitem__)
+        if self._voices[victim][0] > priority:
+            return None
+        self.channels[victim].stop()
+        return victim
+
+    def play(self, name: str) -> bool:
+        """
+        Joue un effet de la banque de sons
+
+        :param name: Le nom de l'effet
+        :type name: str
+        :return: Si l'effet a été joué
+        :rtype: bool
+        """
+        effect = self.bank[name]
+
+        if self.frame < self._next_play.get(name, 0):
+            # Déjà joué pendant ce délai : les deux sons sont fusionnés
+            self.merged += 1
+            return False
+
+        i = self._channel(effect.priority)
+        if i is None:
+            self.dropped += 1
+            return False
+
+        self.channels[i].play(random.choice(effect.sounds))
+        self._voices[i] = (effect.priority, self.frame)
+        self._next_play[name] = self.frame + effect.cooldown
+        self.played += 1
+        return True
+
+    def stop(self) -> None:
+        """
+        Coupe tous les effets en cours
+        """
+        for channel in self.channels:
+            channel.stop()
+        self._next_play.clear()
@@ -0,0 +1,96 @@
+class GameClock:
+    """
+    Horloge de la simulation
+
+    Le temps de la partie avance d'exactement un pas à chaque pas de
+    simulation (`step`), jamais avec l'horloge murale : tous les minuteurs
+    du jeu le lisent (`now`), il s'arrête pendant les pauses, et une partie
+    rejouée sans affichage se déroule comme à vitesse normale. `advance`
+    convertit le temps réel écoulé entre deux images en pas de simulation,
+    multiplié par `scale` (2 : la partie va deux fois plus vite).
+    """
+
+    def __init__(self, tick_rate: int) -> None:
+        """
+        Constructeur de la classe
+
+        :param tick_rate: Le nombre de pas de simulation par seconde
+        :type tick_rate: int
+        """
+        self.tick_rate = tick_rate
+        self.tick_duration = 1 / tick_rate
+        # Nombre de pas de simulation de la partie en cours
+        self.ticks = 0
+        self.scale = 1.0
+        self.paused = False
+        # Temps réel (mis à l'échelle) pas encore simulé
+        self._accumulator = 0.0
+
+    def reset(self) -> None:
+        """
+        Remet l'horloge à zéro (nouvelle partie)
+        """
+        self.ticks = 0
+        self._accumulator = 0.0
+
+    def now(self) -> float:
+        """
+        Renvoie le temps de simulation de la partie en cours
+
+        :return: Le temps écoulé depuis le début de la partie (en secondes)
+        :rtype: float
+        """
+        return self.ticks / self.tick_rate
+
+    def step(self) -> None:
+        """
+        Avance d'un pas de simulation
+        """
+        self.ticks += 1
+
+    def pause(self) -> None:
+        """
+        Arrête l'horloge : le temps réel n'est plus compté
+        """
+        self.paused = True
+
+    def resume(self) -> None:
+        """
+        Relance l'horloge, sans rattraper le temps passé en pause
+        """
+        self.paused = False
+        self._accumulator = 0.0
+
+    def advance(self, seconds: float, max_steps: int) -> int:
+        """
+        Ajoute le temps réel écoulé et renvoie le nombre de pas de
+        simulation à effectuer (au plus `max_steps` : au-delà, le retard
+        est abandonné)
+
+        :param seconds: Le temps réel écoulé (en secondes)
+        :type seconds: float
+        :param max_steps: Le nombre maximum de pas rattrapés
+        :type max_steps: int
+        :return: Le nombre de pas à effectuer
+        :rtype: int
+        """
+        if self.paused:
+            return 0
+
+        self._accumulator += seconds * self.scale
+        steps = 0
+        while self._accumulator >= self.tick_duration and steps < max_steps:
+            self._accumulator -= self.tick_duration
+            steps += 1
+
+        # Trop de retard : on abandonne les pas restants
+        self._accumulator = min(self._accumulator, self.tick_duration)
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """
+        Avancement entre le dernier pas de simulation et le suivant
+        (entre 0 et 1, pour interpoler l'affichage)
+        """
+        return self._accumulator / self.tick_duration
@@ -0,0 +1,86 @@
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+
+E = TypeVar("E")
+
+
+class EventBus:
+    """
+    File des événements de la partie (voir `game/dataclasses/events.py`)
+
+    La simulation émet ses événements dans une file préallouée, sans
+    effet de bord ; les abonnés (sons, statistiques, ...) les reçoivent
+    une fois par image, quand la file est vidée par `dispatch`. Les
+    abonnés ne doivent pas émettre d'événements eux-mêmes.
+    """
+
+    CAPACITY = 256
+
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        """
+        Constructeur de la classe
+
+        :param capacity: Le nombre d'événements gardés avant distribution
+                         (la file est vidée aussitôt si elle est pleine)
+        :type capacity: int
+        """
+        self._queue: List[Optional[Any]] = [None] * capacity
+        self._count = 0
+        self._handlers: Dict[type, List[Callable[[Any], object]]] = {}
+
+    def __len__(self) -> int:
+        """
+        Nombre d'événements en attente
+        """
+        return self._count
+
+    def subscribe(
+        self, event_type: Type[E], handler: Callable[[E], object]
+    ) -> None:
+        """
+        Abonne une fonction à un type d'événement
+
+        :param event_type: Le type d'événement
+        :type event_type: Type[E]
+        :param handler: La fonction appelée avec chaque événement
+        :type handler: Callable[[E], object]
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def emit(self, event: Any) -> None:
+        """
+        Ajoute un événement à la file
+
+        :param event: L'événement
+        :type event: Any
+        """
+        if self._count == len(self._queue):
+            self.dispatch()
+        self._queue[self._count] = event
+        self._count += 1
+
+    def dispatch(self) -> int:
+        """
+        Distribue les événements en attente à leurs abonnés, dans l'ordre
+        où ils ont été émis
+
+        :return: Le nombre d'événements distribués
+        :rtype: int
+        """
+        queue, handlers = self._queue, self._handlers
+        count = self._count
+        for i in range(count):
+            event = queue[i]
+            queue[i] = None
+            for handler in handlers.get(type(event), ()):
+                handler(event)
+        self._count = 0
+        return count
+
+    def clear(self) -> None:
+        """
+        Oublie les événements en attente
+        """
+        for i in range(self._count):
+            self._queue[i] = None
+        self._count = 0
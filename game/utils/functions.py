@@ -13,6 +13,10 @@ def interpolant(t: np.ndarray) -> np.ndarray:
     return t * t * t * (t * (t * 6 - 15) + 10)
 
 
+# Nombre de lignes calculées à la fois (limite la mémoire temporaire)
+BAND_ROWS = 64
+
+
 def generate_perlin_noise_2d(
     shape, res, tileable=(False, False), interpolant=interpolant
 ):
@@ -30,33 +34,285 @@ def generate_perlin_noise_2d(
     :return: Un tableau numpy de bruit de Perlin.
     :rtype: numpy.ndarray
     """
-    delta = (res[0] / shape[0], res[1] / shape[1])
-    d = (shape[0] // res[0], shape[1] // res[1])
-    grid = (
-        np.mgrid[0 : res[0] : delta[0], 0 : res[1] : delta[1]].transpose(
-            1, 2, 0
-        )
-        % 1
+    return generate_fractal_noise_2d(
+        shape,
+        res,
+        tileable=tileable,
+        interpolant=interpolant,
+        dtype=np.float64,
     )
-    # Gradients
-    angles = 2 * np.pi * np.random.rand(res[0] + 1, res[1] + 1)
-    gradients = np.dstack((np.cos(angles), np.sin(angles)))
+
+
+def generate_fractal_noise_2d(
+    shape,
+    res,
+    octaves=1,
+    persistence=0.5,
+    lacunarity=2,
+    tileable=(False, False),
+    interpolant=interpolant,
+    dtype=np.float32,
+    out=None,
+    rng=None,
+    band_rows=BAND_ROWS,
+):
+    """
+    Génération de bruit fractal 2D (somme d'octaves de bruit de Perlin).
+
+    La forme n'a pas besoin d'être un multiple de la résolution. Le bruit
+    est calculé par bandes de `band_rows` lignes et ajouté directement au
+    tableau de sortie : la mémoire temporaire ne dépend que de la largeur.
+
+    :param shape: La forme du tableau numpy généré (tuple de deux entiers).
+    :type shape: tuple
+    :param res: Le nombre de périodes de la première octave le long de
+                chaque axe.
+    :type res: tuple
+    :param octaves: Le nombre d'octaves.
+    :type octaves: int
+    :param persistence: Le facteur d'amplitude entre deux octaves.
+    :type persistence: float
+    :param lacunarity: Le facteur de fréquence entre deux octaves.
+    :type lacunarity: float
+    :param tileable: Si le bruit doit être tuilable le long de chaque axe.
+    :type tileable: tuple
+    :param interpolant: La fonction d'interpolation.
+    :type interpolant: function
+    :param dtype: Le type des valeurs (float32 ou float64).
+    :type dtype: numpy.dtype
+    :param out: Le tableau dans lequel écrire le bruit (créé si None).
+    :type out: numpy.ndarray
+    :param rng: Le générateur aléatoire des gradients (celui de
+                `numpy.random` si None).
+    :type rng: numpy.random.Generator
+    :param band_rows: Le nombre de lignes calculées à la fois.
+    :type band_rows: int
+    :return: Un tableau numpy de bruit fractal.
+    :rtype: numpy.ndarray
+    """
+    if out is not None:
+        shape, dtype = out.shape, out.dtype
+    field = NoiseField(
+        shape,
+        res,
+        octaves,
+        persistence,
+        lacunarity,
+        tileable,
+        interpolant,
+        dtype,
+        rng,
+    )
+    return field.sample(0, shape[0], 0, shape[1], out, band_rows)
+
+
+class NoiseField:
+    """
+    Champ de bruit fractal dont on peut calculer n'importe quelle fenêtre.
+
+    Les gradients de toutes les octaves sont tirés une fois pour toutes :
+    deux fenêtres voisines se raccordent exactement, ce qui permet de
+    générer un grand champ morceau par morceau.
+    """
+
+    def __init__(
+        self,
+        shape,
+        res,
+        octaves=1,
+        persistence=0.5,
+        lacunarity=2,
+        tileable=(False, False),
+        interpolant=interpolant,
+        dtype=np.float32,
+        rng=None,
+    ):
+        """
+        Tire les gradients et prépare les coordonnées de chaque octave.
+
+        :param shape: La forme du champ complet (tuple de deux entiers).
+        :type shape: tuple
+        :param res: Le nombre de périodes de la première octave le long de
+                    chaque axe.
+        :type res: tuple
+        :param octaves: Le nombre d'octaves.
+        :type octaves: int
+        :param persistence: Le facteur d'amplitude entre deux octaves.
+        :type persistence: float
+        :param lacunarity: Le facteur de fréquence entre deux octaves.
+        :type lacunarity: float
+        :param tileable: Si le champ doit être tuilable le long de chaque axe.
+        :type tileable: tuple
+        :param interpolant: La fonction d'interpolation.
+        :type interpolant: function
+        :param dtype: Le type des valeurs (float32 ou float64).
+        :type dtype: numpy.dtype
+        :param rng: Le générateur aléatoire des gradients (celui de
+                    `numpy.random` si None).
+        :type rng: numpy.random.Generator
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.octaves = []
+
+        frequency, amplitude = 1, 1
+        for _ in range(octaves):
+            octave_res = (
+                max(1, int(round(res[0] * frequency))),
+                max(1, int(round(res[1] * frequency))),
+            )
+            gx, gy = _gradients(octave_res, tileable, self.dtype, rng)
+
+            # Cellule et position dans la cellule de chaque ligne et colonne
+            # (calcul entier exact, quelle que soit la forme)
+            rows, fx = _cells(self.shape[0], octave_res[0], self.dtype)
+            columns, fy = _cells(self.shape[1], octave_res[1], self.dtype)
+            tx = interpolant(fx).astype(self.dtype, copy=False)
+            ty = interpolant(fy).astype(self.dtype, copy=False)
+            scale = self.dtype.type(np.sqrt(2) * amplitude)
+
+            self.octaves.append((gx, gy, rows, fx, tx, columns, fy, ty, scale))
+            frequency *= lacunarity
+            amplitude *= persistence
+
+    def sample(self, top, bottom, left, right, out=None, band_rows=BAND_ROWS):
+        """
+        Calcule une fenêtre du champ.
+
+        :param top: La première ligne de la fenêtre.
+        :type top: int
+        :param bottom: La ligne suivant la dernière ligne de la fenêtre.
+        :type bottom: int
+        :param left: La première colonne de la fenêtre.
+        :type left: int
+        :param right: La colonne suivant la dernière colonne de la fenêtre.
+        :type right: int
+        :param out: Le tableau dans lequel écrire le bruit (créé si None).
+        :type out: numpy.ndarray
+        :param band_rows: Le nombre de lignes calculées à la fois.
+        :type band_rows: int
+        :return: Le bruit de la fenêtre.
+        :rtype: numpy.ndarray
+        """
+        height, width = bottom - top, right - left
+        if out is None:
+            out = np.zeros((height, width), dtype=self.dtype)
+        else:
+            out[...] = 0
+
+        # Tampons de calcul d'une bande, réutilisés par toutes les octaves
+        band_rows = min(band_rows, height)
+        n0, n1, n2, tmp = np.empty((4, band_rows, width), dtype=self.dtype)
+
+        for gx, gy, rows, fx, tx, columns, fy, ty, scale in self.octaves:
+            columns, fy = columns[left:right], fy[left:right]
+            ty = ty[left:right]
+
+            for start in range(0, height, band_rows):
+                stop = min(start + band_rows, height)
+                size = stop - start
+                a, b, c, t = n0[:size], n1[:size], n2[:size], tmp[:size]
+                cells = rows[top + start : top + stop]
+                band_fx = fx[top + start : top + stop, None]
+                band_tx = tx[top + start : top + stop, None]
+
+                # Rampes des coins (0, 0) et (1, 0), interpolées selon x
+                _ramp(a, t, gx[cells], gy[cells], columns, band_fx, fy)
+                _ramp(
+                    b,
+                    t,
+                    gx[cells + 1],
+                    gy[cells + 1],
+                    columns,
+                    band_fx - 1,
+                    fy,
+                )
+                b -= a
+                b *= band_tx
+                a += b
+                # Rampes des coins (0, 1) et (1, 1), interpolées selon x
+                _ramp(b, t, gx[cells], gy[cells], columns + 1, band_fx, fy - 1)
+                _ramp(
+                    c,
+                    t,
+                    gx[cells + 1],
+                    gy[cells + 1],
+                    columns + 1,
+                    band_fx - 1,
+                    fy - 1,
+                )
+                c -= b
+                c *= band_tx
+                b += c
+                # Interpolation selon y
+                b -= a
+                b *= ty
+                a += b
+                a *= scale
+                out[start:stop] += a
+
+        return out
+
+
+def _gradients(res, tileable, dtype, rng):
+    """
+    Tire les gradients unitaires aux sommets de la grille.
+
+    :param res: Le nombre de cellules le long de chaque axe.
+    :type res: tuple
+    :param tileable: Si le bruit doit être tuilable le long de chaque axe.
+    :type tileable: tuple
+    :param dtype: Le type des valeurs.
+    :type dtype: numpy.dtype
+    :param rng: Le générateur aléatoire (`numpy.random` si None).
+    :type rng: numpy.random.Generator
+    :return: Les composantes x et y des gradients.
+    :rtype: tuple
+    """
+    size = (res[0] + 1, res[1] + 1)
+    random = np.random.rand(*size) if rng is None else rng.random(size)
+    angles = 2 * np.pi * random
     if tileable[0]:
-        gradients[-1, :] = gradients[0, :]
+        angles[-1, :] = angles[0, :]
     if tileable[1]:
-        gradients[:, -1] = gradients[:, 0]
-    gradients = gradients.repeat(d[0], 0).repeat(d[1], 1)
-    g00 = gradients[: -d[0], : -d[1]]
-    g10 = gradients[d[0] :, : -d[1]]
-    g01 = gradients[: -d[0], d[1] :]
-    g11 = gradients[d[0] :, d[1] :]
-    # Ramps
-    n00 = np.sum(np.dstack((grid[:, :, 0], grid[:, :, 1])) * g00, 2)
-    n10 = np.sum(np.dstack((grid[:, :, 0] - 1, grid[:, :, 1])) * g10, 2)
-    n01 = np.sum(np.dstack((grid[:, :, 0], grid[:, :, 1] - 1)) * g01, 2)
-    n11 = np.sum(np.dstack((grid[:, :, 0] - 1, grid[:, :, 1] - 1)) * g11, 2)
-    # Interpolation
-    t = interpolant(grid)
-    n0 = n00 * (1 - t[:, :, 0]) + t[:, :, 0] * n10
-    n1 = n01 * (1 - t[:, :, 0]) + t[:, :, 0] * n11
-    return np.sqrt(2) * ((1 - t[:, :, 1]) * n0 + t[:, :, 1] * n1)
+        angles[:, -1] = angles[:, 0]
+    return np.cos(angles).astype(dtype), np.sin(angles).astype(dtype)
+
+
+def _cells(length, res, dtype):
+    """
+    Renvoie la cellule et la position dans la cellule de chaque point
+    d'un axe.
+
+    :param length: Le nombre de points de l'axe.
+    :type length: int
+    :param res: Le nombre de cellules de l'axe.
+    :type res: int
+    :param dtype: Le type des positions.
+    :type dtype: numpy.dtype
+    :return: Les indices des cellules et les positions (entre 0 et 1).
+    :rtype: tuple
+    """
+    scaled = np.arange(length) * res
+    cells, remainder = np.divmod(scaled, length)
+    return cells, (remainder / length).astype(dtype)
+
+
+def _ramp(out, tmp, gx, gy, columns, fx, fy):
+    """
+    Calcule le produit scalaire entre les gradients d'un coin des cellules
+    et la position relative à ce coin, pour une bande de lignes.
+
+    :param out: Le tableau de sortie (bande).
+    :param tmp: Un tableau temporaire de même forme.
+    :param gx: Les composantes x des gradients des lignes de la bande.
+    :param gy: Les composantes y des gradients des lignes de la bande.
+    :param columns: Les indices des gradients de chaque colonne.
+    :param fx: La position relative selon x de chaque ligne.
+    :param fy: La position relative selon y de chaque colonne.
+    """
+    np.take(gx, columns, axis=1, out=out)
+    out *= fx
+    np.take(gy, columns, axis=1, out=tmp)
+    tmp *= fy
+    out += tmp
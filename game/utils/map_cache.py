@@ -0,0 +1,197 @@
+import os
+import tempfile
+import numpy as np
+
+from typing import List, Optional, Tuple
+
+
+class MapCache:
+    """
+    Cache sur disque des cartes générées et des fonds dessinés
+
+    Chaque entrée est un tableau NumPy enregistré au format `.npy`, relu
+    en projection mémoire (`np.load(mmap_mode="r")`) sans décodage. La
+    taille totale du dossier est limitée : au-delà, les entrées les moins
+    récemment utilisées (date de modification, mise à jour à chaque
+    lecture) sont supprimées.
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """
+        Constructeur de la classe
+
+        :param directory: Le dossier du cache, créé au premier
+                          enregistrement
+        :type directory: str
+        :param max_bytes: La taille maximale du cache (en octets)
+        :type max_bytes: int
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, name: str) -> str:
+        """
+        Renvoie le chemin du fichier d'une entrée
+
+        :param name: Le nom de l'entrée
+        :type name: str
+        :return: Le chemin du fichier
+        :rtype: str
+        """
+        return os.path.join(self.directory, name + self.SUFFIX)
+
+    def load(
+        self, name: str, shape: Tuple[int, ...], dtype: np.dtype
+    ) -> Optional[np.ndarray]:
+        """
+        Relit une entrée du cache
+
+        :param name: Le nom de l'entrée
+        :type name: str
+        :param shape: La forme attendue du tableau
+        :type shape: Tuple[int, ...]
+        :param dtype: Le type attendu des éléments
+        :type dtype: numpy.dtype
+        :return: Le tableau (en lecture seule), ou None s'il est absent
+                 ou invalide
+        :rtype: Optional[numpy.ndarray]
+        """
+        path = self._path(name)
+        try:
+            array = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            # Fichier tronqué ou illisible : l'entrée est régénérée
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        if array.shape != tuple(shape) or array.dtype != dtype:
+            del array
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return array
+
+    def store(self, name: str, array: np.ndarray) -> None:
+        """
+        Enregistre une entrée, puis fait de la place si le cache dépasse
+        sa taille maximale
+
+        L'écriture passe par un fichier temporaire renommé ensuite, pour
+        qu'un arrêt brutal ne laisse jamais une entrée tronquée. Le cache
+        étant facultatif, une erreur d'écriture est ignorée.
+
+        :param name: Le nom de l'entrée
+        :type name: str
+        :param array: Le tableau à enregistrer
+        :type array: numpy.ndarray
+        """
+        if array.nbytes > self.max_bytes:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=".map-", suffix=".tmp", dir=self.directory
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, np.ascontiguousarray(array))
+            os.replace(temp_path, self._path(name))
+        except OSError:
+            self._remove(temp_path)
+            return
+
+        self.cleanup()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Liste les entrées du cache
+
+        :return: La date d'utilisation, la taille et le chemin de chaque
+                 entrée
+        :rtype: List[Tuple[float, int, str]]
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(self.SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def size(self) -> int:
+        """
+        Renvoie la taille totale des entrées du cache
+
+        :return: La taille (en octets)
+        :rtype: int
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def cleanup(self) -> int:
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à revenir
+        sous la taille maximale
+
+        :return: Le nombre d'entrées supprimées
+        :rtype: int
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        Vide le cache
+        """
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """
+        Supprime un fichier du cache
+
+        :param path: Le chemin du fichier
+        :type path: str
+        :return: True si le fichier a été supprimé
+        :rtype: bool
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            # Fichier déjà supprimé, ou encore ouvert sous Windows
+            return False
+        return True
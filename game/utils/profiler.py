@@ -0,0 +1,257 @@
+import csv
+import json
+import os
+import pygame
+import numpy as np
+
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Dict, Optional, Sequence, Tuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .text import TextCache
+
+
+class FrameProfiler:
+    """
+    Profileur des images du jeu
+
+    Le temps passé dans chaque phase de la boucle principale est mesuré
+    par tours successifs (`lap`) et enregistré dans un tampon circulaire
+    de taille fixe, une ligne par image. Le profileur ne mesure rien tant
+    qu'il n'est pas activé.
+    """
+
+    PHASES = (
+        "events",
+        "wait",
+        "player.move",
+        "world",
+        "player.on_fire",
+        "player.isAttacked",
+        "player.heal",
+        "interface",
+        "spawner",
+        "item",
+        "timers",
+        "dispatch",
+        "draw.background",
+        "draw.enemies",
+        "draw.player",
+        "draw.interface",
+        "draw.item",
+        "draw.overlay",
+        "draw.present",
+    )
+    CAPACITY = 600  # 20 secondes à 30 images par seconde
+    REFRESH_FRAMES = 15  # Images entre deux mises à jour de l'affichage
+    TEXT_COLOR = (255, 255, 0)
+    BACKGROUND_COLOR = (0, 0, 0, 180)
+    FONT_SIZE = 20
+
+    def __init__(
+        self, capacity: int = CAPACITY, phases: Sequence[str] = PHASES
+    ) -> None:
+        """
+        Constructeur de la classe
+
+        :param capacity: Le nombre d'images conservées
+        :type capacity: int
+        :param phases: Les noms des phases mesurées
+        :type phases: Sequence[str]
+        """
+        self.phases = tuple(phases)
+        self._columns = {phase: i for i, phase in enumerate(self.phases)}
+
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(self.phases)), dtype=np.int64)
+        self.totals = np.zeros(capacity, dtype=np.int64)
+        self.enemies = np.zeros(capacity, dtype=np.int32)
+        self.cursor = 0
+        self.count = 0
+
+        self.enabled = False
+        # Dernier fichier écrit par `dump`, affiché sous les percentiles
+        self.last_dump: Optional[str] = None
+        # Image en cours de mesure (le profileur activé en cours d'image
+        # attend la suivante)
+        self._recording = False
+        self._frame_start = 0
+        self._last = 0
+        self._lines: Tuple[str, ...] = ()
+        self._overlay: Optional[pygame.Surface] = None
+
+    def toggle(self) -> None:
+        """
+        Active ou désactive le profileur et son affichage
+        (les mesures commencent à la prochaine image ; celles d'une
+        activation précédente sont oubliées)
+        """
+        self.enabled = not self.enabled
+        self._recording = False
+        if self.enabled:
+            self.cursor = 0
+            self.count = 0
+        self._lines = ()
+        self._overlay = None
+
+    def begin_frame(self) -> None:
+        """
+        Commence la mesure d'une nouvelle image
+        """
+        self._recording = self.enabled
+        if not self.enabled:
+            return
+        self.samples[self.cursor] = 0
+        self._frame_start = self._last = perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        """
+        Attribue le temps écoulé depuis le tour précédent à une phase
+
+        :param phase: Le nom de la phase (voir `PHASES`)
+        :type phase: str
+        """
+        if not self._recording:
+            return
+        now = perf_counter_ns()
+        self.samples[self.cursor, self._columns[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self, enemies: int = 0) -> None:
+        """
+        Termine la mesure de l'image courante
+
+        :param enemies: Le nombre d'ennemis en jeu
+        :type enemies: int
+        """
+        if not self._recording:
+            return
+        self._recording = False
+        self.totals[self.cursor] = perf_counter_ns() - self._frame_start
+        self.enemies[self.cursor] = enemies
+        self.cursor = (self.cursor + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+        if self.count % self.REFRESH_FRAMES == 0:
+            self._lines = ()
+
+    def _ordered(self) -> np.ndarray:
+        """
+        Renvoie les indices des images enregistrées, de la plus ancienne
+        à la plus récente
+
+        :return: Les indices dans le tampon circulaire
+        :rtype: numpy.ndarray
+        """
+        if self.count < self.capacity:
+            return np.arange(self.count)
+        return np.roll(np.arange(self.capacity), -self.cursor)
+
+    def percentiles(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Renvoie les percentiles 50, 95 et 99 de chaque phase
+
+        :return: Les percentiles (en millisecondes) par phase, avec
+                 la durée totale de l'image sous la clé "frame"
+        :rtype: Dict[str, Tuple[float, float, float]]
+        """
+        if self.count == 0:
+            return {}
+
+        rows = self._ordered()
+        values = np.column_stack((self.samples[rows], self.totals[rows]))
+        p50, p95, p99 = np.percentile(values, (50, 95, 99), axis=0) / 1e6
+        return {
+            phase: (p50[i], p95[i], p99[i])
+            for i, phase in enumerate(self.phases + ("frame",))
+        }
+
+    def draw(
+        self, surface: pygame.Surface, text_cache: "TextCache"
+    ) -> Optional[pygame.Rect]:
+        """
+        Dessine les percentiles de chaque phase en haut à gauche
+
+        :param surface: La surface sur laquelle dessiner
+        :type surface: pygame.Surface
+        :param text_cache: Le cache de textes du jeu
+        :type text_cache: TextCache
+        :return: La zone de la surface modifiée, ou None
+        :rtype: Optional[pygame.Rect]
+        """
+        if not self.enabled or self.count == 0:
+            return None
+
+        if not self._lines:
+            enemies = int(self.enemies[(self.cursor - 1) % self.capacity])
+            self._lines = (
+                f"{'phase':<18}{'p50':>7}{'p95':>7}{'p99':>7}  (ms)",
+                *(
+                    f"{phase:<18}{p50:7.2f}{p95:7.2f}{p99:7.2f}"
+                    for phase, (p50, p95, p99) in self.percentiles().items()
+                ),
+                f"enemies: {enemies}",
+            )
+            if self.last_dump is not None:
+                self._lines += (f"saved: {self.last_dump}",)
+            self._overlay = None
+
+        if self._overlay is None:
+            font = text_cache.font(self.FONT_SIZE, "monospace", system=True)
+            line_height = font.get_linesize()
+            width = max(font.size(line)[0] for line in self._lines)
+
+            self._overlay = pygame.Surface(
+                (width + 10, line_height * len(self._lines) + 10),
+                pygame.SRCALPHA,
+            )
+            self._overlay.fill(self.BACKGROUND_COLOR)
+            for i, line in enumerate(self._lines):
+                self._overlay.blit(
+                    font.render(line, True, self.TEXT_COLOR),
+                    (5, 5 + i * line_height),
+                )
+
+        return surface.blit(self._overlay, (0, 0))
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """
+        Enregistre les mesures du tampon (une ligne par image)
+
+        :param path: Le fichier de destination (`.csv` ou `.json`), créé
+                     dans `profiles/` si None
+        :type path: Optional[str]
+        :return: Le chemin du fichier écrit (aussi affiché par `draw`)
+        :rtype: str
+        """
+        if path is None:
+            os.makedirs("profiles", exist_ok=True)
+            path = datetime.now().strftime("profiles/frames-%Y%m%d-%H%M%S.csv")
+
+        rows = self._ordered()
+        header = ["frame", *self.phases, "enemies"]
+        data = np.column_stack(
+            (self.totals[rows], self.samples[rows], self.enemies[rows])
+        ).tolist()
+
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "unit": "ns",
+                        "columns": header,
+                        "frames": data,
+                    },
+                    file,
+                )
+        else:
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                writer.writerows(data)
+
+        self.last_dump = path
+        self._lines = ()
+        return path
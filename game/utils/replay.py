@@ -0,0 +1,296 @@
+import os
+import struct
+import zlib
+import numpy as np
+
+from datetime import datetime
+from ..enums.action import Action
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from game.game import Game
+
+Config = Tuple[int, int, int, int, int, int]
+
+
+def checksum(game: "Game") -> int:
+    """
+    Calcule une somme de contrôle de l'état de la partie
+
+    :param game: Le jeu
+    :type game: Game
+    :return: La somme de contrôle
+    :rtype: int
+    """
+    player = game.player
+    return zlib.crc32(
+        struct.pack(
+            "<ddiiIii??",
+            player.position.x,
+            player.position.y,
+            int(player.health),
+            int(player.stamina),
+            len(game.enemy_spawner),
+            game.item.rect.x,
+            game.item.rect.y,
+            game.item.item_spawn,
+            player.onFire,
+        )
+    )
+
+
+class Replay:
+    """
+    Partie enregistrée : paramètres, graines et actions du joueur
+
+    Format binaire (petit-boutiste) :
+    - en-tête `HEADER` : signature, version, paramètres de la partie,
+      graines de la carte et des générateurs, nombre de pas de simulation,
+      d'actions et d'images clés ;
+    - actions `EVENT` : pas de simulation et action (5 octets chacune) ;
+    - images clés `KEYFRAME`, tous les `KEYFRAME_TICKS` pas : pas, nombre
+      d'actions déjà jouées et somme de contrôle de l'état de la partie.
+    """
+
+    MAGIC = b"RCRR"
+    VERSION = 2
+    SEEDS = ("map", "spawner", "item", "pirate")
+    HEADER = struct.Struct("<4sH6H4I3I")
+    EVENT = np.dtype([("tick", "<u4"), ("action", "u1")])
+    KEYFRAME = np.dtype(
+        [("tick", "<u4"), ("event", "<u4"), ("checksum", "<u4")]
+    )
+    KEYFRAME_TICKS = 150
+
+    def __init__(self, config: Config, seeds: Dict[str, int]) -> None:
+        """
+        Constructeur de la classe
+
+        :param config: Les paramètres de la partie (voir `config_of`)
+        :type config: Config
+        :param seeds: Les graines de la carte et des générateurs
+        :type seeds: Dict[str, int]
+        """
+        self.config = tuple(config)
+        self.seeds = {name: seeds[name] for name in self.SEEDS}
+        # (pas de simulation, action)
+        self.events: List[Tuple[int, int]] = []
+        # (pas de simulation, nombre d'actions jouées, somme de contrôle)
+        self.keyframes: List[Tuple[int, int, int]] = []
+        self.ticks = 0
+
+    @staticmethod
+    def config_of(game: "Game") -> Config:
+        """
+        Renvoie les paramètres dont dépend le déroulement d'une partie
+
+        :param game: Le jeu
+        :type game: Game
+        :return: Les paramètres
+        :rtype: Config
+        """
+        settings = game.settings
+        return (
+            settings.TICK_RATE,
+            settings.WINDOW_WIDTH,
+            settings.WINDOW_HEIGHT,
+            settings.TILE_SIZE,
+            int(settings.ENEMY_ENGINE == "swarm"),
+            int(settings.SCROLLING_WORLD),
+        )
+
+    def check(self, game: "Game") -> None:
+        """
+        Vérifie que le replay peut être joué avec les paramètres du jeu
+
+        :param game: Le jeu
+        :type game: Game
+        """
+        if self.config_of(game) != self.config:
+            raise ValueError(
+                f"Replay enregistré avec d'autres paramètres : {self.config}"
+            )
+
+    def save(self, path: str) -> None:
+        """
+        Enregistre le replay
+
+        :param path: Le chemin du fichier
+        :type path: str
+        """
+        events = np.array(self.events, dtype=self.EVENT)
+        keyframes = np.array(self.keyframes, dtype=self.KEYFRAME)
+        with open(path, "wb") as file:
+            file.write(
+                self.HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    *self.config,
+                    *(self.seeds[name] for name in self.SEEDS),
+                    self.ticks,
+                    len(events),
+                    len(keyframes),
+                )
+            )
+            file.write(events.tobytes())
+            file.write(keyframes.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Charge un replay
+
+        :param path: Le chemin du fichier
+        :type path: str
+        :return: Le replay
+        :rtype: Replay
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < cls.HEADER.size:
+            raise ValueError(f"Fichier de replay invalide : {path}")
+        fields = cls.HEADER.unpack_from(data)
+        magic, version = fields[:2]
+        config, seeds = fields[2:8], fields[8:12]
+        ticks, count, keyframes = fields[12:]
+        if (
+            magic != cls.MAGIC
+            or version != cls.VERSION
+            or len(data)
+            != cls.HEADER.size
+            + count * cls.EVENT.itemsize
+            + keyframes * cls.KEYFRAME.itemsize
+        ):
+            raise ValueError(f"Fichier de replay invalide : {path}")
+
+        replay = cls(config, dict(zip(cls.SEEDS, seeds)))
+        replay.ticks = ticks
+        offset = cls.HEADER.size
+        replay.events = np.frombuffer(data, cls.EVENT, count, offset).tolist()
+        offset += count * cls.EVENT.itemsize
+        replay.keyframes = np.frombuffer(
+            data, cls.KEYFRAME, keyframes, offset
+        ).tolist()
+        return replay
+
+
+class Recorder:
+    """
+    Enregistre les parties jouées dans le dossier `replays/`
+    """
+
+    def __init__(self, game: "Game", directory: str = "replays") -> None:
+        """
+        Constructeur de la classe
+
+        :param game: Le jeu
+        :type game: Game
+        :param directory: Le dossier des replays
+        :type directory: str
+        """
+        self.game = game
+        self.directory = directory
+        self.replay: Optional[Replay] = None
+
+    def start(self, seeds: Dict[str, int]) -> None:
+        """
+        Commence l'enregistrement d'une partie
+
+        :param seeds: Les graines de la carte et des générateurs
+        :type seeds: Dict[str, int]
+        """
+        self.replay = Replay(Replay.config_of(self.game), seeds)
+
+    def record(self, action: Action) -> None:
+        """
+        Enregistre une action du joueur au pas de simulation courant
+
+        :param action: L'action
+        :type action: Action
+        """
+        if self.replay is not None:
+            self.replay.events.append((self.game.tick, action.value))
+
+    def update(self) -> None:
+        """
+        Enregistre une image clé si besoin (appelé avant chaque pas de
+        simulation, après les actions du joueur)
+        """
+        replay = self.replay
+        if replay is not None and self.game.tick % Replay.KEYFRAME_TICKS == 0:
+            replay.keyframes.append(
+                (self.game.tick, len(replay.events), checksum(self.game))
+            )
+
+    def stop(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Termine l'enregistrement et enregistre le replay
+
+        :param path: Le fichier de destination, créé dans `replays/` si None
+        :type path: Optional[str]
+        :return: Le chemin du fichier écrit, ou None sans enregistrement
+        :rtype: Optional[str]
+        """
+        replay, self.replay = self.replay, None
+        if replay is None:
+            return None
+
+        replay.ticks = self.game.tick
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(
+                self.directory,
+                datetime.now().strftime("game-%Y%m%d-%H%M%S.rcr"),
+            )
+        replay.save(path)
+        return path
+
+
+class ReplayPlayer:
+    """
+    Rejoue les actions d'un replay pas à pas et vérifie que la partie
+    se déroule comme lors de l'enregistrement
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        """
+        Constructeur de la classe
+
+        :param replay: Le replay à jouer
+        :type replay: Replay
+        """
+        self.replay = replay
+        self.cursor = 0
+        # Premier pas de simulation où l'état diffère de l'enregistrement
+        self.desync: Optional[int] = None
+        self._checksums = {tick: value for tick, _, value in replay.keyframes}
+
+    def apply(self, game: "Game") -> bool:
+        """
+        Applique les actions du pas de simulation courant
+        (appelé avant chaque pas de simulation)
+
+        :param game: Le jeu
+        :type game: Game
+        :return: False si le replay est terminé
+        :rtype: bool
+        """
+        tick = game.tick
+        if tick >= self.replay.ticks:
+            return False
+
+        events = self.replay.events
+        while self.cursor < len(events) and events[self.cursor][0] <= tick:
+            game.movement.perform(Action(events[self.cursor][1]))
+            self.cursor += 1
+
+        expected = self._checksums.get(tick)
+        if (
+            expected is not None
+            and self.desync is None
+            and checksum(game) != expected
+        ):
+            self.desync = tick
+        return True
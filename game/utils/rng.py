@@ -0,0 +1,48 @@
+import random
+import numpy as np
+
+from typing import Dict, Optional
+
+
+class RandomStreams:
+    """
+    Générateurs aléatoires de la simulation
+
+    Chaque partie de la simulation tire ses nombres dans son propre
+    générateur, initialisé à chaque partie avec une graine enregistrée :
+    avec les mêmes graines et les mêmes actions, une partie se déroule
+    exactement de la même façon (voir `Replay`).
+    """
+
+    NAMES = ("spawner", "item", "pirate")
+
+    def __init__(self) -> None:
+        """
+        Constructeur de la classe
+        """
+        self.spawner = random.Random()
+        self.item = random.Random()
+        self.pirate = random.Random()
+        # Générateur NumPy des pirates du moteur "swarm"
+        self.swarm = np.random.default_rng()
+        self.seeds: Dict[str, int] = {}
+
+        self.reseed()
+
+    def reseed(self, seeds: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Initialise les générateurs
+
+        :param seeds: Les graines par générateur (tirées au hasard si None)
+        :type seeds: Optional[Dict[str, int]]
+        :return: Les graines utilisées
+        :rtype: Dict[str, int]
+        """
+        if seeds is None:
+            seeds = {name: random.getrandbits(32) for name in self.NAMES}
+
+        for name in self.NAMES:
+            getattr(self, name).seed(seeds[name])
+        self.swarm = np.random.default_rng(seeds["pirate"])
+        self.seeds = {name: seeds[name] for name in self.NAMES}
+        return self.seeds
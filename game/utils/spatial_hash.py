@@ -0,0 +1,141 @@
+import pygame
+
+from typing import Dict, Hashable, List, Tuple
+
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """
+    Grille uniforme pour retrouver rapidement les objets proches d'une zone
+
+    Chaque objet est enregistré dans toutes les cellules que couvre son
+    rectangle. Une requête ne parcourt que les cellules couvertes par la
+    zone recherchée, quel que soit le nombre total d'objets.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        """
+        Constructeur de la classe
+
+        :param cell_size: La taille d'une cellule (en pixels)
+        :type cell_size: int
+        """
+        self.cell_size = cell_size
+        # Les dictionnaires (sans valeurs) gardent l'ordre d'insertion,
+        # ce qui rend l'ordre des résultats reproductible
+        self._cells: Dict[Tuple[int, int], Dict[Hashable, None]] = {}
+        self._ranges: Dict[Hashable, CellRange] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._ranges
+
+    def _cell_range(self, rect: pygame.Rect) -> CellRange:
+        """
+        Renvoie les cellules couvertes par un rectangle
+
+        :param rect: Le rectangle
+        :type rect: pygame.Rect
+        :return: Les cellules (x min, y min, x max, y max) couvertes
+        :rtype: CellRange
+        """
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def _add(self, item: Hashable, cells: CellRange) -> None:
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                self._cells.setdefault((cx, cy), {})[item] = None
+
+    def _discard(self, item: Hashable, cells: CellRange) -> None:
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(item, None)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def insert(self, item: Hashable, rect: pygame.Rect) -> None:
+        """
+        Ajoute un objet à la grille
+
+        :param item: L'objet
+        :type item: Hashable
+        :param rect: Le rectangle de l'objet
+        :type rect: pygame.Rect
+        """
+        if item in self._ranges:
+            self.move(item, rect)
+            return
+
+        cells = self._cell_range(rect)
+        self._ranges[item] = cells
+        self._add(item, cells)
+
+    def move(self, item: Hashable, rect: pygame.Rect) -> None:
+        """
+        Met à jour la position d'un objet
+        (sans effet tant qu'il reste dans les mêmes cellules)
+
+        :param item: L'objet
+        :type item: Hashable
+        :param rect: Le nouveau rectangle de l'objet
+        :type rect: pygame.Rect
+        """
+        cells = self._cell_range(rect)
+        previous = self._ranges.get(item)
+        if previous == cells:
+            return
+
+        if previous is not None:
+            self._discard(item, previous)
+        self._ranges[item] = cells
+        self._add(item, cells)
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Retire un objet de la grille (sans effet s'il n'y est pas)
+
+        :param item: L'objet
+        :type item: Hashable
+        """
+        cells = self._ranges.pop(item, None)
+        if cells is not None:
+            self._discard(item, cells)
+
+    def query(self, rect: pygame.Rect) -> List[Hashable]:
+        """
+        Renvoie les objets enregistrés dans les cellules couvertes
+        par une zone (candidats à une collision)
+
+        :param rect: La zone recherchée
+        :type rect: pygame.Rect
+        :return: Les objets proches, sans doublon
+        :rtype: List[Hashable]
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+
+        found: Dict[Hashable, None] = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def clear(self) -> None:
+        """
+        Vide la grille
+        """
+        self._cells.clear()
+        self._ranges.clear()
@@ -0,0 +1,228 @@
+import os
+import pygame
+
+from ..enums.direction import Direction
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .assets import AssetLoader
+
+SpriteSet = Union[
+    Dict[Direction, List[pygame.Surface]],
+    List[pygame.Surface],
+    pygame.Surface,
+]
+SpriteKey = Tuple[str, str, Tuple[int, int], str]
+
+
+class SpriteCache:
+    """
+    Cache partagé des jeux de sprites et des textures du jeu
+
+    Chaque jeu de sprites est identifié par son dossier (ou son chemin),
+    sa taille cible et son format de pixels. Les surfaces renvoyées sont
+    partagées entre toutes les entités : elles ne doivent pas être modifiées.
+    """
+
+    SPRITES_PATH = "assets/sprites"
+
+    def __init__(self) -> None:
+        """
+        Constructeur de la classe
+        """
+        self._sets: Dict[SpriteKey, SpriteSet] = {}
+        self.tile_size: Optional[int] = None
+        # Chargeur d'assets du jeu (images décodées en arrière-plan)
+        self.loader: Optional["AssetLoader"] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def _count_frames(self, pattern: str) -> int:
+        """
+        Compte le nombre d'images d'une animation présentes sur le disque
+
+        :param pattern: Le chemin des images, avec `{}` pour le numéro
+        :type pattern: str
+        :return: Le nombre d'images
+        :rtype: int
+        """
+        frames = 0
+        while os.path.exists(pattern.format(frames + 1)):
+            frames += 1
+        return frames
+
+    def _load_frame(
+        self, path: str, size: Tuple[int, int], alpha: bool
+    ) -> pygame.Surface:
+        """
+        Charge, redimensionne et convertit une image
+        (la conversion a lieu sur le thread appelant, qui doit posséder
+        l'affichage)
+
+        :param path: Le chemin de l'image
+        :type path: str
+        :param size: La taille cible
+        :type size: Tuple[int, int]
+        :param alpha: Si l'image conserve sa transparence
+        :type alpha: bool
+        :return: La surface convertie au format de l'écran
+        :rtype: pygame.Surface
+        """
+        if self.loader is not None:
+            image = self.loader.image(path)
+            # Seule la surface convertie est conservée (dans le cache)
+            self.loader.release(path)
+        else:
+            image = pygame.image.load(path)
+        image = pygame.transform.scale(image, size)
+        return image.convert_alpha() if alpha else image.convert()
+
+    def _get(self, key: SpriteKey) -> Optional[SpriteSet]:
+        """
+        Récupère un jeu de sprites et met à jour les compteurs
+
+        :param key: La clé du jeu de sprites
+        :type key: SpriteKey
+        :return: Le jeu de sprites, ou None s'il n'est pas en cache
+        :rtype: Optional[SpriteSet]
+        """
+        sprites = self._sets.get(key)
+        if sprites is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return sprites
+
+    def directional(
+        self,
+        folder: str,
+        size: Tuple[float, float],
+        frames: Optional[int] = None,
+        alpha: bool = True,
+    ) -> Dict[Direction, List[pygame.Surface]]:
+        """
+        Renvoie les animations d'un dossier pour chaque direction
+        (`up_1.png`, `down_1.png`, ...)
+
+        :param folder: Le dossier des sprites dans `assets/sprites`
+        :type folder: str
+        :param size: La taille cible des sprites
+        :type size: Tuple[float, float]
+        :param frames: Le nombre d'images, compté sur le disque si None
+        :type frames: Optional[int]
+        :param alpha: Si les sprites conservent leur transparence
+        :type alpha: bool
+        :return: Un dictionnaire de listes de surfaces pygame
+        :rtype: Dict[Direction, List[pygame.Surface]]
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (folder, "directional", size, "alpha" if alpha else "opaque")
+
+        sprites = self._get(key)
+        if sprites is None:
+            path = f"{self.SPRITES_PATH}/{folder}"
+            if frames is None:
+                frames = self._count_frames(f"{path}/right_{{}}.png")
+
+            sprites = {
+                direction: [
+                    self._load_frame(
+                        f"{path}/{direction.name.lower()}_{i}.png",
+                        size,
+                        alpha,
+                    )
+                    for i in range(1, frames + 1)
+                ]
+                for direction in Direction
+            }
+            self._sets[key] = sprites
+
+        return sprites
+
+    def numbered(
+        self,
+        folder: str,
+        size: Tuple[float, float],
+        frames: Optional[int] = None,
+        alpha: bool = True,
+    ) -> List[pygame.Surface]:
+        """
+        Renvoie une animation numérotée d'un dossier (`1.png`, `2.png`, ...)
+
+        :param folder: Le dossier des sprites dans `assets/sprites`
+        :type folder: str
+        :param size: La taille cible des sprites
+        :type size: Tuple[float, float]
+        :param frames: Le nombre d'images, compté sur le disque si None
+        :type frames: Optional[int]
+        :param alpha: Si les sprites conservent leur transparence
+        :type alpha: bool
+        :return: Une liste de surfaces pygame
+        :rtype: List[pygame.Surface]
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (folder, "numbered", size, "alpha" if alpha else "opaque")
+
+        sprites = self._get(key)
+        if sprites is None:
+            path = f"{self.SPRITES_PATH}/{folder}"
+            if frames is None:
+                frames = self._count_frames(f"{path}/{{}}.png")
+
+            sprites = [
+                self._load_frame(f"{path}/{i}.png", size, alpha)
+                for i in range(1, frames + 1)
+            ]
+            self._sets[key] = sprites
+
+        return sprites
+
+    def image(
+        self, path: str, size: Tuple[float, float], alpha: bool = True
+    ) -> pygame.Surface:
+        """
+        Renvoie une image seule, redimensionnée et convertie
+
+        :param path: Le chemin de l'image
+        :type path: str
+        :param size: La taille cible de l'image
+        :type size: Tuple[float, float]
+        :param alpha: Si l'image conserve sa transparence
+        :type alpha: bool
+        :return: La surface convertie au format de l'écran
+        :rtype: pygame.Surface
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (path, "image", size, "alpha" if alpha else "opaque")
+
+        image = self._get(key)
+        if image is None:
+            image = self._load_frame(path, size, alpha)
+            self._sets[key] = image
+
+        return image
+
+    def set_tile_size(self, tile_size: int) -> None:
+        """
+        Enregistre la taille des tuiles et vide le cache si elle a changé
+
+        :param tile_size: La nouvelle taille des tuiles
+        :type tile_size: int
+        """
+        if self.tile_size is not None and self.tile_size != tile_size:
+            self.invalidate()
+        self.tile_size = tile_size
+
+    def invalidate(self) -> None:
+        """
+        Vide le cache (les compteurs sont conservés)
+        """
+        self._sets.clear()
+
+
+# Cache unique, partagé par tout le processus
+sprite_cache = SpriteCache()
@@ -1,5 +1,8 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
 
 from typing import Any, Dict
 
@@ -7,48 +10,144 @@ from typing import Any, Dict
 class Stats:
     """
     Classe pour gérer les statistiques du jeu
+
+    Les statistiques sont tenues en mémoire : `update` ne touche pas au
+    disque. Un thread d'écriture enregistre les modifications par lots,
+    à intervalle régulier, sur demande (`request_flush`) et à la fermeture
+    du jeu.
     """
 
-    def __init__(self):
+    DEFAULT_STATS = {
+        "kills": 0,
+        "deaths": 0,
+        "secondsPlayed": 0,
+        "gamesPlayed": 0,
+    }
+    FLUSH_INTERVAL = 10  # Secondes entre deux écritures périodiques
+
+    def __init__(
+        self,
+        path: str = "stats.json",
+        flush_interval: float = FLUSH_INTERVAL,
+    ) -> None:
         """
         Initialisation de la classe
+
+        :param path: Le chemin du fichier de statistiques
+        :type path: str
+        :param flush_interval: Le temps entre deux écritures (en secondes)
+        :type flush_interval: float
         """
-        if not os.path.exists("stats.json"):
-            stats = {
-                "kills": 0,
-                "deaths": 0,
-                "secondsPlayed": 0,
-                "gamesPlayed": 0,
-            }
+        self.path = path
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as file:
+                self._data: Dict[str, Any] = json.load(file)
+            self._dirty = False
+        else:
+            self._data = dict(self.DEFAULT_STATS)
+            self._dirty = True
+            self.flush()
 
-            with open("stats.json", "w", encoding="utf-8") as file:
-                json.dump(stats, file)
+        self._writer = threading.Thread(
+            target=self._run, name="stats-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
     def update(self, key: str, value: Any) -> None:
         """
-        Met à jour les statistiques du jeu
+        Met à jour les statistiques du jeu (en mémoire uniquement)
 
-        :param data: Les données à mettre à jour
-        :type data: dict
+        :param key: La statistique à mettre à jour
+        :type key: str
+        :param value: La valeur à ajouter
+        :type value: Any
         """
-        data = self.load()
-        if key in data:
-            data[key] += value
-        else:
-            data[key] = value
-
-        with open("stats.json", "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
+        with self._lock:
+            if key in self._data:
+                self._data[key] += value
+            else:
+                self._data[key] = value
+            self._dirty = True
 
     def load(self) -> Dict[str, Any]:
         """
-        Charge les statistiques du jeu
+        Renvoie une copie des statistiques du jeu
 
         :return: Les statistiques du jeu
         :rtype: dict
         """
-        with open("stats.json", "r", encoding="utf-8") as file:
-            return json.load(file)
+        with self._lock:
+            return dict(self._data)
+
+    def request_flush(self) -> None:
+        """
+        Demande au thread d'écriture d'enregistrer les statistiques
+        sans attendre la fin de l'écriture
+        """
+        self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Enregistre les statistiques sur le disque si elles ont changé
+
+        L'écriture passe par un fichier temporaire renommé ensuite, pour
+        qu'un arrêt brutal ne laisse jamais un fichier tronqué.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                content = json.dumps(self._data, indent=4)
+                self._dirty = False
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, temp_path = tempfile.mkstemp(
+                prefix=".stats-", suffix=".tmp", dir=directory
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    file.write(content)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_path, self.path)
+            except OSError:
+                os.unlink(temp_path)
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def close(self) -> None:
+        """
+        Arrête le thread d'écriture et enregistre les dernières modifications
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        """
+        Boucle du thread d'écriture
+        """
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                # Nouvel essai à la prochaine écriture
+                pass
 
     def get_formatted_stats(self):
         """
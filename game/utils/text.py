@@ -0,0 +1,111 @@
+import pygame
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+Color = Tuple[int, int, int]
+FontKey = Tuple[Optional[str], int, bool]
+TextKey = Tuple[FontKey, str, Color, bool]
+
+
+class TextCache:
+    """
+    Cache des polices et des textes rendus
+
+    Les polices sont créées une seule fois et les surfaces de texte sont
+    conservées selon (police, taille, texte, couleur), les moins
+    récemment utilisées étant supprimées en premier.
+    """
+
+    MAX_SIZE = 128
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        """
+        Constructeur de la classe
+
+        :param max_size: Le nombre maximum de textes conservés
+        :type max_size: int
+        """
+        self.max_size = max_size
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._surfaces: OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def font(
+        self, size: int, name: Optional[str] = None, system: bool = False
+    ) -> pygame.font.Font:
+        """
+        Renvoie une police, créée au premier appel
+
+        :param size: La taille de la police
+        :type size: int
+        :param name: Le nom ou le chemin de la police (None pour celle
+                     par défaut)
+        :type name: Optional[str]
+        :param system: Si la police est une police système
+        :type system: bool
+        :return: La police
+        :rtype: pygame.font.Font
+        """
+        key = (name, size, system)
+        font = self._fonts.get(key)
+        if font is None:
+            if system:
+                font = pygame.font.SysFont(name, size)
+            else:
+                font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(
+        self,
+        text: str,
+        size: int,
+        color: Color,
+        name: Optional[str] = None,
+        system: bool = False,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Renvoie la surface d'un texte, rendue au premier appel
+
+        :param text: Le texte à afficher
+        :type text: str
+        :param size: La taille de la police
+        :type size: int
+        :param color: La couleur du texte
+        :type color: Tuple[int, int, int]
+        :param name: Le nom ou le chemin de la police
+        :type name: Optional[str]
+        :param system: Si la police est une police système
+        :type system: bool
+        :param antialias: Si le texte est lissé
+        :type antialias: bool
+        :return: La surface du texte (partagée, à ne pas modifier)
+        :rtype: pygame.Surface
+        """
+        key = ((name, size, system), text, tuple(color), antialias)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name, system).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Vide le cache des textes (les polices sont conservées)
+        """
+        self._surfaces.clear()
@@ -0,0 +1,187 @@
+from typing import Callable, List
+
+
+class Timer:
+    """
+    Minuteur enregistré dans une `TimerWheel`
+    """
+
+    __slots__ = ("expires", "interval", "callback", "cancelled")
+
+    def __init__(
+        self, expires: int, interval: int, callback: Callable[[], object]
+    ) -> None:
+        """
+        Constructeur de la classe
+
+        :param expires: Le pas de simulation de déclenchement
+        :type expires: int
+        :param interval: La période en pas (0 pour un seul déclenchement)
+        :type interval: int
+        :param callback: La fonction appelée
+        :type callback: Callable[[], object]
+        """
+        self.expires = expires
+        self.interval = interval
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Annule le minuteur (il est retiré de la roue à son échéance)
+        """
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    Minuteurs de la simulation, rangés dans une roue hiérarchique
+
+    Le premier niveau a une case par pas de simulation (`SLOTS` pas), le
+    suivant une case par tour du premier, etc. Un minuteur lointain
+    descend d'un niveau chaque fois que le niveau inférieur fait un tour :
+    un pas de simulation ne parcourt que la case courante, son coût dépend
+    du nombre de minuteurs déclenchés, pas du nombre de minuteurs en
+    attente. Les minuteurs d'une même case sont déclenchés dans leur ordre
+    d'enregistrement (les replays restent déterministes).
+    """
+
+    BITS = 8
+    SLOTS = 1 << BITS
+    LEVELS = 3
+
+    def __init__(self, tick_rate: int) -> None:
+        """
+        Constructeur de la classe
+
+        :param tick_rate: Le nombre de pas de simulation par seconde
+        :type tick_rate: int
+        """
+        self.tick_rate = tick_rate
+        self.now = 0
+        self._wheels: List[List[List[Timer]]] = [
+            [[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+
+    def __len__(self) -> int:
+        """
+        Nombre de minuteurs en attente (annulés compris)
+        """
+        return sum(len(slot) for wheel in self._wheels for slot in wheel)
+
+    def clear(self) -> None:
+        """
+        Retire tous les minuteurs et remet la roue à zéro (nouvelle partie)
+        """
+        self.now = 0
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+
+    def ticks(self, seconds: float) -> int:
+        """
+        Convertit une durée en pas de simulation (au moins un)
+
+        :param seconds: La durée (en secondes)
+        :type seconds: float
+        :return: Le nombre de pas
+        :rtype: int
+        """
+        return max(1, round(seconds * self.tick_rate))
+
+    def schedule(
+        self, delay: int, callback: Callable[[], object], interval: int = 0
+    ) -> Timer:
+        """
+        Enregistre un minuteur
+
+        :param delay: Le nombre de pas avant le déclenchement (au moins un)
+        :type delay: int
+        :param callback: La fonction appelée
+        :type callback: Callable[[], object]
+        :param interval: La période en pas des déclenchements suivants
+                         (0 pour un seul déclenchement)
+        :type interval: int
+        :return: Le minuteur, pour l'annuler
+        :rtype: Timer
+        """
+        timer = Timer(self.now + max(1, delay), interval, callback)
+        self._insert(timer)
+        return timer
+
+    def after(self, seconds: float, callback: Callable[[], object]) -> Timer:
+        """
+        Appelle une fonction une fois, après une durée
+
+        :param seconds: La durée (en secondes)
+        :type seconds: float
+        :param callback: La fonction appelée
+        :type callback: Callable[[], object]
+        :return: Le minuteur, pour l'annuler
+        :rtype: Timer
+        """
+        return self.schedule(self.ticks(seconds), callback)
+
+    def every(self, seconds: float, callback: Callable[[], object]) -> Timer:
+        """
+        Appelle une fonction à intervalles réguliers
+
+        :param seconds: L'intervalle (en secondes)
+        :type seconds: float
+        :param callback: La fonction appelée
+        :type callback: Callable[[], object]
+        :return: Le minuteur, pour l'annuler
+        :rtype: Timer
+        """
+        interval = self.ticks(seconds)
+        return self.schedule(interval, callback, interval)
+
+    def _insert(self, timer: Timer) -> None:
+        """
+        Range un minuteur dans la case de son échéance, au niveau le plus
+        bas qui la contient
+
+        :param timer: Le minuteur
+        :type timer: Timer
+        """
+        delta = timer.expires - self.now
+        for level in range(self.LEVELS):
+            if delta < 1 << (self.BITS * (level + 1)):
+                break
+        else:
+            # Au-delà de la roue : rangé dans la dernière case du dernier
+            # niveau, il sera replacé quand elle sera parcourue
+            delta = (1 << (self.BITS * self.LEVELS)) - 1
+        expires = self.now + delta
+        slot = (expires >> (self.BITS * level)) & (self.SLOTS - 1)
+        self._wheels[level][slot].append(timer)
+
+    def update(self) -> None:
+        """
+        Avance d'un pas de simulation et déclenche les minuteurs arrivés
+        à échéance
+        """
+        self.now += 1
+        now = self.now
+
+        # Les niveaux supérieurs descendent quand le niveau inférieur a
+        # fait un tour
+        for level in range(self.LEVELS - 1, 0, -1):
+            if now & ((1 << (self.BITS * level)) - 1) == 0:
+                slot = (now >> (self.BITS * level)) & (self.SLOTS - 1)
+                timers = self._wheels[level][slot]
+                self._wheels[level][slot] = []
+                for timer in timers:
+                    if not timer.cancelled:
+                        self._insert(timer)
+
+        slot = now & (self.SLOTS - 1)
+        timers = self._wheels[0][slot]
+        self._wheels[0][slot] = []
+        for timer in timers:
+            if timer.cancelled:
+                continue
+            timer.callback()
+            if timer.interval and not timer.cancelled:
+                timer.expires = now + timer.interval
+                self._insert(timer)
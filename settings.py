@@ -13,16 +13,57 @@ class Settings:
     WINDOW_HEIGHT = 900
     IS_FULLSCREEN = False
     FPS = 30
+    # Nombre de pas de simulation par seconde (indépendant des FPS)
+    TICK_RATE = 30
+    # Nombre maximum de pas de simulation rattrapés en une image
+    MAX_FRAME_STEPS = 5
+    # Attente maximale des écrans immobiles (menu, pause, ...) entre deux
+    # images, en ms : sans événement, le jeu ne consomme rien entre-temps
+    IDLE_TIMEOUT = 250
+    # Rafraîchit seulement les zones modifiées (False pour tout redessiner)
+    DIRTY_RECTS = True
+
+    # Enregistre chaque partie dans le dossier replays/ (voir README)
+    RECORD_REPLAYS = False
 
     # =========================================================================
     # Paramètres du clavier
     # =========================================================================
     KEYBOARD_TYPE = KeyboardType.ZQSD  # KeyboardType.WASD
 
+    # =========================================================================
+    # Paramètres du son
+    # =========================================================================
+    # Nombre de canaux réservés aux effets sonores (les sons en trop coupent
+    # les moins prioritaires ou sont ignorés)
+    SFX_CHANNELS = 6
+
     # =========================================================================
     # Paramètres des tuiles
     # =========================================================================
     TILE_SIZE = 25
+    # Taille maximale du cache sur disque des cartes déjà générées
+    # (en Mo, 0 pour le désactiver)
+    MAP_CACHE_MB = 64
+
+    # =========================================================================
+    # Paramètres du monde
+    # =========================================================================
+    # Monde défilant généré par morceaux (False : carte d'un seul écran)
+    SCROLLING_WORLD = False
+    # Taille d'un morceau du monde (en tuiles)
+    CHUNK_TILES = 16
+    # Le monde se répète tous les WORLD_CHUNKS morceaux
+    WORLD_CHUNKS = 64
+    # Mémoire maximale des morceaux gardés en cache (en Mo)
+    CHUNK_CACHE_MB = 32
+
+    # =========================================================================
+    # Paramètres des ennemis
+    # =========================================================================
+    # "sprites" : un objet par ennemi, "swarm" : moteur en tableaux NumPy
+    # (prévu pour des milliers d'ennemis simultanés)
+    ENEMY_ENGINE = "sprites"
 
     # =========================================================================
     # Paramètres des items
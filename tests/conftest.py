@@ -0,0 +1,41 @@
+import pytest
+import pygame
+
+from game import Game
+from settings import Settings
+
+
+@pytest.fixture
+def game_settings():
+    """
+    Paramètres modifiés pour la partie de test (à redéfinir dans un
+    module ou une classe de tests).
+    """
+    return {}
+
+
+@pytest.fixture
+def game_cache():
+    """
+    Dossier du cache des cartes de la partie de test (aucun par défaut,
+    pour ne rien écrire dans le dépôt).
+    """
+    return None
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch, game_settings, game_cache):
+    """
+    Crée une partie sans affichage ni son.
+    """
+    for name, value in game_settings.items():
+        monkeypatch.setattr(Settings, name, value)
+    game = Game(
+        headless=True,
+        stats_path=str(tmp_path / "stats.json"),
+        cache_path=game_cache,
+    )
+    yield game
+    game.stats.close()
+    game.assets.shutdown()
+    pygame.quit()
@@ -0,0 +1,57 @@
+import pytest
+import pygame
+
+from game.utils.assets import AssetLoader
+from game.utils.audio import SilentMixer, SilentSound
+
+
+class TestAssetLoader:
+    @pytest.fixture
+    def loader(self):
+        """
+        Crée un chargeur d'assets avec un mixer muet.
+        """
+        loader = AssetLoader(SilentMixer(), workers=2)
+        yield loader
+        loader.shutdown()
+
+    def test_preload_folder(self, loader):
+        """
+        Teste le décodage en arrière-plan des images d'un dossier.
+        """
+        loader.preload_folder("assets/sprites/hen")
+        assert loader.total == 16
+
+        image = loader.image("assets/sprites/hen/down_1.png")
+        assert isinstance(image, pygame.Surface)
+        assert loader.image("assets/sprites/hen/down_1.png") is image
+
+        for i in range(1, 5):
+            loader.image(f"assets/sprites/hen/up_{i}.png")
+        assert loader.total == 16
+
+    def test_progress(self, loader):
+        """
+        Teste l'avancement du chargement.
+        """
+        assert loader.progress() == 1.0
+
+        loader.preload(["assets/heart.png", "assets/songs/sfx/sword1.wav"])
+        assert isinstance(
+            loader.sound("assets/songs/sfx/sword1.wav"), SilentSound
+        )
+        loader.image("assets/heart.png")
+
+        assert (loader.done, loader.total) == (2, 2)
+        assert loader.progress() == 1.0
+
+    def test_errors(self, loader):
+        """
+        Teste que les erreurs de décodage sont levées à la récupération.
+        """
+        loader.preload(["assets/missing.png", "assets.txt"])
+
+        with pytest.raises(FileNotFoundError):
+            loader.image("assets/missing.png")
+        with pytest.raises(ValueError):
+            loader.image("assets.txt")
@@ -0,0 +1,79 @@
+import pytest
+
+from unittest.mock import Mock
+from game.utils.audio import SilentChannel, SilentMixer, SoundEffects
+
+
+class BusyChannel(SilentChannel):
+    """
+    Canal muet qui reste occupé jusqu'à son arrêt.
+    """
+
+    def __init__(self, id: int = 0) -> None:
+        super().__init__(id)
+        self.sound = None
+
+    def play(self, sound, *args, **kwargs) -> None:
+        self.sound = sound
+
+    def stop(self) -> None:
+        self.sound = None
+
+    def get_busy(self) -> bool:
+        return self.sound is not None
+
+
+class TestSoundEffects:
+    @pytest.fixture
+    def sfx(self):
+        """
+        Crée un gestionnaire de 2 canaux avec trois effets.
+        """
+        mixer = SilentMixer()
+        mixer.Channel = BusyChannel
+        assets = Mock()
+        assets.sound.side_effect = lambda path: mixer.Sound(path)
+
+        sfx = SoundEffects(mixer, assets, channels=2)
+        sfx.register("scream", ["scream.wav"], priority=1, cooldown=2)
+        sfx.register("sword", ["sword.wav"], priority=2)
+        sfx.register("item", ["item.wav"], volume=0.3, priority=3)
+        return sfx
+
+    def test_register_sets_volume_once(self, sfx):
+        """
+        Teste que le volume est réglé à l'ajout dans la banque.
+        """
+        assert sfx.bank["item"].sounds[0].get_volume() == 0.3
+
+    def test_cooldown_merges(self, sfx):
+        """
+        Teste qu'un même effet n'est joué qu'une fois pendant son délai.
+        """
+        assert sfx.play("scream")
+        assert not sfx.play("scream")
+        sfx.update()
+        assert not sfx.play("scream")
+        sfx.update()
+        assert sfx.play("scream")
+        assert (sfx.played, sfx.merged) == (2, 2)
+
+    def test_voice_stealing(self, sfx):
+        """
+        Teste que les sons prioritaires coupent les moins prioritaires.
+        """
+        sfx.play("scream")
+        sfx.play("sword")
+        sfx.update()
+
+        # Canaux pleins : le cri (priorité 1) est coupé pour l'item
+        assert sfx.play("item")
+        assert sfx.bank["item"].sounds[0] in [
+            channel.sound for channel in sfx.channels
+        ]
+        sfx.update()
+
+        # Plus aucune voix moins prioritaire qu'un cri
+        sfx.update()
+        assert not sfx.play("scream")
+        assert sfx.dropped == 1
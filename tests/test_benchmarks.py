@@ -0,0 +1,59 @@
+import pytest
+
+from benchmarks.suite import BenchmarkSuite, compare
+from game.enemies.pirate import Pirate
+
+
+class TestBenchmarks:
+    def test_compare_threshold(self):
+        """
+        Teste la détection des ralentissements au-delà du seuil.
+        """
+        baseline = {
+            "results": {
+                "map.draw": {"median_ms": 1.0},
+                "frame.draw": {"median_ms": 2.0},
+            }
+        }
+        results = {
+            "results": {
+                "map.draw": {"median_ms": 1.3},
+                "frame.draw": {"median_ms": 2.1},
+                "perlin.36x40": {"median_ms": 0.4},
+            }
+        }
+
+        comparisons = compare(results, baseline, threshold=0.2)
+
+        assert [c.name for c in comparisons] == ["map.draw", "frame.draw"]
+        assert [c.regressed for c in comparisons] == [True, False]
+        assert round(comparisons[0].ratio, 2) == 1.3
+
+    @pytest.fixture
+    def suite(self, tmp_path):
+        """
+        Crée une suite de mesures sur une partie temporaire.
+        """
+        suite = BenchmarkSuite(str(tmp_path / "stats.json"))
+        yield suite
+        suite.close()
+
+    def test_populate_releases_previous_enemies(self, suite):
+        """
+        Teste que les ennemis d'un cas précédent ne gardent pas de
+        minuteurs actifs, et que l'item est programmé comme en partie.
+        """
+        assert suite.game.item.spawn_timer is not None
+
+        suite._populate("sprites", 200)
+        pirates = [
+            enemy
+            for enemy in suite.game.enemy_spawner.enemies
+            if isinstance(enemy, Pirate)
+        ]
+        suite._populate("sprites", 200)
+
+        assert pirates
+        for pirate in pirates:
+            if pirate not in suite.game.enemy_spawner.enemies:
+                assert pirate.direction_timer is None
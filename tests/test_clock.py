@@ -0,0 +1,65 @@
+import pytest
+
+from game.utils.clock import GameClock
+
+
+class TestGameClock:
+    @pytest.fixture
+    def clock(self):
+        """
+        Crée une horloge à 4 pas de simulation par seconde.
+        """
+        return GameClock(4)
+
+    def test_step(self, clock):
+        """
+        Teste que le temps avance d'un pas à chaque pas de simulation.
+        """
+        for _ in range(25):
+            clock.step()
+
+        assert clock.ticks == 25
+        assert clock.now() == 6.25
+
+        clock.reset()
+        assert clock.now() == 0
+
+    def test_advance(self, clock):
+        """
+        Teste la conversion du temps réel en pas de simulation.
+        """
+        assert clock.advance(0.625, 5) == 2
+        assert clock.alpha == pytest.approx(0.5)
+        assert clock.advance(0.125, 5) == 1
+        assert clock.alpha == pytest.approx(0)
+
+    def test_advance_drops_backlog(self, clock):
+        """
+        Teste que le retard au-delà du maximum de pas est abandonné.
+        """
+        assert clock.advance(10, 5) == 5
+        assert clock.advance(0, 5) == 1
+        assert clock.advance(0, 5) == 0
+
+    def test_pause(self, clock):
+        """
+        Teste que le temps passé en pause n'est pas rattrapé.
+        """
+        clock.advance(0.125, 5)
+        clock.pause()
+        assert clock.advance(3, 5) == 0
+
+        clock.resume()
+        assert clock.advance(0.125, 5) == 0
+        assert clock.advance(0.125, 5) == 1
+
+    def test_scale(self, clock):
+        """
+        Teste que le facteur de vitesse multiplie les pas effectués.
+        """
+        clock.scale = 3
+        assert clock.advance(0.25, 5) == 3
+
+        clock.scale = 0.5
+        assert clock.advance(0.25, 5) == 0
+        assert clock.advance(0.25, 5) == 1
@@ -1,7 +1,12 @@
 import pytest
 import numpy as np
 
-from game.utils.functions import generate_perlin_noise_2d, interpolant
+from game.utils.functions import (
+    NoiseField,
+    generate_fractal_noise_2d,
+    generate_perlin_noise_2d,
+    interpolant,
+)
 
 
 class TestPerlinNoise:
@@ -107,3 +112,65 @@ class TestPerlinNoise:
         # Vérifier que l'utilisation de la mémoire reste raisonnable
         # (ajuster la valeur selon les besoins)
         assert peak < 10 * 1024 * 1024  # 10 MB
+
+
+class TestFractalNoise:
+    """Tests pour le générateur de bruit fractal"""
+
+    def test_arbitrary_shape(self):
+        """Test avec une forme qui n'est pas un multiple de la résolution"""
+        noise = generate_fractal_noise_2d((37, 53), (3, 4), octaves=3)
+
+        assert noise.shape == (37, 53)
+        assert noise.dtype == np.float32
+        assert np.all(np.isfinite(noise))
+
+    def test_first_octave_matches_perlin(self):
+        """Test que la première octave est le bruit de Perlin"""
+        np.random.seed(7)
+        perlin = generate_perlin_noise_2d((60, 80), (3, 4))
+        np.random.seed(7)
+        fractal = generate_fractal_noise_2d((60, 80), (3, 4))
+
+        assert np.allclose(perlin, fractal, atol=1e-5)
+
+    def test_bands_and_out(self):
+        """Test que le calcul par bandes et en place ne change rien"""
+        rng = np.random.default_rng(3)
+        full = generate_fractal_noise_2d(
+            (50, 70), (2, 3), octaves=4, rng=rng, band_rows=1000
+        )
+
+        out = np.full((50, 70), 9, dtype=np.float32)
+        rng = np.random.default_rng(3)
+        banded = generate_fractal_noise_2d(
+            (50, 70), (2, 3), octaves=4, rng=rng, out=out, band_rows=7
+        )
+
+        assert banded is out
+        assert np.allclose(full, banded)
+
+    def test_tileable(self):
+        """Test que le bruit tuilable se raccorde exactement sur les bords"""
+        field = NoiseField((64, 64), (4, 4), octaves=2, tileable=(True, True))
+        for gx, gy, *_ in field.octaves:
+            for gradients in (gx, gy):
+                np.testing.assert_array_equal(gradients[-1], gradients[0])
+                np.testing.assert_array_equal(
+                    gradients[:, -1], gradients[:, 0]
+                )
+
+        noise = generate_fractal_noise_2d(
+            (64, 64),
+            (4, 4),
+            octaves=2,
+            tileable=(True, True),
+            rng=np.random.default_rng(0),
+        )
+        for axis in (0, 1):
+            rows = np.moveaxis(noise, axis, 0)
+            # Le saut entre la dernière ligne et la première (la suivante
+            # en répétant le bruit) ne dépasse pas celui de deux lignes
+            # voisines à l'intérieur
+            step = np.abs(np.diff(rows, axis=0)).max()
+            assert np.abs(rows[-1] - rows[0]).max() <= step
@@ -0,0 +1,61 @@
+from game.enemies.knight import Knight
+from game.enemies.pirate import Pirate
+from game.enemies.pool import EnemyList
+from game.enums.direction import Direction
+
+
+class TestEnemyList:
+    def test_swap_remove(self):
+        """
+        Teste que le retrait échange l'élément avec le dernier.
+        """
+        enemies = EnemyList()
+        for item in "abcd":
+            enemies.add(item)
+
+        enemies.remove("b")
+
+        assert list(enemies) == ["a", "d", "c"]
+        assert "b" not in enemies
+
+        enemies.remove("c")
+        enemies.remove("a")
+        assert list(enemies) == ["d"]
+        assert enemies[0] == "d"
+
+
+class TestEnemyPool:
+    def test_recycles_enemies(self, game):
+        """
+        Teste qu'un ennemi retiré est réutilisé par la vague suivante.
+        """
+        spawner = game.enemy_spawner
+        enemy = spawner.pool.acquire(Knight, 10, 10, 2, Direction.UP)
+        spawner.enemies.add(enemy)
+        spawner.remove(enemy)
+
+        assert len(spawner) == 0
+        assert len(spawner.pool) == 1
+
+        again = spawner.pool.acquire(Knight, 50, 60, 3, Direction.LEFT)
+        assert again is enemy
+        assert again.rect.topleft == (50, 60)
+        assert again.direction == Direction.LEFT
+        assert again.image is again.sprites[Direction.LEFT][0]
+
+        pirate = spawner.pool.acquire(Pirate, 0, 0, 2, Direction.UP)
+        assert isinstance(pirate, Pirate)
+
+    def test_spawned_enemies_survive_first_tick(self, game):
+        """
+        Teste qu'aucun ennemi n'est supprimé à sa première mise à jour.
+        """
+        spawner = game.enemy_spawner
+        for _ in range(50):
+            spawner.spawn_wave()
+        count = len(spawner)
+
+        for i in range(len(spawner.enemies) - 1, -1, -1):
+            spawner.enemies[i].update()
+
+        assert len(spawner) == count
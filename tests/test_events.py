@@ -0,0 +1,93 @@
+import pytest
+
+from game.dataclasses.events import EnemyKilled, ItemPicked, PlayerDamaged
+from game.utils.events import EventBus
+
+
+class TestEventBus:
+    def test_dispatch_by_type(self):
+        """
+        Teste que chaque abonné reçoit les événements de son type, dans
+        l'ordre d'émission, seulement lors de la distribution.
+        """
+        bus = EventBus()
+        received = []
+        bus.subscribe(EnemyKilled, received.append)
+        bus.subscribe(PlayerDamaged, lambda event: received.append(event))
+
+        bus.emit(EnemyKilled(2))
+        bus.emit(ItemPicked())
+        bus.emit(PlayerDamaged(10))
+        assert received == []
+        assert len(bus) == 3
+
+        assert bus.dispatch() == 3
+        assert received == [EnemyKilled(2), PlayerDamaged(10)]
+        assert len(bus) == 0
+
+    def test_full_queue_dispatches(self):
+        """
+        Teste qu'une file pleine est distribuée avant d'accepter un
+        nouvel événement.
+        """
+        bus = EventBus(capacity=2)
+        received = []
+        bus.subscribe(EnemyKilled, received.append)
+
+        for count in range(1, 4):
+            bus.emit(EnemyKilled(count))
+
+        assert received == [EnemyKilled(1), EnemyKilled(2)]
+        bus.dispatch()
+        assert received[-1] == EnemyKilled(3)
+
+    def test_clear(self):
+        """
+        Teste que les événements oubliés ne sont pas distribués.
+        """
+        bus = EventBus()
+        bus.subscribe(ItemPicked, lambda event: pytest.fail("oublié"))
+        bus.emit(ItemPicked())
+        bus.clear()
+
+        assert bus.dispatch() == 0
+
+
+class TestGameEvents:
+    def test_kills_counted_on_dispatch(self, game):
+        """
+        Teste que les ennemis éliminés sont comptés à la distribution des
+        événements, et non pendant le pas de simulation.
+        """
+        game.start_round()
+        spawner = game.enemy_spawner
+        spawner.spawn_wave()
+        enemies = list(spawner.enemies)
+        for enemy in enemies:
+            enemy.rect.center = game.player.collide_rect.center
+            spawner.grid.move(enemy, enemy.rect)
+        game.player.onFire = True
+
+        game.player.on_fire()
+
+        assert len(spawner) == 0
+        assert game.stats.load().get("kills", 0) == 0
+        assert len(game.event_bus) == 1
+
+        game.event_bus.dispatch()
+        assert game.stats.load()["kills"] == len(enemies)
+
+    def test_sounds_merged_per_frame(self, game):
+        """
+        Teste que les sons d'une même image sont fusionnés, même si
+        l'image compte plusieurs pas de simulation.
+        """
+        for _ in range(3):
+            game.event_bus.emit(ItemPicked())
+        game.dispatch()
+
+        assert (game.sfx.played, game.sfx.merged) == (1, 2)
+
+        game.event_bus.emit(ItemPicked())
+        game.dispatch()
+        assert game.sfx.played == 2
@@ -0,0 +1,152 @@
+import os
+import pygame
+
+from pathlib import Path
+from game import Game
+from game.enums.direction import Direction
+from game.enums.game import GameState
+from game.utils.audio import SilentMixer
+
+
+class TestHeadlessGame:
+    def test_silent_mixer(self, game):
+        """
+        Teste que les sons sont muets en mode sans affichage.
+        """
+        assert isinstance(game.mixer, SilentMixer)
+        assert game.footsteps.play(-1) is None
+
+    def test_restores_sdl_drivers(self, monkeypatch, tmp_path):
+        """
+        Teste que le mode sans affichage ne modifie pas durablement les
+        pilotes SDL de l'environnement.
+        """
+        monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+        monkeypatch.setenv("SDL_AUDIODRIVER", "pulse")
+
+        game = Game(headless=True, stats_path=str(tmp_path / "stats.json"))
+        game.stats.close()
+        pygame.quit()
+
+        assert "SDL_VIDEODRIVER" not in os.environ
+        assert os.environ["SDL_AUDIODRIVER"] == "pulse"
+
+    def test_simulate_ticks(self, game):
+        """
+        Teste que la simulation avance du nombre de pas demandé.
+        """
+        game.player.position.update(400, 400)
+
+        assert game.simulate(20) == 20
+        assert game.state == GameState.PLAYING
+        assert game.player.position.y == 400 + 20 * game.player.speed
+        assert game.stats.load()["gamesPlayed"] == 1
+
+    def test_simulate_until_game_over(self, game):
+        """
+        Teste que la simulation s'arrête à la fin de la partie.
+        """
+        game.player.health = 1
+
+        ticks = game.simulate(10_000)
+
+        assert ticks < 10_000
+        assert game.state == GameState.GAME_OVER
+
+    def test_simulate_handles_input(self, game):
+        """
+        Teste que les événements clavier sont pris en compte.
+        """
+        game.simulate(1)
+        pygame.event.post(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
+        )
+        game.simulate(1)
+
+        assert game.player.direction == Direction.LEFT
+
+    def test_preloads_only_used_images(self, game):
+        """
+        Teste que les images inutilisées ne sont pas préchargées, et que
+        celles déjà converties ne sont plus gardées par le chargeur.
+        """
+        used = set(game.PRELOAD) | {
+            tile.value["image"]
+            for tile in game.map.PALETTE
+            if "image" in tile.value
+        }
+        unused = {
+            path.as_posix()
+            for path in Path("assets/images").rglob("*.*")
+            if path.as_posix() not in used
+        }
+        assert unused
+        assert not unused & set(game.assets._futures)
+
+        for path in (
+            "assets/chicken.png",
+            "assets/heart.png",
+            "assets/potion.png",
+            "assets/chalencon.png",
+            "assets/images/damaged.png",
+        ):
+            assert path not in game.assets._futures
+
+    def test_reset_reuses_assets(self, game):
+        """
+        Teste que la réinitialisation conserve les composants et leurs
+        assets, et utilise la carte préparée pendant l'écran de fin.
+        """
+        player, sprites = game.player, game.player.sprites
+        game.simulate(30)
+        game.player.health = 40
+
+        game.prepare_next_round()
+        next_tiles = game.map.next_tiles
+        next_background = game._next_background
+        game.reset()
+
+        assert game.player is player
+        assert game.player.sprites is sprites
+        assert game.player.health == player.MAX_HEALTH
+        assert game.player.position == (0, 0)
+        assert len(game.enemy_spawner) == 0
+        assert game.map.tiles is next_tiles
+        assert game.background_layer is next_background
+
+    def test_item_draw_has_no_side_effects(self, game):
+        """
+        Teste que l'affichage de l'item ne fait ni apparaître, ni ramasser,
+        ni expirer l'item : sa fréquence ne dépend pas des FPS.
+        """
+        game.start_round()
+        game.item.spawn_item()
+        game.item.rect.center = game.player.rect.center
+        state = game.rng.item.getstate()
+
+        for _ in range(100):
+            game.item.draw()
+
+        assert game.item.item_spawn
+        assert not game.item.item_effect
+        assert game.rng.item.getstate() == state
+
+    def test_simulate_picks_up_item(self, game):
+        """
+        Teste que l'item apparaît, est ramassé et expire sans affichage.
+        """
+        game.simulate(1)
+        game.player.position.update(400, 300)
+        game.item.spawn_timer.cancel()
+        game.timers.schedule(1, game.item.spawn_item)
+
+        game.simulate(1)
+        assert game.item.item_spawn
+        game.item.rect.center = game.player.rect.center
+
+        game.simulate(1)
+        assert not game.item.item_spawn
+        assert game.item.item_effect and game.player.onFire
+
+        game.simulate(game.timers.ticks(game.item.EFFECT_DURATION))
+        assert not game.item.item_effect and not game.player.onFire
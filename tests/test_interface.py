@@ -1,7 +1,7 @@
 import pytest
 import pygame
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from game.components.interface import Interface
 
 
@@ -30,13 +30,11 @@ class TestInterface:
         return game
 
     @pytest.fixture
-    @patch("pygame.image.load")
-    def interface(self, mock_load, mock_game):
+    def interface(self, mock_game):
         """
         Crée une instance de la classe Interface avec un mock de Game.
         """
-        mock_image = pygame.Surface((20, 20))
-        mock_load.return_value = mock_image
+        mock_game.assets.image.return_value = pygame.Surface((20, 20))
         return Interface(mock_game)
 
     def test_draw_health_bar(self, interface, mock_game):
@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+
+from unittest.mock import Mock
+from game.components.map import Map
+from game.enums.tiles import Tiles
+
+
+class TestMap:
+    @pytest.fixture
+    def game_map(self):
+        """
+        Crée une carte avec un mock de Game.
+        """
+        game = Mock()
+        game.settings.WINDOW_WIDTH = 1000
+        game.settings.WINDOW_HEIGHT = 900
+        game.settings.TILE_SIZE = 25
+        game.map_cache = None
+        return Map(game)
+
+    def test_classify_thresholds(self):
+        """
+        Teste que les seuils du bruit donnent les bons types de tuiles.
+        """
+        noise = np.array([[-0.5, -0.15, -0.01], [0.0, 0.3, -0.2]])
+        tiles = Map.classify(noise)
+
+        assert tiles.dtype == np.uint8
+        assert [Map.PALETTE[i] for i in tiles[0]] == [
+            Tiles.GRASS,
+            Tiles.GRASS_MEDIUM,
+            Tiles.GRASS_MEDIUM,
+        ]
+        assert [Map.PALETTE[i] for i in tiles[1]] == [
+            Tiles.GRASS_LARGE,
+            Tiles.GRASS_LARGE,
+            Tiles.GRASS,
+        ]
+
+    def test_grid_shape(self, game_map):
+        """
+        Teste que la grille couvre l'écran.
+        """
+        assert game_map.tiles.shape == (36, 40)
+        assert game_map.tiles.max() < len(Map.PALETTE)
+
+    def test_lookups(self, game_map):
+        """
+        Teste les accès à une tuile de la grille.
+        """
+        tile = game_map.tile_at(3, 5)
+
+        assert tile is Map.PALETTE[game_map.tiles[5, 3]]
+        assert game_map.is_walkable(3, 5) is tile.value["walkable"]
@@ -0,0 +1,105 @@
+import os
+import pytest
+import pygame
+import numpy as np
+
+from unittest.mock import patch
+from game.utils.map_cache import MapCache
+
+
+class TestMapCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """
+        Crée un cache vide dans un dossier temporaire.
+        """
+        return MapCache(str(tmp_path / "maps"), max_bytes=10_000)
+
+    def test_round_trip(self, cache):
+        """
+        Teste qu'une entrée est relue en projection mémoire.
+        """
+        tiles = np.arange(12, dtype=np.uint8).reshape(3, 4)
+        cache.store("tiles", tiles)
+
+        loaded = cache.load("tiles", (3, 4), np.uint8)
+
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, tiles)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_missing_or_mismatched(self, cache):
+        """
+        Teste qu'une entrée absente ou d'une autre forme est ignorée.
+        """
+        cache.store("tiles", np.zeros((3, 4), dtype=np.uint8))
+
+        assert cache.load("other", (3, 4), np.uint8) is None
+        assert cache.load("tiles", (4, 3), np.uint8) is None
+        # L'entrée invalide a été supprimée
+        assert cache.load("tiles", (3, 4), np.uint8) is None
+        assert cache.misses == 3
+
+    def test_corrupted_entry(self, cache):
+        """
+        Teste qu'un fichier tronqué est supprimé au lieu d'être relu.
+        """
+        cache.store("tiles", np.zeros((3, 4), dtype=np.uint8))
+        path = os.path.join(cache.directory, "tiles.npy")
+        with open(path, "r+b") as file:
+            file.truncate(20)
+
+        assert cache.load("tiles", (3, 4), np.uint8) is None
+        assert not os.path.exists(path)
+
+    def test_size_cap_evicts_least_recent(self, cache):
+        """
+        Teste que les entrées les moins récemment utilisées sont supprimées
+        au-delà de la taille maximale.
+        """
+        block = np.zeros(3_000, dtype=np.uint8)
+        for i, name in enumerate(("a", "b", "c")):
+            cache.store(name, block)
+            path = os.path.join(cache.directory, name + ".npy")
+            os.utime(path, (i, i))
+
+        # "a" est relue : c'est "b" la moins récemment utilisée
+        assert cache.load("a", block.shape, block.dtype) is not None
+        cache.store("d", block)
+
+        assert cache.size() <= cache.max_bytes
+        assert cache.load("b", block.shape, block.dtype) is None
+        for name in ("a", "c", "d"):
+            assert cache.load(name, block.shape, block.dtype) is not None
+
+
+class TestCachedMaps:
+    @pytest.fixture
+    def game_cache(self, tmp_path):
+        """
+        Place le cache des cartes dans un dossier temporaire.
+        """
+        return str(tmp_path / "cache")
+
+    def test_repeat_seed_skips_generation(self, game):
+        """
+        Teste qu'une graine déjà vue ne régénère ni la grille ni le fond.
+        """
+        seed = game.map.seed
+        tiles = np.array(game.map.tiles)
+        background = pygame.surfarray.array2d(game.background_layer)
+
+        game.map.next_tiles = None
+        with (
+            patch("random.randrange", return_value=seed),
+            patch.object(game.map, "_random_tiles") as generate,
+            patch.object(game.map, "draw") as draw,
+        ):
+            game.reset()
+
+        generate.assert_not_called()
+        draw.assert_not_called()
+        np.testing.assert_array_equal(game.map.tiles, tiles)
+        np.testing.assert_array_equal(
+            pygame.surfarray.array2d(game.background_layer), background
+        )
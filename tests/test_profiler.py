@@ -0,0 +1,102 @@
+import csv
+import json
+import pytest
+import pygame
+
+from game.utils.profiler import FrameProfiler
+from game.utils.text import TextCache
+
+
+class TestFrameProfiler:
+    @pytest.fixture(scope="module", autouse=True)
+    def pygame_setup_teardown(self):
+        """
+        Initialise et ferme Pygame avant et après les tests.
+        """
+        pygame.init()
+        yield
+        pygame.quit()
+
+    @pytest.fixture
+    def profiler(self):
+        """
+        Crée un profileur actif avec deux phases.
+        """
+        profiler = FrameProfiler(capacity=4, phases=("update", "draw"))
+        profiler.toggle()
+        return profiler
+
+    def test_disabled_does_nothing(self):
+        """
+        Teste qu'un profileur inactif n'enregistre rien.
+        """
+        profiler = FrameProfiler(capacity=4, phases=("update",))
+        profiler.begin_frame()
+        profiler.lap("update")
+        profiler.end_frame(3)
+
+        assert profiler.count == 0
+        assert profiler.percentiles() == {}
+        assert profiler.draw(pygame.Surface((10, 10)), TextCache()) is None
+
+    def test_toggle_mid_frame(self):
+        """
+        Teste qu'un profileur activé en cours d'image n'enregistre que
+        les images suivantes, et oublie les mesures précédentes.
+        """
+        profiler = FrameProfiler(capacity=4, phases=("events",))
+        profiler.begin_frame()
+        profiler.toggle()
+        profiler.lap("events")
+        profiler.end_frame()
+        assert profiler.count == 0
+
+        profiler.begin_frame()
+        profiler.lap("events")
+        profiler.end_frame()
+        assert profiler.count == 1
+        # Une image mesurée dure bien moins d'une seconde
+        assert profiler.totals[0] < 1e9
+
+        profiler.toggle()
+        profiler.toggle()
+        assert profiler.count == 0
+
+    def test_ring_buffer_wraps(self, profiler):
+        """
+        Teste que seules les dernières images sont conservées.
+        """
+        for enemies in range(6):
+            profiler.begin_frame()
+            profiler.lap("update")
+            profiler.lap("draw")
+            profiler.end_frame(enemies)
+
+        assert profiler.count == 4
+        assert profiler.enemies[profiler._ordered()].tolist() == [2, 3, 4, 5]
+        assert set(profiler.percentiles()) == {"update", "draw", "frame"}
+
+    def test_dump(self, profiler, tmp_path):
+        """
+        Teste l'export des mesures en CSV et en JSON.
+        """
+        for _ in range(2):
+            profiler.begin_frame()
+            profiler.lap("update")
+            profiler.end_frame(7)
+
+        with open(profiler.dump(str(tmp_path / "frames.csv"))) as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ["frame", "update", "draw", "enemies"]
+        assert len(rows) == 3
+        assert rows[1][-1] == "7"
+
+        with open(profiler.dump(str(tmp_path / "frames.json"))) as file:
+            data = json.load(file)
+        assert data["columns"] == rows[0]
+        assert len(data["frames"]) == 2
+
+        # Le dernier fichier écrit est indiqué dans l'affichage
+        assert profiler.last_dump == str(tmp_path / "frames.json")
+        profiler.draw(pygame.Surface((10, 10)), TextCache())
+        assert profiler._lines[-1] == f"saved: {profiler.last_dump}"
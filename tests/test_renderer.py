@@ -0,0 +1,63 @@
+import pytest
+import pygame
+
+
+class TestRenderer:
+    @pytest.fixture
+    def frames(self, game, monkeypatch):
+        """
+        Enregistre ce que chaque image envoie à l'écran : "full" pour un
+        rafraîchissement complet, sinon la liste des zones modifiées.
+        """
+        frames = []
+        monkeypatch.setattr(
+            pygame.display, "flip", lambda: frames.append("full")
+        )
+        monkeypatch.setattr(
+            pygame.display,
+            "update",
+            lambda rects: frames.append([pygame.Rect(rect) for rect in rects]),
+        )
+        game.simulate(1)
+        return frames
+
+    def test_player_move_updates_few_rects(self, game, frames):
+        """
+        Teste qu'une image où seul le joueur a bougé ne met à jour que
+        quelques petites zones de l'écran.
+        """
+        game.renderer.draw()
+        game.renderer.draw()
+        game.player.position.x += 10
+        game.renderer.draw()
+
+        assert frames[0] == "full"
+        still, moved = frames[1], frames[2]
+
+        # Seule la zone du joueur a changé, décalée de son déplacement
+        changed = {tuple(rect) for rect in moved} - {
+            tuple(rect) for rect in still
+        }
+        assert len(changed) == 1
+        (rect,) = changed
+        assert rect[:2] == (game.player.position.x, game.player.position.y)
+        assert pygame.Rect(rect).move(-10, 0) in still
+
+        screen = game.screen.get_width() * game.screen.get_height()
+        assert sum(rect.w * rect.h for rect in moved) < screen / 20
+
+    def test_invalidate_redraws_everything(self, game, frames):
+        """
+        Teste que `invalidate` force le rafraîchissement complet de la
+        seule image suivante.
+        """
+        game.renderer.draw()
+        game.renderer.draw()
+        game.renderer.invalidate()
+        game.renderer.draw()
+        game.renderer.draw()
+
+        assert frames[0] == "full"
+        assert isinstance(frames[1], list)
+        assert frames[2] == "full"
+        assert isinstance(frames[3], list)
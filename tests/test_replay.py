@@ -0,0 +1,113 @@
+import pytest
+import pygame
+
+from game.enums.action import Action
+from game.utils.replay import Replay
+
+
+class TestReplayFile:
+    def test_round_trip(self, tmp_path):
+        """
+        Teste qu'un replay enregistré est relu à l'identique.
+        """
+        seeds = {"map": 12, "spawner": 1, "item": 2, "pirate": 2**32 - 1}
+        replay = Replay((30, 1000, 900, 25, 0, 0), seeds)
+        replay.events = [(0, Action.LEFT.value), (42, Action.DASH.value)]
+        replay.keyframes = [(0, 1, 123), (150, 2, 456)]
+        replay.ticks = 200
+        path = str(tmp_path / "game.rcr")
+
+        replay.save(path)
+        loaded = Replay.load(path)
+
+        assert loaded.config == replay.config
+        assert loaded.seeds == seeds
+        assert loaded.events == replay.events
+        assert loaded.keyframes == replay.keyframes
+        assert loaded.ticks == 200
+
+    def test_invalid_file(self, tmp_path):
+        """
+        Teste qu'un fichier tronqué est refusé.
+        """
+        replay = Replay(
+            (30, 1000, 900, 25, 0, 0), dict.fromkeys(Replay.SEEDS, 0)
+        )
+        replay.events = [(0, Action.UP.value)]
+        path = tmp_path / "game.rcr"
+        replay.save(str(path))
+        path.write_bytes(path.read_bytes()[:-1])
+
+        with pytest.raises(ValueError):
+            Replay.load(str(path))
+
+
+class TestRecordAndReplay:
+    @pytest.fixture
+    def game_settings(self):
+        """
+        Enregistre les replays des parties.
+        """
+        return {"RECORD_REPLAYS": True}
+
+    def _press(self, key):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def test_replay_reproduces_the_game(self, game, tmp_path):
+        """
+        Teste qu'un replay rejoué sans affichage redonne la même partie.
+        """
+        game.simulate(40)
+        self._press(pygame.K_RIGHT)
+        game.simulate(60)
+        self._press(pygame.K_SPACE)
+        self._press(pygame.K_DOWN)
+        game.simulate(300)
+
+        path = game.recorder.stop(str(tmp_path / "game.rcr"))
+        ticks = game.tick
+        recorded = (
+            pygame.math.Vector2(game.player.position),
+            game.player.health,
+            len(game.enemy_spawner),
+        )
+
+        replay = Replay.load(path)
+        assert replay.ticks == ticks
+        assert replay.events == [
+            (40, Action.RIGHT.value),
+            (100, Action.DASH.value),
+            (100, Action.DOWN.value),
+        ]
+        assert (
+            len(replay.keyframes) == (ticks - 1) // Replay.KEYFRAME_TICKS + 1
+        )
+
+        assert game.play_replay(replay, realtime=False) is None
+        assert game.tick == ticks
+        assert (
+            game.player.position,
+            game.player.health,
+            len(game.enemy_spawner),
+        ) == recorded
+
+    def test_replay_detects_desync(self, game, tmp_path):
+        """
+        Teste qu'une partie différente de l'enregistrement est signalée.
+        """
+        game.simulate(Replay.KEYFRAME_TICKS + 1)
+        replay = Replay.load(game.recorder.stop(str(tmp_path / "game.rcr")))
+        replay.keyframes[-1] = (*replay.keyframes[-1][:2], 0)
+
+        assert game.play_replay(replay, realtime=False) == (
+            Replay.KEYFRAME_TICKS
+        )
+
+    def test_settings_mismatch(self, game):
+        """
+        Teste qu'un replay d'autres paramètres est refusé.
+        """
+        replay = Replay((60, 1, 1, 1, 0, 0), dict.fromkeys(Replay.SEEDS, 0))
+
+        with pytest.raises(ValueError):
+            game.play_replay(replay, realtime=False)
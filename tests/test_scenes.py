@@ -0,0 +1,106 @@
+import inspect
+import pygame
+
+from game.enums.game import GameState
+
+
+class TestSceneManager:
+    def _script(self, game, keys):
+        """
+        Appuie sur chaque touche dès que le jeu est dans l'état indiqué,
+        et renvoie la liste des scènes visitées (état, profondeur de pile).
+        """
+        manager = game.scenes
+        visited = []
+
+        for scene in manager.scenes.values():
+            frame = scene.frame
+
+            def scripted(scene=scene, frame=frame):
+                if keys and keys[0][0] == scene.state:
+                    pygame.event.post(
+                        pygame.event.Event(pygame.KEYDOWN, key=keys.pop(0)[1])
+                    )
+                frame()
+
+            scene.frame = scripted
+
+        switch = manager.switch
+
+        def recorded(state):
+            visited.append((state, len(inspect.stack())))
+            switch(state)
+
+        manager.switch = recorded
+        return visited
+
+    def test_transitions_keep_stack_depth(self, game):
+        """
+        Teste qu'une session complète passe par toutes les scènes sans
+        que la pile d'appels ne grandisse.
+        """
+        keys = [
+            (GameState.CINEMATIC, pygame.K_a),
+            (GameState.MENU, pygame.K_RETURN),
+            (GameState.PLAYING, pygame.K_p),
+            (GameState.PAUSED, pygame.K_p),
+            (GameState.PLAYING, pygame.K_ESCAPE),
+            (GameState.MENU, pygame.K_RETURN),
+            (GameState.PLAYING, pygame.K_ESCAPE),
+            (GameState.MENU, pygame.K_ESCAPE),
+        ]
+        visited = self._script(game, keys)
+
+        game.run()
+
+        assert [state for state, _ in visited] == [
+            GameState.CINEMATIC,
+            GameState.MENU,
+            GameState.PLAYING,
+            GameState.PAUSED,
+            GameState.PLAYING,
+            GameState.END,
+            GameState.MENU,
+            GameState.PLAYING,
+            GameState.END,
+            GameState.MENU,
+        ]
+        assert len({depth for _, depth in visited}) == 1
+        assert game.scenes.current is None
+        assert game.stats.load()["gamesPlayed"] == 2
+
+    def test_cinematic_releases_its_image(self, game):
+        """
+        Teste que l'image de la cinématique est libérée en la quittant.
+        """
+        total = game.assets.total
+        scene = game.scenes.scenes[GameState.CINEMATIC]
+
+        scene.enter(None)
+        scene.exit(GameState.MENU)
+
+        assert scene.image is None
+        assert game.assets.total == total - 1
+
+    def test_game_over_timer_does_not_block(self, game):
+        """
+        Teste que l'écran de fin prépare la prochaine partie et rend la
+        main à chaque image jusqu'au retour au menu.
+        """
+        game.simulate(1)
+        game.state = GameState.GAME_OVER
+        scene = game.scenes.scenes[GameState.GAME_OVER]
+        scene.enter(GameState.PLAYING)
+
+        start = pygame.time.get_ticks()
+        scene.frame()
+
+        assert pygame.time.get_ticks() - start < scene.DELAY
+        assert game.state == GameState.GAME_OVER
+        assert game._next_round_ready
+        assert game.stats.load()["deaths"] == 1
+
+        scene.shown -= scene.DELAY
+        scene.frame()
+
+        assert game.state == GameState.MENU
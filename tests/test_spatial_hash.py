@@ -0,0 +1,62 @@
+import pytest
+
+from pygame import Rect
+from game.utils.spatial_hash import SpatialHash
+
+
+class TestSpatialHash:
+    @pytest.fixture
+    def grid(self):
+        """
+        Crée une grille de cellules de 25 pixels.
+        """
+        return SpatialHash(25)
+
+    def test_query_finds_neighbours_only(self, grid):
+        """
+        Teste qu'une requête ne renvoie que les objets proches.
+        """
+        grid.insert("near", Rect(100, 100, 50, 50))
+        grid.insert("far", Rect(800, 800, 50, 50))
+
+        assert grid.query(Rect(120, 120, 10, 10)) == ["near"]
+        assert grid.query(Rect(400, 400, 10, 10)) == []
+
+    def test_large_item_in_every_cell(self, grid):
+        """
+        Teste qu'un objet couvrant plusieurs cellules est trouvé une fois.
+        """
+        grid.insert("big", Rect(0, 0, 100, 100))
+
+        assert grid.query(Rect(0, 0, 100, 100)) == ["big"]
+        assert grid.query(Rect(90, 90, 5, 5)) == ["big"]
+
+    def test_move(self, grid):
+        """
+        Teste qu'un objet déplacé n'est plus dans ses anciennes cellules.
+        """
+        grid.insert("enemy", Rect(0, 0, 50, 50))
+        grid.move("enemy", Rect(500, 500, 50, 50))
+
+        assert grid.query(Rect(10, 10, 5, 5)) == []
+        assert grid.query(Rect(510, 510, 5, 5)) == ["enemy"]
+
+    def test_remove(self, grid):
+        """
+        Teste la suppression d'un objet.
+        """
+        grid.insert("enemy", Rect(0, 0, 50, 50))
+        grid.remove("enemy")
+        grid.remove("enemy")
+
+        assert "enemy" not in grid
+        assert len(grid) == 0
+        assert grid.query(Rect(0, 0, 50, 50)) == []
+
+    def test_negative_coordinates(self, grid):
+        """
+        Teste les objets partiellement hors de l'écran.
+        """
+        grid.insert("enemy", Rect(-30, -30, 50, 50))
+
+        assert grid.query(Rect(0, 0, 10, 10)) == ["enemy"]
@@ -0,0 +1,69 @@
+import pytest
+import pygame
+
+from game.enums.direction import Direction
+from game.utils.sprites import SpriteCache
+
+
+class TestSpriteCache:
+    @pytest.fixture(scope="module", autouse=True)
+    def pygame_setup_teardown(self):
+        """
+        Initialise et ferme Pygame avant et après les tests.
+        """
+        pygame.init()
+        pygame.display.set_mode((1, 1))  # Crée une fenêtre factice
+        yield
+        pygame.quit()
+
+    @pytest.fixture
+    def cache(self):
+        """
+        Crée un cache de sprites vide.
+        """
+        return SpriteCache()
+
+    def test_directional_counts_frames(self, cache):
+        """
+        Teste que les images de chaque direction sont comptées sur le disque.
+        """
+        sprites = cache.directional("knight", (50, 50))
+
+        assert set(sprites) == set(Direction)
+        assert all(len(frames) == 3 for frames in sprites.values())
+        assert sprites[Direction.UP][0].get_size() == (50, 50)
+
+    def test_hit_returns_shared_surfaces(self, cache):
+        """
+        Teste qu'un second chargement réutilise les mêmes surfaces.
+        """
+        first = cache.directional("pirate", (50, 50))
+        second = cache.directional("pirate", (50, 50))
+
+        assert first is second
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_key_includes_size_and_format(self, cache):
+        """
+        Teste que la taille et le format de pixels font partie de la clé.
+        """
+        cache.numbered("electric", (75, 75))
+        cache.numbered("electric", (60, 60))
+        cache.numbered("electric", (75, 75), alpha=False)
+
+        assert len(cache) == 3
+        assert cache.misses == 3
+
+    def test_tile_size_change_invalidates(self, cache):
+        """
+        Teste que le changement de taille des tuiles vide le cache.
+        """
+        cache.set_tile_size(25)
+        cache.numbered("electric", (75, 75))
+
+        cache.set_tile_size(25)
+        assert len(cache) == 1
+
+        cache.set_tile_size(30)
+        assert len(cache) == 0
@@ -0,0 +1,82 @@
+import json
+import time
+import pytest
+
+from unittest.mock import patch
+from game.utils.stats import Stats
+
+
+class TestStats:
+    @pytest.fixture
+    def path(self, tmp_path):
+        """
+        Chemin d'un fichier de statistiques temporaire.
+        """
+        return tmp_path / "stats.json"
+
+    @pytest.fixture
+    def stats(self, path):
+        """
+        Crée des statistiques sans écriture périodique pendant le test.
+        """
+        stats = Stats(str(path), flush_interval=3600)
+        yield stats
+        stats.close()
+
+    def test_creates_default_file(self, stats, path):
+        """
+        Teste que le fichier est créé avec les valeurs par défaut.
+        """
+        assert json.loads(path.read_text()) == Stats.DEFAULT_STATS
+
+    def test_update_stays_in_memory(self, stats, path):
+        """
+        Teste que les mises à jour n'écrivent pas sur le disque.
+        """
+        with patch("game.utils.stats.os.replace") as replace:
+            for _ in range(50):
+                stats.update("kills", 1)
+            replace.assert_not_called()
+
+        assert stats.load()["kills"] == 50
+        assert json.loads(path.read_text())["kills"] == 0
+
+    def test_flush_writes_batch(self, stats, path):
+        """
+        Teste que flush enregistre toutes les mises à jour en une fois.
+        """
+        stats.update("kills", 3)
+        stats.update("deaths", 1)
+        stats.update("bonus", 2)
+        stats.flush()
+
+        data = json.loads(path.read_text())
+        assert data["kills"] == 3
+        assert data["deaths"] == 1
+        assert data["bonus"] == 2
+        assert list(path.parent.glob(".stats-*")) == []
+
+    def test_close_flushes(self, path):
+        """
+        Teste que la fermeture enregistre les dernières modifications.
+        """
+        stats = Stats(str(path), flush_interval=3600)
+        stats.update("gamesPlayed", 1)
+        stats.close()
+
+        assert json.loads(path.read_text())["gamesPlayed"] == 1
+        reloaded = Stats(str(path))
+        assert reloaded.load()["gamesPlayed"] == 1
+        reloaded.close()
+
+    def test_request_flush_uses_writer_thread(self, stats, path):
+        """
+        Teste que request_flush fait écrire le thread d'écriture.
+        """
+        stats.update("kills", 7)
+        stats.request_flush()
+
+        deadline = time.monotonic() + 2
+        while json.loads(path.read_text())["kills"] != 7:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
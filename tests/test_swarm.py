@@ -0,0 +1,83 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock
+from game.enemies.swarm import EnemySwarm
+from game.enums.direction import Direction
+from game.utils.rng import RandomStreams
+
+
+class TestEnemySwarm:
+    @pytest.fixture(scope="module", autouse=True)
+    def pygame_setup_teardown(self):
+        """
+        Initialise et ferme Pygame avant et après les tests.
+        """
+        pygame.init()
+        pygame.display.set_mode((1, 1))  # Crée une fenêtre factice
+        yield
+        pygame.quit()
+
+    @pytest.fixture
+    def swarm(self):
+        """
+        Crée un essaim avec un mock de Game.
+        """
+        game = Mock()
+        game.settings.WINDOW_WIDTH = 1000
+        game.settings.WINDOW_HEIGHT = 900
+        game.settings.TILE_SIZE = 25
+        game.camera = pygame.Rect(0, 0, 1000, 900)
+        game.now.return_value = 0.0
+        game.rng = RandomStreams()
+        return EnemySwarm(game, capacity=2)
+
+    def test_spawn_grows_arrays(self, swarm):
+        """
+        Teste que les tableaux s'agrandissent au besoin.
+        """
+        for i in range(5):
+            swarm.spawn(100 * i, 100, 2, Direction.DOWN, EnemySwarm.KNIGHT)
+
+        assert len(swarm) == 5
+        assert swarm.capacity >= 5
+        assert swarm.position[4].tolist() == [400, 100]
+
+    def test_update_moves_enemies(self, swarm):
+        """
+        Teste le déplacement de tous les ennemis en une fois.
+        """
+        swarm.spawn(100, 100, 2, Direction.DOWN, EnemySwarm.KNIGHT)
+        swarm.spawn(100, 100, 3, Direction.LEFT, EnemySwarm.KNIGHT)
+        swarm.update()
+
+        assert swarm.position[:2].tolist() == [[100, 102], [97, 100]]
+        assert swarm.previous[:2].tolist() == [[100, 100], [100, 100]]
+
+    def test_update_culls_off_screen(self, swarm):
+        """
+        Teste que les ennemis sortis de l'écran sont supprimés.
+        """
+        swarm.spawn(-49, 100, 2, Direction.LEFT, EnemySwarm.KNIGHT)
+        swarm.spawn(500, 100, 2, Direction.LEFT, EnemySwarm.PIRATE)
+        swarm.update()
+
+        assert len(swarm) == 1
+        assert swarm.archetype[0] == EnemySwarm.PIRATE
+
+    def test_collide_and_remove(self, swarm):
+        """
+        Teste les collisions et la suppression des ennemis touchés.
+        """
+        swarm.spawn(100, 100, 2, Direction.UP, EnemySwarm.KNIGHT)
+        swarm.spawn(600, 600, 2, Direction.UP, EnemySwarm.PIRATE)
+        swarm.spawn(120, 120, 2, Direction.UP, EnemySwarm.PIRATE)
+
+        hits = swarm.collide(pygame.Rect(110, 110, 20, 20))
+
+        assert [hit.index for hit in hits] == [0, 2]
+        assert [hit.damage for hit in hits] == [20, 10]
+
+        swarm.remove(hits)
+        assert len(swarm) == 1
+        assert swarm.position[0].tolist() == [600, 600]
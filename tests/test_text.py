@@ -0,0 +1,54 @@
+import pytest
+import pygame
+
+from game.utils.text import TextCache
+
+
+class TestTextCache:
+    @pytest.fixture(scope="module", autouse=True)
+    def pygame_setup_teardown(self):
+        """
+        Initialise et ferme Pygame avant et après les tests.
+        """
+        pygame.init()
+        yield
+        pygame.quit()
+
+    def test_font_created_once(self):
+        """
+        Teste que la même police est renvoyée à chaque appel.
+        """
+        cache = TextCache()
+        assert cache.font(36) is cache.font(36)
+        assert cache.font(36) is not cache.font(50)
+
+    def test_render_hits(self):
+        """
+        Teste qu'un texte déjà rendu est réutilisé.
+        """
+        cache = TextCache()
+        first = cache.render("Paused", 50, (255, 255, 255))
+        second = cache.render("Paused", 50, (255, 255, 255))
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        cache.render("Paused", 50, (255, 0, 0))
+        assert cache.misses == 2
+
+    def test_lru_eviction(self):
+        """
+        Teste que le texte le moins récemment utilisé est supprimé.
+        """
+        cache = TextCache(max_size=2)
+        a = cache.render("a", 20, (0, 0, 0))
+        cache.render("b", 20, (0, 0, 0))
+        cache.render("a", 20, (0, 0, 0))
+        cache.render("c", 20, (0, 0, 0))
+
+        assert len(cache) == 2
+        assert cache.render("a", 20, (0, 0, 0)) is a
+        assert cache.misses == 3
+
+        cache.render("b", 20, (0, 0, 0))
+        assert cache.misses == 4
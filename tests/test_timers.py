@@ -0,0 +1,111 @@
+import pytest
+
+from game.utils.timers import TimerWheel
+
+
+class TestTimerWheel:
+    @pytest.fixture
+    def wheel(self):
+        """
+        Crée une roue de minuteurs à 30 pas de simulation par seconde.
+        """
+        return TimerWheel(30)
+
+    def _run(self, wheel, ticks):
+        for _ in range(ticks):
+            wheel.update()
+
+    def test_one_shot(self, wheel):
+        """
+        Teste qu'un minuteur se déclenche une seule fois, à son échéance.
+        """
+        fired = []
+        wheel.schedule(3, lambda: fired.append(wheel.now))
+
+        self._run(wheel, 10)
+
+        assert fired == [3]
+        assert len(wheel) == 0
+
+    def test_repeating(self, wheel):
+        """
+        Teste qu'un minuteur périodique se déclenche à chaque période.
+        """
+        fired = []
+        wheel.every(0.5, lambda: fired.append(wheel.now))
+
+        self._run(wheel, 60)
+
+        assert fired == [15, 30, 45, 60]
+
+    def test_cancel(self, wheel):
+        """
+        Teste qu'un minuteur annulé ne se déclenche plus.
+        """
+        fired = []
+        timer = wheel.every(0.1, lambda: fired.append(wheel.now))
+        self._run(wheel, 3)
+        timer.cancel()
+        self._run(wheel, 10)
+
+        assert fired == [3]
+
+    def test_long_delays_cascade(self, wheel):
+        """
+        Teste l'échéance exacte des minuteurs rangés dans les niveaux
+        supérieurs de la roue.
+        """
+        fired = []
+        for delay in (255, 256, 257, 1000, 65_536, 70_001):
+            wheel.schedule(delay, lambda: fired.append(wheel.now))
+
+        self._run(wheel, 70_001)
+
+        assert fired == [255, 256, 257, 1000, 65_536, 70_001]
+
+    def test_same_tick_keeps_order(self, wheel):
+        """
+        Teste que les minuteurs d'un même pas suivent leur ordre
+        d'enregistrement.
+        """
+        fired = []
+        wheel.schedule(300, lambda: fired.append("a"))
+        wheel.schedule(
+            10, lambda: wheel.schedule(290, lambda: fired.append("b"))
+        )
+        wheel.schedule(300, lambda: fired.append("c"))
+
+        self._run(wheel, 300)
+
+        assert fired == ["a", "c", "b"]
+
+    def test_clear(self, wheel):
+        """
+        Teste que la remise à zéro retire tous les minuteurs.
+        """
+        wheel.schedule(5, lambda: pytest.fail("minuteur retiré"))
+        self._run(wheel, 2)
+        wheel.clear()
+
+        self._run(wheel, 10)
+        assert wheel.now == 10
+
+
+class TestScheduledItem:
+    def test_effect_ends_after_duration(self, game):
+        """
+        Teste que l'effet de l'item s'arrête après sa durée.
+        """
+        game.simulate(1)
+        game.player.health = game.player.MAX_HEALTH
+        # Pas d'autre apparition (et donc de ramassage) pendant l'effet
+        game.item.spawn_timer.cancel()
+        game.item.spawn_item()
+        game.item.rect.center = game.player.rect.center
+
+        game.simulate(1)
+        assert game.item.item_effect and game.player.onFire
+
+        game.simulate(game.timers.ticks(game.item.EFFECT_DURATION))
+        assert not game.item.item_effect
+        assert not game.player.onFire
@@ -0,0 +1,76 @@
+import pytest
+import pygame
+import numpy as np
+
+from game.enums.direction import Direction
+from game.utils.functions import NoiseField
+
+
+class TestNoiseField:
+    def test_windows_stitch(self):
+        """
+        Teste que des fenêtres voisines reconstituent le champ entier.
+        """
+        field = NoiseField((64, 96), (4, 6), octaves=3, tileable=(True, True))
+        whole = field.sample(0, 64, 0, 96)
+
+        left = field.sample(10, 40, 0, 50)
+        right = field.sample(10, 40, 50, 96)
+
+        np.testing.assert_array_equal(np.hstack((left, right)), whole[10:40])
+
+
+class TestWorld:
+    @pytest.fixture
+    def game_settings(self):
+        """
+        Active le monde défilant, réduit à 8 morceaux de côté.
+        """
+        return {"SCROLLING_WORLD": True, "WORLD_CHUNKS": 8}
+
+    def test_camera_follows_player(self, game):
+        """
+        Teste que la caméra suit le joueur au-delà des bords de l'écran.
+        """
+        game.player.position.update(400, 400)
+        game.player.change_direction(Direction.RIGHT)
+
+        game.simulate(200)
+
+        assert game.player.position.x > game.settings.WINDOW_WIDTH
+        assert game.camera.center == game.player.rect.center
+
+    def test_chunks_are_cached(self, game):
+        """
+        Teste que les morceaux ne sont générés qu'une fois.
+        """
+        world = game.world
+        surface = world.chunk((3, 4))
+        generated = world.generated
+
+        assert world.chunk((3, 4)) is surface
+        assert world.generated == generated
+
+    def test_cache_is_bounded(self, game):
+        """
+        Teste que les morceaux les moins récents sont oubliés.
+        """
+        world = game.world
+        world.max_chunks = 4
+
+        for key in range(6):
+            world.chunk((key, 0))
+
+        assert list(world.chunks) == [(2, 0), (3, 0), (4, 0), (5, 0)]
+
+    def test_world_wraps(self, game):
+        """
+        Teste que le monde se répète tous les WORLD_CHUNKS morceaux.
+        """
+        world = game.world
+        period = game.settings.WORLD_CHUNKS
+
+        first = pygame.surfarray.array3d(world.chunk((1, 2)))
+        again = pygame.surfarray.array3d(world.chunk((1 + period, 2)))
+
+        np.testing.assert_array_equal(first, again)